@@ -0,0 +1,422 @@
+"""Micro benchmarks of decoding and encoding websocket messages.
+
+Every case decodes or encodes a single message with both the binary and
+the JSON encoding, and reports the time and memory allocated per message.
+Results can be saved as a baseline and compared with later runs to catch
+regressions before upgrading.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable
+
+from .common import TradableSymbol
+from .compact import CompactChannelMessage
+from .decoding import decode_text
+from .fake_server import channel_json, contracts, response_json
+from .order_entry import OrderTemplate
+from .requests import (
+    AuthRequest,
+    OtcOrderRequest,
+    OtcRequest,
+    SubscribeRequest,
+    TickersChannel,
+)
+from .responses import otc_response_from_proto_bytes
+from .timestamp import NANOS_PER_SECOND, Timestamp
+from .types import Channel, Exchange, Side, SubscriptionStatus
+from .v2 import common_pb2, responses_pb2
+from .writer import FrameWriter
+
+DEFAULT_BASELINE = Path("benchmarks") / "baseline.json"
+# scales of the fixed point decoding cases
+PRICE_SCALES = {"brt": 3}
+
+
+@dataclass
+class BenchCase:
+    """A benchmarked operation on a single message"""
+
+    name: str
+    run: Callable[[], object]
+
+
+@dataclass
+class BenchResult:
+    """Cost of an operation per message
+
+    Attributes:
+        name: Name of the case
+        ns_per_msg: Best time per message over the repeats
+        allocs_per_msg: Memory blocks allocated and retained per message
+        bytes_per_msg: Memory bytes allocated and retained per message
+    """
+
+    name: str
+    ns_per_msg: float
+    allocs_per_msg: float
+    bytes_per_msg: float
+
+    @property
+    def msgs_per_second(self) -> float:
+        return NANOS_PER_SECOND / self.ns_per_msg if self.ns_per_msg else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<36} {self.msgs_per_second:>12,.0f} msgs/s "
+            f"{self.ns_per_msg:>12,.0f} ns/msg "
+            f"{self.allocs_per_msg:>8,.1f} allocs/msg "
+            f"{self.bytes_per_msg:>10,.0f} bytes/msg"
+        )
+
+
+@dataclass
+class Regression:
+    """A metric of a case worse than its baseline by more than the threshold"""
+
+    name: str
+    metric: str
+    baseline: float
+    value: float
+
+    @property
+    def change(self) -> float:
+        return self.value / self.baseline - 1 if self.baseline else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name} {self.metric}: {self.baseline:,.1f} -> "
+            f"{self.value:,.1f} ({self.change:+.0%})"
+        )
+
+
+def _decimal(value: str) -> common_pb2.Decimal:
+    return common_pb2.Decimal(value=value)
+
+
+def _price_amount(price: str, amount: str) -> responses_pb2.PriceAmount:
+    return responses_pb2.PriceAmount(price=_decimal(price), amount=_decimal(amount))
+
+
+def _channel_message(
+    channel: Channel, **message: object
+) -> responses_pb2.ChannelMessage:
+    return responses_pb2.ChannelMessage(
+        channel=channel.to_proto(),
+        timestamp=Timestamp.utcnow().to_proto(),
+        **message,  # type: ignore[arg-type]
+    )
+
+
+def _symbols(rows: int) -> list[str]:
+    return contracts("brt", rows)
+
+
+def tickers_message(rows: int) -> responses_pb2.ChannelMessage:
+    return _channel_message(
+        Channel.TICKERS,
+        tickers=responses_pb2.Tickers(
+            tickers=[
+                responses_pb2.Ticker(
+                    symbol=symbol,
+                    product_symbol="brt",
+                    timestamp=Timestamp.utcnow().to_proto(),
+                    mid=_decimal(f"{70 + i * 0.01:.3f}"),
+                )
+                for i, symbol in enumerate(_symbols(rows))
+            ]
+        ),
+    )
+
+
+def obt_message(rows: int) -> responses_pb2.ChannelMessage:
+    return _channel_message(
+        Channel.ORDER_BOOK_TOP,
+        order_book_tops=responses_pb2.OrderBookTops(
+            order_book_tops=[
+                responses_pb2.OrderBookTop(
+                    symbol=symbol,
+                    product_symbol="brt",
+                    exchange=Exchange.ICE.to_proto(),
+                    timestamp=Timestamp.utcnow().to_proto(),
+                    buy=_price_amount(f"{70 + i * 0.01:.3f}", "5"),
+                    sell=_price_amount(f"{70.01 + i * 0.01:.3f}", "3"),
+                )
+                for i, symbol in enumerate(_symbols(rows))
+            ]
+        ),
+    )
+
+
+def quote_message() -> responses_pb2.ChannelMessage:
+    return _channel_message(
+        Channel.RFQ,
+        otc_quote=responses_pb2.OtcQuote(
+            symbol=TradableSymbol.from_string("brtf25-brtg25").to_proto(),
+            exchange=Exchange.ICE.to_proto(),
+            timestamp=Timestamp.utcnow().to_proto(),
+            product_symbol="brt",
+            mid=_decimal("0.455"),
+            buy=responses_pb2.OtcQuoteSide(
+                price=_decimal("0.45"), amount=_decimal("5")
+            ),
+            sell=responses_pb2.OtcQuoteSide(
+                price=_decimal("0.46"), amount=_decimal("5")
+            ),
+        ),
+    )
+
+
+def order_proto() -> responses_pb2.Order:
+    return responses_pb2.Order(
+        id="order:1",
+        client_order_id="client:1",
+        account_id="account",
+        exchange=Exchange.ICE.to_proto(),
+        product_symbol="brt",
+        symbol=TradableSymbol.from_string("brtf25").to_proto(),
+        amount=_decimal("10"),
+        price=_decimal("70.125"),
+        side=Side.BUY.to_proto(),
+        created_timestamp=Timestamp.utcnow().to_proto(),
+    )
+
+
+def server_info_message() -> responses_pb2.ChannelMessage:
+    return _channel_message(
+        Channel.SERVER_INFO,
+        server_info=responses_pb2.ServerInfo(socket_uid="socket", age_millis=1000),
+    )
+
+
+def subscription_response() -> responses_pb2.OtcResponse:
+    return responses_pb2.OtcResponse(
+        id="wscli:1",
+        timestamp=Timestamp.utcnow().to_proto(),
+        subscription=responses_pb2.Subscription(
+            channel=Channel.TICKERS.to_proto(),
+            status=SubscriptionStatus.SUBSCRIBED.to_proto(),
+        ),
+    )
+
+
+def order_response() -> responses_pb2.OtcResponse:
+    return responses_pb2.OtcResponse(
+        id="wscli:2", timestamp=Timestamp.utcnow().to_proto(), order=order_proto()
+    )
+
+
+def _decode_cases(
+    name: str, message: responses_pb2.ChannelMessage | responses_pb2.OtcResponse
+) -> list[BenchCase]:
+    compact = []
+    if isinstance(message, responses_pb2.ChannelMessage):
+        binary = responses_pb2.OtcResponseMessage(
+            channel_message=message
+        ).SerializeToString()
+        text = json.dumps(channel_json(message))
+        compact.extend(
+            [
+                BenchCase(
+                    f"decode.binary_compact.{name}",
+                    lambda: CompactChannelMessage.from_proto(
+                        responses_pb2.OtcResponseMessage.FromString(
+                            binary
+                        ).channel_message
+                    ),
+                ),
+                BenchCase(
+                    f"decode.binary_fixed.{name}",
+                    lambda: CompactChannelMessage.from_proto(
+                        responses_pb2.OtcResponseMessage.FromString(
+                            binary
+                        ).channel_message,
+                        PRICE_SCALES,
+                    ),
+                ),
+            ]
+        )
+    else:
+        binary = responses_pb2.OtcResponseMessage(
+            otc_response=message
+        ).SerializeToString()
+        text = json.dumps(response_json(message))
+    return [
+        BenchCase(
+            f"decode.binary.{name}", lambda: otc_response_from_proto_bytes(binary)
+        ),
+        BenchCase(
+            f"decode.binary_trusted.{name}",
+            lambda: otc_response_from_proto_bytes(binary, trusted=True),
+        ),
+        BenchCase(f"decode.json.{name}", lambda: decode_text(text)),
+        BenchCase(
+            f"decode.json_trusted.{name}", lambda: decode_text(text, trusted=True)
+        ),
+        *compact,
+    ]
+
+
+def _encode_cases(name: str, request: OtcRequest) -> list[BenchCase]:
+    binary = FrameWriter(binary=True)
+    text = FrameWriter(binary=False)
+    return [
+        BenchCase(f"encode.binary.{name}", lambda: binary.serialize(request)),
+        BenchCase(f"encode.json.{name}", lambda: text.serialize(request)),
+    ]
+
+
+def _request(
+    request: AuthRequest | OtcOrderRequest | SubscribeRequest,
+) -> OtcRequest:
+    return OtcRequest(id="wscli:1", timestamp=Timestamp.utcnow(), request=request)
+
+
+def _order_request() -> OtcOrderRequest:
+    return OtcOrderRequest(
+        account_id="account",
+        symbol=TradableSymbol.from_string("brtf25"),
+        quantity=Decimal(10),
+        side=Side.BUY,
+        price=Decimal("70.125"),
+        client_order_id="client:1",
+    )
+
+
+def _order_entry_cases() -> list[BenchCase]:
+    """Orders built from the request models, as `call` does, and from
+    templates"""
+    writer = FrameWriter(binary=True)
+    binary = OrderTemplate("account", TradableSymbol.from_string("brtf25"), Side.BUY)
+    text = OrderTemplate(
+        "account", TradableSymbol.from_string("brtf25"), Side.BUY, binary=False
+    )
+    price = Decimal("70.125")
+    quantity = Decimal(10)
+    return [
+        BenchCase(
+            "encode.binary.order_new",
+            lambda: writer.serialize(_request(_order_request())),
+        ),
+        BenchCase(
+            "encode.binary_template.order",
+            lambda: binary.encode("wscli:1", price, quantity, "client:1"),
+        ),
+        BenchCase(
+            "encode.json_template.order",
+            lambda: text.encode("wscli:1", price, quantity, "client:1"),
+        ),
+    ]
+
+
+def cases() -> list[BenchCase]:
+    """All benchmark cases"""
+    order = _channel_message(Channel.ORDERS, order=order_proto())
+    return [
+        *_decode_cases("tickers_1", tickers_message(1)),
+        *_decode_cases("tickers_10", tickers_message(10)),
+        *_decode_cases("tickers_500", tickers_message(500)),
+        *_decode_cases("obt_10", obt_message(10)),
+        *_decode_cases("obt_100", obt_message(100)),
+        *_decode_cases("rfq", quote_message()),
+        *_decode_cases("order", order),
+        *_decode_cases("server_info", server_info_message()),
+        *_decode_cases("subscription_response", subscription_response()),
+        *_decode_cases("order_response", order_response()),
+        *_encode_cases("auth", _request(AuthRequest(token="token"))),
+        *_encode_cases(
+            "subscribe_tickers",
+            _request(
+                SubscribeRequest(data=TickersChannel(products=["brt", "wti", "dbi"]))
+            ),
+        ),
+        *_encode_cases("order", _request(_order_request())),
+        *_order_entry_cases(),
+    ]
+
+
+def allocations(run: Callable[[], object], number: int = 100) -> tuple[float, float]:
+    """Memory blocks and bytes allocated per call and retained by the
+    results, measured with tracemalloc"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        results = [run() for _ in range(number)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del results
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    return blocks / number, size / number
+
+
+def run_case(case: BenchCase, number: int = 0, repeat: int = 5) -> BenchResult:
+    """Benchmark a case, the number of calls per repeat is calibrated to
+    take at least 0.2 seconds when `number` is 0"""
+    timer = timeit.Timer(case.run)
+    if not number:
+        number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    blocks, size = allocations(case.run, min(number, 100))
+    return BenchResult(
+        name=case.name,
+        ns_per_msg=NANOS_PER_SECOND * best / number,
+        allocs_per_msg=blocks,
+        bytes_per_msg=size,
+    )
+
+
+def load_baseline(path: str | Path = DEFAULT_BASELINE) -> dict[str, BenchResult]:
+    with open(path) as f:
+        return {result["name"]: BenchResult(**result) for result in json.load(f)}
+
+
+def save_baseline(
+    results: list[BenchResult], path: str | Path = DEFAULT_BASELINE
+) -> None:
+    """Save results as a baseline, keeping the baseline of other cases"""
+    path = Path(path)
+    baseline = load_baseline(path) if path.exists() else {}
+    baseline.update((result.name, result) for result in results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            [
+                {
+                    key: round(value, 1) if isinstance(value, float) else value
+                    for key, value in asdict(result).items()
+                }
+                for _, result in sorted(baseline.items())
+            ],
+            f,
+            indent=2,
+        )
+        f.write("\n")
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict[str, BenchResult],
+    threshold: float = 0.25,
+) -> list[Regression]:
+    """Time and allocations worse than the baseline by more than
+    `threshold`, as a fraction of the baseline"""
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        for metric in ("ns_per_msg", "allocs_per_msg"):
+            value = getattr(result, metric)
+            expected = getattr(base, metric)
+            if value > expected * (1 + threshold) and value - expected >= 1:
+                regressions.append(Regression(result.name, metric, expected, value))
+    return regressions
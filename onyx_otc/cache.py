@@ -0,0 +1,155 @@
+"""Latest value cache for the TICKERS and ORDER_BOOK_TOP channels"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .responses import OrderBookTop, OtcChannelMessage, Ticker
+from .v2 import responses_pb2
+
+
+def ticker_proto_key(proto: responses_pb2.Ticker) -> Any:
+    return proto.mid.value
+
+
+def obt_proto_key(proto: responses_pb2.OrderBookTop) -> Any:
+    return (
+        proto.buy.price.value,
+        proto.buy.amount.value,
+        proto.sell.price.value,
+        proto.sell.amount.value,
+    )
+
+
+def detach(proto: Any) -> Any:
+    """Copy of a protobuf sub-message which does not keep its frame alive"""
+    copy = type(proto)()
+    copy.CopyFrom(proto)
+    return copy
+
+
+def ticker_key(ticker: Ticker) -> Any:
+    return ticker.mid
+
+
+def obt_key(obt: OrderBookTop) -> Any:
+    return (obt.buy.price, obt.buy.amount, obt.sell.price, obt.sell.amount)
+
+
+@dataclass
+class MarketDataCache:
+    """Latest tickers and order book tops keyed by symbol.
+
+    Only values that changed are stored: a ticker changes when its mid
+    changes and an order book top when any of its prices or amounts change,
+    so the timestamp of a cached value is the time of its last change.
+    Values from the binary protocol are kept as copies of their protobuf
+    messages, detached from the frame they were received in, and only
+    converted into models when looked up.
+    """
+
+    _tickers: dict[str, Ticker | responses_pb2.Ticker] = field(default_factory=dict)
+    _obts: dict[str, OrderBookTop | responses_pb2.OrderBookTop] = field(
+        default_factory=dict
+    )
+    _ticker_keys: dict[str, Any] = field(default_factory=dict)
+    _obt_keys: dict[str, Any] = field(default_factory=dict)
+    _products: dict[str, set[str]] = field(default_factory=dict)
+
+    def get_ticker(self, symbol: str) -> Ticker | None:
+        """Latest ticker for a symbol"""
+        value = self._tickers.get(symbol)
+        if isinstance(value, responses_pb2.Ticker):
+            value = self._tickers[symbol] = Ticker.from_proto(value, trusted=True)
+        return value
+
+    def get_obt(self, symbol: str) -> OrderBookTop | None:
+        """Latest order book top for a symbol"""
+        value = self._obts.get(symbol)
+        if isinstance(value, responses_pb2.OrderBookTop):
+            value = self._obts[symbol] = OrderBookTop.from_proto(value, trusted=True)
+        return value
+
+    def symbols(self, product_symbol: str) -> list[str]:
+        """Cached symbols belonging to a product symbol"""
+        return sorted(self._products.get(product_symbol, ()))
+
+    def clear(self) -> None:
+        """Remove all values, they are stale once the connection is lost"""
+        self._tickers.clear()
+        self._obts.clear()
+        self._ticker_keys.clear()
+        self._obt_keys.clear()
+        self._products.clear()
+
+    def update_proto(
+        self, proto: responses_pb2.ChannelMessage, prune: bool = False
+    ) -> bool:
+        """Update the cache from a binary channel message.
+
+        Returns False if the message carried market data and none of it
+        changed. When `prune` is True unchanged rows are removed from the
+        message in place.
+        """
+        match proto.WhichOneof("message"):
+            case "tickers":
+                return self._update_rows(
+                    proto.tickers.tickers,
+                    self._tickers,
+                    self._ticker_keys,
+                    ticker_proto_key,
+                    prune,
+                    detach,
+                )
+            case "order_book_tops":
+                return self._update_rows(
+                    proto.order_book_tops.order_book_tops,
+                    self._obts,
+                    self._obt_keys,
+                    obt_proto_key,
+                    prune,
+                    detach,
+                )
+            case _:
+                return True
+
+    def update(self, message: OtcChannelMessage, prune: bool = False) -> bool:
+        """Update the cache from a channel message model.
+
+        Same as `update_proto` for messages decoded from the JSON protocol.
+        """
+        if tickers := message.tickers():
+            return self._update_rows(
+                tickers.tickers, self._tickers, self._ticker_keys, ticker_key, prune
+            )
+        elif obts := message.order_book_tops():
+            return self._update_rows(
+                obts.order_book_tops, self._obts, self._obt_keys, obt_key, prune
+            )
+        return True
+
+    def _update_rows(
+        self,
+        rows: Any,
+        values: dict[str, Any],
+        keys: dict[str, Any],
+        get_key: Callable[[Any], Any],
+        prune: bool,
+        copy: Callable[[Any], Any] | None = None,
+    ) -> bool:
+        unchanged: list[int] = []
+        for i, row in enumerate(rows):
+            symbol = row.symbol
+            key = get_key(row)
+            if keys.get(symbol) == key:
+                unchanged.append(i)
+                continue
+            keys[symbol] = key
+            values[symbol] = row if copy is None else copy(row)
+            self._products.setdefault(row.product_symbol, set()).add(symbol)
+        changed = len(unchanged) < len(rows)
+        if prune:
+            for i in reversed(unchanged):
+                del rows[i]
+        return changed
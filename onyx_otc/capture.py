@@ -0,0 +1,356 @@
+"""Append-only capture files of raw websocket frames.
+
+A capture file starts with a header, followed by records made of a fixed
+size record header and a payload:
+
+    header:  magic (8 bytes), version (uint16), 2 pad bytes, created (int64)
+    record:  kind (uint8), length (uint32), receive time (int64), payload
+
+Times are nanoseconds since the epoch and all integers are little endian.
+Every `index_interval` frames an index record is appended, with the offset
+and time range of the frames written since the previous index record and
+the offset of the previous index record. Each index record is followed by
+a footer record holding the offset of the index record and an end marker,
+so that readers find the chain of index records from the end of the file.
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+import mmap
+import os
+import struct
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterator, Self
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"ONYXCAP\x00"
+END_MAGIC = b"ONYXEND\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHxxq")
+RECORD = struct.Struct("<BIq")
+INDEX = struct.Struct("<QqqIQ")
+FOOTER = struct.Struct("<Q8s")
+
+
+class RecordKind(enum.IntEnum):
+    BINARY = 1
+    TEXT = 2
+    INDEX = 3
+    FOOTER = 4
+
+
+_KINDS = {kind.value: kind for kind in RecordKind}
+
+
+class CaptureError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class IndexEntry:
+    """A block of consecutive frames
+
+    Attributes:
+        offset: File offset of the first frame of the block
+        first_ns: Receive time of the first frame
+        last_ns: Receive time of the last frame
+        frames: Number of frames in the block
+    """
+
+    offset: int
+    first_ns: int
+    last_ns: int
+    frames: int
+
+
+@dataclass(slots=True)
+class CaptureFrame:
+    """A captured frame, the payload is a view into the capture file"""
+
+    kind: RecordKind
+    recv_ns: int
+    payload: memoryview
+
+    @property
+    def is_binary(self) -> bool:
+        return self.kind is RecordKind.BINARY
+
+    def data(self) -> bytes | str:
+        """Copy of the frame as received"""
+        if self.kind is RecordKind.TEXT:
+            return str(self.payload, "utf-8")
+        return bytes(self.payload)
+
+
+def check_header(data: bytes | mmap.mmap, path: str | Path) -> int:
+    """Validate the header of a capture file, returning its creation time"""
+    if len(data) < HEADER.size:
+        raise CaptureError(f"{path} is not a capture file")
+    magic, version, created_ns = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise CaptureError(f"{path} is not a capture file")
+    if version != VERSION:
+        raise CaptureError(f"Unsupported capture version {version}")
+    return created_ns
+
+
+def iter_records(
+    data: mmap.mmap, offset: int
+) -> Iterator[tuple[RecordKind, int, int, int]]:
+    """Iterate over (kind, receive time, payload start, payload end) of the
+    complete records from `offset`"""
+    size = len(data)
+    unpack = RECORD.unpack_from
+    kinds = _KINDS
+    while offset + RECORD.size <= size:
+        kind, length, recv_ns = unpack(data, offset)
+        start = offset + RECORD.size
+        end = start + length
+        if end > size or kind not in kinds:
+            break
+        yield kinds[kind], recv_ns, start, end
+        offset = end
+
+
+def is_torn(data: mmap.mmap, offset: int) -> bool:
+    """Whether `offset` is the end of the records, or the start of a partial
+    last record as left by a writer which did not close the file"""
+    size = len(data)
+    if offset >= size:
+        return True
+    if data[offset] not in _KINDS:
+        return False
+    if offset + RECORD.size > size:
+        return True
+    _, length, _ = RECORD.unpack_from(data, offset)
+    return offset + RECORD.size + length > size
+
+
+def find_footer(data: mmap.mmap) -> tuple[int, int] | None:
+    """Offset of the last index record and end of the last footer, if any"""
+    end = len(data)
+    while (pos := data.rfind(END_MAGIC, HEADER.size, end)) >= 0:
+        start = pos + len(END_MAGIC) - FOOTER.size
+        record = start - RECORD.size
+        if record >= HEADER.size:
+            kind, length, _ = RECORD.unpack_from(data, record)
+            if kind == RecordKind.FOOTER and length == FOOTER.size:
+                index_offset, _ = FOOTER.unpack_from(data, start)
+                if (
+                    HEADER.size <= index_offset < record
+                    and data[index_offset] == RecordKind.INDEX
+                ):
+                    return index_offset, start + FOOTER.size
+        end = pos + len(END_MAGIC) - 1
+    return None
+
+
+def map_file(path: str | Path) -> mmap.mmap:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise CaptureError(f"{path} is empty")
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+@dataclass
+class CaptureWriter:
+    """Append frames to a capture file
+
+    When appending to an existing file its header is validated and a
+    truncated last record, left by a writer which did not close the file,
+    is removed. A corrupt record elsewhere raises a `CaptureError` and the
+    file is left as it is. The file is flushed with every index record.
+
+    Attributes:
+        path: Capture file, created if it does not exist
+        index_interval: Number of frames between index records
+        buffer_size: Size of the file write buffer
+    """
+
+    path: str | Path
+    index_interval: int = 1000
+    buffer_size: int = 1 << 20
+    frames: int = field(default=0, init=False)
+    _file: BinaryIO = field(init=False, repr=False)
+    _block: IndexEntry | None = field(default=None, init=False, repr=False)
+    _last_index: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        path = Path(self.path)
+        if path.exists() and path.stat().st_size:
+            self._recover(path)
+            self._file = open(path, "ab", buffering=self.buffer_size)
+        else:
+            self._file = open(path, "ab", buffering=self.buffer_size)
+            self._file.write(HEADER.pack(MAGIC, VERSION, time.time_ns()))
+            self._file.flush()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def write(self, data: bytes | str, recv_ns: int = 0) -> None:
+        """Append a frame, received now unless `recv_ns` is given"""
+        recv_ns = recv_ns or time.time_ns()
+        if isinstance(data, str):
+            kind = RecordKind.TEXT
+            data = data.encode()
+        else:
+            kind = RecordKind.BINARY
+        block = self._block
+        if block is None:
+            block = self._block = IndexEntry(self._file.tell(), recv_ns, recv_ns, 0)
+        self._file.write(RECORD.pack(kind, len(data), recv_ns))
+        self._file.write(data)
+        block.last_ns = recv_ns
+        block.frames += 1
+        self.frames += 1
+        if block.frames >= self.index_interval:
+            self._write_index()
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._write_index()
+            self._file.close()
+
+    def _write_index(self) -> None:
+        if block := self._block:
+            f = self._file
+            offset = f.tell()
+            f.write(RECORD.pack(RecordKind.INDEX, INDEX.size, block.last_ns))
+            f.write(
+                INDEX.pack(
+                    block.offset,
+                    block.first_ns,
+                    block.last_ns,
+                    block.frames,
+                    self._last_index,
+                )
+            )
+            f.write(RECORD.pack(RecordKind.FOOTER, FOOTER.size, block.last_ns))
+            f.write(FOOTER.pack(offset, END_MAGIC))
+            f.flush()
+            self._last_index = offset
+            self._block = None
+
+    def _recover(self, path: Path) -> None:
+        data = map_file(path)
+        try:
+            check_header(data, path)
+            offset = HEADER.size
+            if footer := find_footer(data):
+                self._last_index, offset = footer
+            # frames written after the last index record are indexed with the
+            # next block
+            end = offset
+            for kind, recv_ns, start, stop in iter_records(data, offset):
+                end = stop
+                if kind is RecordKind.INDEX or kind is RecordKind.FOOTER:
+                    self._block = None
+                    continue
+                if self._block is None:
+                    self._block = IndexEntry(start - RECORD.size, recv_ns, recv_ns, 0)
+                self._block.last_ns = recv_ns
+                self._block.frames += 1
+            size = len(data)
+            if not is_torn(data, end):
+                raise CaptureError(f"{path}: corrupt record at offset {end}")
+        finally:
+            data.close()
+        if end < size:
+            os.truncate(path, end)
+
+
+class CaptureReader:
+    """Iterate over the frames of a capture file without copying them.
+
+    The file is memory mapped and frame payloads are memoryviews into the
+    map, which must be released before closing the reader. A truncated last
+    record, from a writer which did not close the file, is ignored, while
+    the frames following a corrupt record are skipped up to the next
+    indexed block.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = path
+        self._map = map_file(path)
+        try:
+            self.created_ns = check_header(self._map, path)
+        except CaptureError:
+            self._map.close()
+            raise
+        self._view = memoryview(self._map)
+        self._index: list[IndexEntry] | None = None
+        self._tail = HEADER.size
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[CaptureFrame]:
+        return self.frames()
+
+    def close(self) -> None:
+        self._view.release()
+        self._map.close()
+
+    def frames(self, start_ns: int = 0) -> Iterator[CaptureFrame]:
+        """Iterate over frames received at or after `start_ns`"""
+        offset = self._seek(start_ns) if start_ns else HEADER.size
+        data = self._map
+        while True:
+            for kind, recv_ns, start, end in iter_records(data, offset):
+                offset = end
+                if kind <= RecordKind.TEXT and recv_ns >= start_ns:
+                    yield CaptureFrame(kind, recv_ns, self._view[start:end])
+            if is_torn(data, offset):
+                return
+            offset = self._skip(offset)
+
+    def index(self) -> list[IndexEntry]:
+        """Index entries of the file, following the index records backwards
+        from the last footer"""
+        if self._index is None:
+            entries: list[IndexEntry] = []
+            if footer := find_footer(self._map):
+                offset, self._tail = footer
+                while offset:
+                    *values, offset = INDEX.unpack_from(self._map, offset + RECORD.size)
+                    entries.append(IndexEntry(*values))
+                entries.reverse()
+            self._index = entries
+        return self._index
+
+    def _skip(self, offset: int) -> int:
+        """Offset of the first indexed block after a corrupt record"""
+        for entry in self.index():
+            if entry.offset > offset:
+                logger.warning(
+                    "%s: corrupt record at offset %d, skipped to offset %d",
+                    self.path,
+                    offset,
+                    entry.offset,
+                )
+                return entry.offset
+        raise CaptureError(f"{self.path}: corrupt record at offset {offset}")
+
+    def _seek(self, start_ns: int) -> int:
+        index = self.index()
+        i = bisect_right([entry.last_ns for entry in index], start_ns - 1)
+        if i < len(index):
+            return index[i].offset
+        # frames written after the last index record
+        return self._tail
@@ -5,6 +5,9 @@ import dotenv
 
 import onyx_otc
 
+from .bench import bench
+from .fake_server import fake_server
+from .replay import replay
 from .stream import stream
 
 dotenv.load_dotenv()
@@ -23,6 +26,9 @@ def cli(debug: bool) -> None:
     logging.basicConfig(level=level, format="%(message)s")
 
 
+cli.add_command(bench)
+cli.add_command(fake_server)
+cli.add_command(replay)
 cli.add_command(stream)
 
 
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import click
+
+from onyx_otc import bench as benchmarks
+
+
+@click.command()
+@click.option(
+    "--match",
+    "-m",
+    default="",
+    help="Only run the cases whose name contains this string",
+)
+@click.option(
+    "--baseline",
+    default=str(benchmarks.DEFAULT_BASELINE),
+    type=click.Path(dir_okay=False),
+    help="Baseline file to compare with or to save to",
+)
+@click.option(
+    "--threshold",
+    default=0.25,
+    help="Fraction above the baseline considered a regression",
+)
+@click.option("--save", is_flag=True, help="Save the results as the new baseline")
+@click.option(
+    "--number",
+    default=0,
+    help="Calls per repeat, calibrated to at least 0.2 seconds if 0",
+)
+@click.option("--repeat", default=5, help="Repeats, the best one is reported")
+def bench(
+    match: str,
+    baseline: str,
+    threshold: float,
+    save: bool,
+    number: int,
+    repeat: int,
+) -> None:
+    """Benchmark decoding and encoding of websocket messages."""
+    results = []
+    for case in benchmarks.cases():
+        if match in case.name:
+            result = benchmarks.run_case(case, number=number, repeat=repeat)
+            click.echo(result)
+            results.append(result)
+    if save:
+        benchmarks.save_baseline(results, baseline)
+        click.echo(f"Baseline saved to {baseline}")
+    elif Path(baseline).exists():
+        regressions = benchmarks.compare(
+            results, benchmarks.load_baseline(baseline), threshold
+        )
+        for regression in regressions:
+            click.echo(f"REGRESSION {regression}", err=True)
+        if regressions:
+            raise SystemExit(1)
+        click.echo(f"No regressions above {threshold:.0%} of {baseline}")
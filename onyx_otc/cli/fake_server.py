@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import time
+
+import click
+
+from onyx_otc.fake_server import FakeServer
+
+logger = logging.getLogger(__name__)
+
+
+async def run_fake_server(server: FakeServer, interval: float) -> None:
+    async with server:
+        click.echo(f"Listening on {server.url} and {server.url}/binary")
+        started = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            stats = server.stats
+            logger.info(
+                "%d connections, %d channel messages in %.0f seconds",
+                len(server.connections),
+                sum(stats.messages.values()),
+                time.monotonic() - started,
+            )
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", help="Interface to listen on")
+@click.option("--port", default=8765, help="Port to listen on")
+@click.option(
+    "--token",
+    default="",
+    help="Token accepted by the server, any non empty token if not provided",
+)
+@click.option("--contracts", default=3, help="Number of contracts of each product")
+@click.option(
+    "--rate",
+    default=10.0,
+    help="Messages per second for each subscribed channel of a connection",
+)
+@click.option(
+    "--rows",
+    default=10,
+    help="Maximum number of tickers or order book tops per message",
+)
+@click.option("--seed", type=int, help="Seed of the random prices")
+def fake_server(
+    host: str,
+    port: int,
+    token: str,
+    contracts: int,
+    rate: float,
+    rows: int,
+    seed: int | None,
+) -> None:
+    """Run a local websocket server streaming synthetic market data."""
+    server = FakeServer(
+        host=host,
+        port=port,
+        token=token,
+        contracts=contracts,
+        rate=rate,
+        rows=rows,
+        seed=seed,
+    )
+    try:
+        asyncio.run(run_fake_server(server, interval=10))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,79 @@
+import asyncio
+
+import click
+
+from onyx_otc.capture import CaptureReader
+from onyx_otc.replay import Replayer
+from onyx_otc.responses import OtcChannelMessage, OtcResponse
+from onyx_otc.types import Channel
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+
+def on_response(cli: OnyxWebsocketClientV2, response: OtcResponse) -> None:
+    response.log()
+
+
+def on_event(cli: OnyxWebsocketClientV2, message: OtcChannelMessage) -> None:
+    message.log()
+
+
+def on_quiet(
+    cli: OnyxWebsocketClientV2, message: OtcResponse | OtcChannelMessage
+) -> None:
+    pass
+
+
+async def run_replay(replayer: Replayer, path: str) -> None:
+    with CaptureReader(path) as reader:
+        stats = await replayer.run(reader)
+    click.echo(stats)
+
+
+@click.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--speed",
+    default=0.0,
+    help="Replay at this multiple of real time, as fast as possible if 0",
+)
+@click.option(
+    "--channel",
+    "-c",
+    multiple=True,
+    type=click.Choice([c.value for c in Channel if c is not Channel.UNSPECIFIED]),
+    help="Only replay messages of these channels",
+)
+@click.option(
+    "--symbol",
+    "-s",
+    multiple=True,
+    help="Only replay market data of these symbols or product symbols",
+)
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Do not log messages, to measure decoding throughput",
+)
+def replay(
+    path: str,
+    speed: float,
+    channel: list[str],
+    symbol: list[str],
+    quiet: bool,
+) -> None:
+    """Replay a capture file recorded with `onyx stream --record`."""
+    client = OnyxWebsocketClientV2.create(
+        on_response=on_quiet if quiet else on_response,
+        on_event=on_quiet if quiet else on_event,
+    )
+    replayer = Replayer(
+        client,
+        speed=speed,
+        channels={Channel(c) for c in channel},
+        symbols=set(symbol),
+    )
+    try:
+        asyncio.run(run_replay(replayer, path))
+    except KeyboardInterrupt:
+        pass
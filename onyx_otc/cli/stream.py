@@ -1,10 +1,13 @@
 import asyncio
+import contextlib
 import logging
 from dataclasses import dataclass, field
 
 import click
 
-from onyx_otc.requests import InvalidInputError, RfqChannel
+from onyx_otc.capture import CaptureWriter
+from onyx_otc.metrics import ClientMetrics, MetricsExporter, log_metrics
+from onyx_otc.requests import InvalidInputError, OrderBookChannel, RfqChannel
 from onyx_otc.responses import OtcChannelMessage, OtcResponse
 from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
 
@@ -19,18 +22,23 @@ class Workflow:
     tickers: list[str] = field(default_factory=list)
     obt: list[str] = field(default_factory=list)
     rfqs: list[RfqChannel] = field(default_factory=list)
+    books: list[OrderBookChannel] = field(default_factory=list)
+
+    def subscribe(self, cli: OnyxWebsocketClientV2) -> None:
+        """Register subscriptions, sent once the client is authenticated"""
+        if self.server_info:
+            cli.subscribe_server_info()
+        if self.tickers:
+            cli.subscribe_tickers(self.tickers)
+        if self.obt:
+            cli.subscribe_obt(self.obt)
+        for rfq in self.rfqs:
+            cli.subscribe_rfq(rfq)
+        for book in self.books:
+            cli.subscribe_order_book(book)
 
     def on_response(self, cli: OnyxWebsocketClientV2, response: OtcResponse) -> None:
         response.log()
-        if response.auth():
-            if self.server_info:
-                cli.subscribe_server_info()
-            if self.tickers:
-                cli.subscribe_tickers(self.tickers)
-            if self.obt:
-                cli.subscribe_obt(self.obt)
-            for rfq in self.rfqs:
-                cli.subscribe_rfq(rfq)
 
     def on_event(self, cli: OnyxWebsocketClientV2, message: OtcChannelMessage) -> None:
         message.log()
@@ -41,15 +49,31 @@ async def run_client_websocket(
     binary: bool,
     token: str | None = None,
     ws_url: str | None = None,
+    record: str | None = None,
+    stats: float = 0,
+    metrics_port: int | None = None,
 ) -> None:
+    recorder = CaptureWriter(record) if record else None
+    metrics = ClientMetrics() if stats or metrics_port is not None else None
     client = OnyxWebsocketClientV2.create(
         binary=binary,
         on_response=workflow.on_response,
         on_event=workflow.on_event,
         api_token=token,
         ws_url=ws_url,
+        recorder=recorder,
+        metrics=metrics,
     )
-    await client.connect()
+    workflow.subscribe(client)
+    async with contextlib.AsyncExitStack() as stack:
+        if recorder is not None:
+            stack.callback(recorder.close)
+        if metrics_port is not None:
+            await stack.enter_async_context(MetricsExporter(client, port=metrics_port))
+        if stats:
+            stats_task = asyncio.create_task(log_metrics(client, stats))
+            stack.callback(stats_task.cancel)
+        await client.connect()
 
 
 @click.command()
@@ -77,12 +101,34 @@ async def run_client_websocket(
     help="RFQ symbols as <symbol>@<exchange>@<size=1>",
     multiple=True,
 )
+@click.option(
+    "--book",
+    "-b",
+    help="Full depth order book symbols as <symbol>@<exchange>",
+    multiple=True,
+)
 @click.option(
     "--json",
     "-j",
     is_flag=True,
     help="Use JSON stream instead of protobuf",
 )
+@click.option(
+    "--record",
+    help="Append received frames to a capture file",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--stats",
+    help="Log throughput, decode and handler time every STATS seconds",
+    type=float,
+    default=0,
+)
+@click.option(
+    "--metrics-port",
+    help="Serve metrics in the Prometheus text format on this local port",
+    type=int,
+)
 @common.token_option
 @common.url_option
 def stream(
@@ -90,7 +136,11 @@ def stream(
     obt: list[str],
     server_info: bool,
     rfq: list[str],
+    book: list[str],
     json: bool,
+    record: str | None,
+    stats: float,
+    metrics_port: int | None,
     token: str | None,
     url: str | None,
 ) -> None:
@@ -101,13 +151,22 @@ def stream(
             tickers=tickers,
             obt=obt,
             rfqs=[RfqChannel.from_string(r) for r in rfq],
+            books=[OrderBookChannel.from_string(b) for b in book],
         )
     except InvalidInputError as e:
         click.echo(e, err=True)
         raise click.Abort() from None
     try:
         asyncio.run(
-            run_client_websocket(workflow, binary=not json, token=token, ws_url=url)
+            run_client_websocket(
+                workflow,
+                binary=not json,
+                token=token,
+                ws_url=url,
+                record=record,
+                stats=stats,
+                metrics_port=metrics_port,
+            )
         )
     except KeyboardInterrupt:
         pass
@@ -0,0 +1,175 @@
+"""Columnar decoding of market data channel messages into NumPy arrays.
+
+Requires the optional `numpy` dependency (``pip install onyx-otc[numpy]``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from .fixed import Fixed
+from .symbols import SymbolRegistry
+from .timestamp import NANOS_PER_SECOND
+from .v2 import common_pb2, responses_pb2
+
+Int32Array: TypeAlias = npt.NDArray[np.int32]
+Int64Array: TypeAlias = npt.NDArray[np.int64]
+# float64 prices, or int64 mantissas when a decimal scale is requested
+PriceArray: TypeAlias = npt.NDArray[np.float64] | npt.NDArray[np.int64]
+# largest decimal scale, int64 mantissas hold 18 significant digits
+MAX_SCALE = 18
+# missing values of scaled int64 columns
+MISSING = int(np.iinfo(np.int64).min)
+
+
+@dataclass(slots=True)
+class SymbolIds(SymbolRegistry):
+    """A symbol registry converting symbols to arrays of ids
+
+    Unbounded by default, so that ids of earlier frames stay valid.
+    """
+
+    def to_ids(self, symbols: Iterable[str], count: int) -> Int32Array:
+        get_id = self.get_id
+        return np.fromiter((get_id(s) for s in symbols), np.int32, count)
+
+
+def timestamps_array(
+    rows: Sequence[responses_pb2.Ticker] | Sequence[responses_pb2.OrderBookTop],
+) -> Int64Array:
+    """Nanoseconds since epoch of a sequence of protos with a `timestamp` field"""
+    n = len(rows)
+    seconds = np.fromiter((r.timestamp.seconds for r in rows), np.int64, n)
+    nanos = np.fromiter((r.timestamp.nanos for r in rows), np.int64, n)
+    return seconds * NANOS_PER_SECOND + nanos
+
+
+def scaled_int(value: str, scale: int) -> int:
+    """The integer value of a decimal string times 10**scale, rounded half
+    to even, or `MISSING` when empty"""
+    if not value:
+        return MISSING
+    whole, _, fraction = value.partition(".")
+    extra = len(fraction) - scale
+    if extra <= 0 and "e" not in value and "E" not in value:
+        return int(whole + fraction) * 10**-extra
+    fixed = Fixed.parse(value, scale)
+    extra = fixed.scale - scale
+    if not extra:
+        return fixed.mantissa
+    mantissa, remainder = divmod(fixed.mantissa, 10**extra)
+    half = 5 * 10 ** (extra - 1)
+    if remainder > half or (remainder == half and mantissa & 1):
+        mantissa += 1
+    return mantissa
+
+
+def decimals_array(
+    values: Iterable[common_pb2.Decimal], count: int, scale: int | None = None
+) -> PriceArray:
+    """Convert proto decimals to float64, or to int64 scaled by 10**scale.
+
+    Scaled values are parsed from the decimal strings, without going
+    through floats. Missing values are NaN in the float representation and
+    `MISSING` in the scaled one; values which do not fit an int64 raise
+    OverflowError.
+    """
+    if scale is None:
+        return np.fromiter((float(v.value or "nan") for v in values), np.float64, count)
+    if not 0 <= scale <= MAX_SCALE:
+        raise ValueError(f"scale must be between 0 and {MAX_SCALE}")
+    return np.fromiter((scaled_int(v.value, scale) for v in values), np.int64, count)
+
+
+@dataclass(slots=True)
+class TickerColumns:
+    """A frame of tickers as columns"""
+
+    symbol_id: Int32Array
+    product_id: Int32Array
+    timestamp: Int64Array
+    mid: PriceArray
+    symbols: SymbolIds
+    scale: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.symbol_id)
+
+    @classmethod
+    def from_proto(
+        cls,
+        proto: responses_pb2.Tickers,
+        symbols: SymbolIds,
+        scale: int | None = None,
+    ) -> TickerColumns:
+        rows = proto.tickers
+        n = len(rows)
+        return cls(
+            symbol_id=symbols.to_ids((r.symbol for r in rows), n),
+            product_id=symbols.to_ids((r.product_symbol for r in rows), n),
+            timestamp=timestamps_array(rows),
+            mid=decimals_array((r.mid for r in rows), n, scale),
+            symbols=symbols,
+            scale=scale,
+        )
+
+
+@dataclass(slots=True)
+class OrderBookTopColumns:
+    """A frame of order book tops as columns"""
+
+    symbol_id: Int32Array
+    product_id: Int32Array
+    timestamp: Int64Array
+    bid_price: PriceArray
+    bid_amount: PriceArray
+    ask_price: PriceArray
+    ask_amount: PriceArray
+    symbols: SymbolIds
+    scale: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.symbol_id)
+
+    @classmethod
+    def from_proto(
+        cls,
+        proto: responses_pb2.OrderBookTops,
+        symbols: SymbolIds,
+        scale: int | None = None,
+    ) -> OrderBookTopColumns:
+        rows = proto.order_book_tops
+        n = len(rows)
+        return cls(
+            symbol_id=symbols.to_ids((r.symbol for r in rows), n),
+            product_id=symbols.to_ids((r.product_symbol for r in rows), n),
+            timestamp=timestamps_array(rows),
+            bid_price=decimals_array((r.buy.price for r in rows), n, scale),
+            bid_amount=decimals_array((r.buy.amount for r in rows), n, scale),
+            ask_price=decimals_array((r.sell.price for r in rows), n, scale),
+            ask_amount=decimals_array((r.sell.amount for r in rows), n, scale),
+            symbols=symbols,
+            scale=scale,
+        )
+
+
+def channel_message_to_columns(
+    proto: responses_pb2.ChannelMessage,
+    symbols: SymbolIds,
+    scale: int | None = None,
+) -> TickerColumns | OrderBookTopColumns | None:
+    """Decode a tickers or order book top channel message into columns.
+
+    Returns None for any other channel message.
+    """
+    match proto.WhichOneof("message"):
+        case "tickers":
+            return TickerColumns.from_proto(proto.tickers, symbols, scale)
+        case "order_book_tops":
+            return OrderBookTopColumns.from_proto(proto.order_book_tops, symbols, scale)
+        case _:
+            return None
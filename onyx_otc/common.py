@@ -35,9 +35,16 @@ class PriceAmount(BaseModel):
 
     @classmethod
     def from_proto(
-        cls, proto: responses_pb2.PriceAmount | responses_pb2.OtcQuoteSide
+        cls,
+        proto: (
+            responses_pb2.PriceAmount
+            | responses_pb2.OtcQuoteSide
+            | responses_pb2.OrderBookLevel
+        ),
+        trusted: bool = False,
     ) -> Self:
-        return cls(
+        build = cls.model_construct if trusted else cls
+        return build(
             price=Decimal(proto.price.value),
             amount=Decimal(proto.amount.value),
         )
@@ -62,16 +69,19 @@ class TradableSymbol(BaseModel):
         return cls(symbol=symbol)
 
     @classmethod
-    def from_proto(cls, proto: common_pb2.TradableSymbol) -> Self:
+    def from_proto(
+        cls, proto: common_pb2.TradableSymbol, trusted: bool = False
+    ) -> Self:
+        build = cls.model_construct if trusted else cls
         match proto.WhichOneof("symbol"):
             case "flat":
-                return cls(symbol=proto.flat)
+                return build(symbol=proto.flat)
             case "spread":
-                return cls(
+                return build(
                     symbol=Spread(front=proto.spread.front, back=proto.spread.back)
                 )
             case "butterfly":
-                return cls(
+                return build(
                     symbol=Butterfly(
                         front=proto.butterfly.front,
                         middle=proto.butterfly.middle,
@@ -0,0 +1,411 @@
+"""Compact slotted message types.
+
+Lightweight alternatives to the pydantic models of the most frequent
+messages, with the same field names, for handlers which build or retain
+many of them. Every type converts to its pydantic model with `to_model`.
+
+Prices and amounts are `Decimal`, or `Fixed` when built with a `scale`:
+prices then have at least `scale` decimal digits, so that the prices of a
+product share a scale, while amounts keep the digits they are sent with.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Mapping, Self, TypeAlias
+
+from .common import PriceAmount, TradableSymbol
+from .fixed import Fixed
+from .responses import (
+    Execution,
+    OrderBooks,
+    OrderBookTop,
+    OrderBookTops,
+    OtcChannelMessage,
+    OtcOrder,
+    OtcQuote,
+    ServerInfo,
+    Ticker,
+    Tickers,
+)
+from .symbols import parse_symbol
+from .timestamp import Timestamp
+from .types import Channel, Exchange, OrderState, OrderType, Side
+from .v2 import common_pb2, responses_pb2
+
+Number: TypeAlias = Decimal | Fixed
+
+
+def parse_number(value: str, scale: int | None = None) -> Number:
+    """A Decimal, or a Fixed with at least `scale` digits when given"""
+    if scale is None:
+        return Decimal(value)
+    return Fixed.parse(value, scale)
+
+
+def _decimal(value: Number) -> Decimal:
+    return value.to_decimal() if isinstance(value, Fixed) else value
+
+
+def _optional_decimal(value: Number | None) -> Decimal | None:
+    return None if value is None else _decimal(value)
+
+
+@dataclass(slots=True)
+class CompactPriceAmount:
+    price: Number
+    amount: Number
+
+    @classmethod
+    def from_proto(
+        cls,
+        proto: (
+            responses_pb2.PriceAmount
+            | responses_pb2.OtcQuoteSide
+            | responses_pb2.OrderBookLevel
+        ),
+        scale: int | None = None,
+    ) -> Self:
+        if scale is None:
+            return cls(Decimal(proto.price.value), Decimal(proto.amount.value))
+        return cls(
+            Fixed.parse(proto.price.value, scale), Fixed.parse(proto.amount.value)
+        )
+
+    def to_model(self) -> PriceAmount:
+        return PriceAmount.model_construct(
+            price=_decimal(self.price), amount=_decimal(self.amount)
+        )
+
+    def as_string(self) -> str:
+        return f"{self.amount}@{self.price}"
+
+
+@dataclass(slots=True)
+class CompactTradableSymbol:
+    """A tradable symbol kept as its string, legs separated by dashes"""
+
+    symbol: str
+
+    @classmethod
+    def from_proto(cls, proto: common_pb2.TradableSymbol) -> Self:
+        match proto.WhichOneof("symbol"):
+            case "flat":
+                return cls(proto.flat)
+            case "spread":
+                return cls(f"{proto.spread.front}-{proto.spread.back}")
+            case "butterfly":
+                butterfly = proto.butterfly
+                return cls(f"{butterfly.front}-{butterfly.middle}-{butterfly.back}")
+            case _:
+                raise ValueError(f"Unknown symbol type: {proto}")
+
+    def to_model(self) -> TradableSymbol:
+        return parse_symbol(self.symbol)
+
+    def as_string(self) -> str:
+        return self.symbol
+
+
+@dataclass(slots=True)
+class CompactTicker:
+    symbol: str
+    product_symbol: str
+    timestamp: Timestamp
+    mid: Number
+
+    @classmethod
+    def from_proto(cls, proto: responses_pb2.Ticker, scale: int | None = None) -> Self:
+        return cls(
+            proto.symbol,
+            proto.product_symbol,
+            Timestamp.from_proto(proto.timestamp),
+            parse_number(proto.mid.value, scale),
+        )
+
+    def to_model(self) -> Ticker:
+        return Ticker.model_construct(
+            symbol=self.symbol,
+            product_symbol=self.product_symbol,
+            timestamp=self.timestamp,
+            mid=_decimal(self.mid),
+        )
+
+
+@dataclass(slots=True)
+class CompactOrderBookTop:
+    buy: CompactPriceAmount
+    sell: CompactPriceAmount
+    symbol: str
+    product_symbol: str
+    timestamp: Timestamp
+
+    @classmethod
+    def from_proto(
+        cls, proto: responses_pb2.OrderBookTop, scale: int | None = None
+    ) -> Self:
+        return cls(
+            CompactPriceAmount.from_proto(proto.buy, scale),
+            CompactPriceAmount.from_proto(proto.sell, scale),
+            proto.symbol,
+            proto.product_symbol,
+            Timestamp.from_proto(proto.timestamp),
+        )
+
+    def to_model(self) -> OrderBookTop:
+        return OrderBookTop.model_construct(
+            buy=self.buy.to_model(),
+            sell=self.sell.to_model(),
+            symbol=self.symbol,
+            product_symbol=self.product_symbol,
+            timestamp=self.timestamp,
+        )
+
+
+@dataclass(slots=True)
+class CompactOtcQuote:
+    symbol: CompactTradableSymbol
+    exchange: Exchange
+    timestamp: Timestamp
+    product_symbol: str
+    buy: CompactPriceAmount | None
+    sell: CompactPriceAmount | None
+
+    @classmethod
+    def from_proto(
+        cls, proto: responses_pb2.OtcQuote, scale: int | None = None
+    ) -> Self:
+        return cls(
+            CompactTradableSymbol.from_proto(proto.symbol),
+            Exchange.from_proto(proto.exchange),
+            Timestamp.from_proto(proto.timestamp),
+            proto.product_symbol,
+            (
+                CompactPriceAmount.from_proto(proto.buy, scale)
+                if proto.HasField("buy")
+                else None
+            ),
+            (
+                CompactPriceAmount.from_proto(proto.sell, scale)
+                if proto.HasField("sell")
+                else None
+            ),
+        )
+
+    def to_model(self) -> OtcQuote:
+        return OtcQuote.model_construct(
+            symbol=self.symbol.to_model(),
+            exchange=self.exchange,
+            timestamp=self.timestamp,
+            product_symbol=self.product_symbol,
+            buy=self.buy.to_model() if self.buy else None,
+            sell=self.sell.to_model() if self.sell else None,
+        )
+
+    def as_string(self) -> str:
+        return (
+            f"{self.symbol.as_string()} "
+            f"buy: {self.buy.as_string() if self.buy else None}, "
+            f"sell: {self.sell.as_string() if self.sell else None}"
+        )
+
+
+@dataclass(slots=True)
+class CompactOtcOrder:
+    id: str
+    client_order_id: str
+    account_id: str
+    symbol: CompactTradableSymbol
+    product_symbol: str
+    amount: Number
+    side: Side
+    price: Number
+    exchange: Exchange
+    order_type: OrderType
+    order_state: OrderState
+    created_timestamp: Timestamp | None
+    executed_amount: Number | None
+    executed_avg_price: Number | None
+    executions: list[Execution]
+
+    @classmethod
+    def from_proto(cls, proto: responses_pb2.Order, scale: int | None = None) -> Self:
+        amount_scale = None if scale is None else 0
+        return cls(
+            proto.id,
+            proto.client_order_id,
+            proto.account_id,
+            CompactTradableSymbol.from_proto(proto.symbol),
+            proto.product_symbol,
+            parse_number(proto.amount.value, amount_scale),
+            Side.from_proto(proto.side),
+            parse_number(proto.price.value, scale),
+            Exchange.from_proto(proto.exchange),
+            OrderType.from_proto(proto.order_type),
+            OrderState.from_proto(proto.order_state),
+            (
+                Timestamp.from_proto(proto.created_timestamp)
+                if proto.HasField("created_timestamp")
+                else None
+            ),
+            (
+                parse_number(proto.executed_amount.value, amount_scale)
+                if proto.HasField("executed_amount")
+                else None
+            ),
+            (
+                parse_number(proto.executed_avg_price.value, scale)
+                if proto.HasField("executed_avg_price")
+                else None
+            ),
+            [Execution.from_proto(row, trusted=True) for row in proto.executions],
+        )
+
+    def to_model(self) -> OtcOrder:
+        return OtcOrder.model_construct(
+            id=self.id,
+            client_order_id=self.client_order_id,
+            account_id=self.account_id,
+            symbol=self.symbol.to_model(),
+            product_symbol=self.product_symbol,
+            amount=_decimal(self.amount),
+            side=self.side,
+            price=_decimal(self.price),
+            exchange=self.exchange,
+            order_type=self.order_type,
+            order_state=self.order_state,
+            created_timestamp=self.created_timestamp,
+            executed_amount=_optional_decimal(self.executed_amount),
+            executed_avg_price=_optional_decimal(self.executed_avg_price),
+            executions=self.executions,
+        )
+
+
+def _scale(scales: Mapping[str, int] | None, product: str) -> int | None:
+    return None if scales is None else scales.get(product, 0)
+
+
+CompactData: TypeAlias = (
+    list[CompactTicker]
+    | list[CompactOrderBookTop]
+    | CompactOtcQuote
+    | CompactOtcOrder
+    | OrderBooks
+    | ServerInfo
+)
+
+
+@dataclass(slots=True)
+class CompactChannelMessage:
+    """A channel message with compact market data, quotes and orders.
+
+    Order books and server info are kept as their (trusted) pydantic models.
+    """
+
+    channel: Channel
+    timestamp: Timestamp
+    data: CompactData
+
+    @classmethod
+    def from_proto(
+        cls,
+        proto: responses_pb2.ChannelMessage,
+        scales: Mapping[str, int] | None = None,
+    ) -> Self:
+        """Build from a proto, with Fixed prices when `scales` is given,
+        scaled by the scale of their product symbol or 0 when missing"""
+        data: CompactData
+        match proto.WhichOneof("message"):
+            case "tickers":
+                if scales is None:
+                    data = [
+                        CompactTicker.from_proto(row) for row in proto.tickers.tickers
+                    ]
+                else:
+                    data = [
+                        CompactTicker.from_proto(row, scales.get(row.product_symbol, 0))
+                        for row in proto.tickers.tickers
+                    ]
+            case "order_book_tops":
+                if scales is None:
+                    data = [
+                        CompactOrderBookTop.from_proto(row)
+                        for row in proto.order_book_tops.order_book_tops
+                    ]
+                else:
+                    data = [
+                        CompactOrderBookTop.from_proto(
+                            row, scales.get(row.product_symbol, 0)
+                        )
+                        for row in proto.order_book_tops.order_book_tops
+                    ]
+            case "otc_quote":
+                quote = proto.otc_quote
+                data = CompactOtcQuote.from_proto(
+                    quote, _scale(scales, quote.product_symbol)
+                )
+            case "order":
+                order = proto.order
+                data = CompactOtcOrder.from_proto(
+                    order, _scale(scales, order.product_symbol)
+                )
+            case "order_books":
+                data = OrderBooks.from_proto(proto.order_books, trusted=True)
+            case "server_info":
+                data = ServerInfo.from_proto(proto.server_info, trusted=True)
+            case _:
+                raise ValueError(f"Unknown channel message type {proto}")
+        return cls(
+            Channel.from_proto(proto.channel),
+            Timestamp.from_proto(proto.timestamp),
+            data,
+        )
+
+    def tickers(self) -> list[CompactTicker] | None:
+        if self.channel is Channel.TICKERS:
+            return self.data  # type: ignore[return-value]
+        return None
+
+    def order_book_tops(self) -> list[CompactOrderBookTop] | None:
+        if self.channel is Channel.ORDER_BOOK_TOP:
+            return self.data  # type: ignore[return-value]
+        return None
+
+    def otc_quote(self) -> CompactOtcQuote | None:
+        if isinstance(self.data, CompactOtcQuote):
+            return self.data
+        return None
+
+    def order(self) -> CompactOtcOrder | None:
+        if isinstance(self.data, CompactOtcOrder):
+            return self.data
+        return None
+
+    def order_books(self) -> OrderBooks | None:
+        if isinstance(self.data, OrderBooks):
+            return self.data
+        return None
+
+    def server_info(self) -> ServerInfo | None:
+        if isinstance(self.data, ServerInfo):
+            return self.data
+        return None
+
+    def to_model(self) -> OtcChannelMessage:
+        """The equivalent pydantic model of the message"""
+        data = self.data
+        model: ServerInfo | Tickers | OtcQuote | OrderBookTops | OrderBooks | OtcOrder
+        if isinstance(data, list):
+            rows = [row.to_model() for row in data]
+            if self.channel is Channel.TICKERS:
+                model = Tickers.model_construct(tickers=rows)
+            else:
+                model = OrderBookTops.model_construct(order_book_tops=rows)
+        elif isinstance(data, CompactOtcQuote | CompactOtcOrder):
+            model = data.to_model()
+        else:
+            model = data
+        return OtcChannelMessage.model_construct(
+            channel=self.channel, timestamp=self.timestamp, data=model
+        )
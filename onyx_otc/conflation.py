@@ -0,0 +1,146 @@
+"""Conflation of market data updates for slow consumers"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeAlias
+
+from .responses import OrderBookTops, OtcChannelMessage, Tickers
+from .timestamp import Timestamp
+from .types import Channel
+from .v2 import responses_pb2
+
+ChannelMessage: TypeAlias = responses_pb2.ChannelMessage | OtcChannelMessage
+
+
+@dataclass
+class ConflationStats:
+    """Counters of a conflator
+
+    Attributes:
+        updates: Market data rows received
+        conflated: Rows replaced by a newer update before being delivered
+        passthrough: Messages which are never conflated
+        delivered: Messages delivered to the consumer
+        max_pending: Maximum number of pending rows
+    """
+
+    updates: int = 0
+    conflated: int = 0
+    passthrough: int = 0
+    delivered: int = 0
+    max_pending: int = 0
+
+
+@dataclass
+class Conflator:
+    """Keep only the newest pending update per (channel, symbol).
+
+    Tickers and order book tops are conflated row by row, and the pending
+    rows of a channel are delivered as a single message when the consumer
+    asks for the next one. Every other message, including orders, is queued
+    and delivered in order ahead of pending market data.
+    Works with both protobuf messages and models, but only one kind should
+    be used by a conflator.
+    """
+
+    stats: ConflationStats = field(default_factory=ConflationStats)
+    _queue: deque[ChannelMessage] = field(default_factory=deque)
+    _pending: dict[Channel, dict[str, Any]] = field(default_factory=dict)
+    _timestamps: dict[Channel, Any] = field(default_factory=dict)
+    _binary: bool = False
+    _pending_rows: int = 0
+
+    def __len__(self) -> int:
+        """Number of messages ready to be delivered"""
+        return len(self._queue) + len(self._pending)
+
+    @property
+    def pending_rows(self) -> int:
+        return self._pending_rows
+
+    def add(self, message: ChannelMessage) -> None:
+        """Add a channel message"""
+        if isinstance(message, responses_pb2.ChannelMessage):
+            self._binary = True
+            channel = Channel.from_proto(message.channel)
+            match message.WhichOneof("message"):
+                case "tickers":
+                    rows: Any = message.tickers.tickers
+                case "order_book_tops":
+                    rows = message.order_book_tops.order_book_tops
+                case _:
+                    rows = None
+        else:
+            channel = message.channel
+            if tickers := message.tickers():
+                rows = tickers.tickers
+            elif obts := message.order_book_tops():
+                rows = obts.order_book_tops
+            else:
+                rows = None
+        if rows is None:
+            self.stats.passthrough += 1
+            self._queue.append(message)
+            return
+        if not rows:
+            return
+        pending = self._pending.get(channel)
+        if pending is None:
+            pending = self._pending[channel] = {}
+        self._timestamps[channel] = message.timestamp
+        stats = self.stats
+        for row in rows:
+            stats.updates += 1
+            if row.symbol in pending:
+                stats.conflated += 1
+            else:
+                self._pending_rows += 1
+            pending[row.symbol] = row
+        stats.max_pending = max(stats.max_pending, self._pending_rows)
+
+    def pop(self) -> ChannelMessage | None:
+        """Next message to deliver, if any"""
+        if self._queue:
+            message = self._queue.popleft()
+        elif self._pending:
+            channel = next(iter(self._pending))
+            rows = list(self._pending.pop(channel).values())
+            self._pending_rows -= len(rows)
+            message = self._build(channel, self._timestamps.pop(channel), rows)
+        else:
+            return None
+        self.stats.delivered += 1
+        return message
+
+    def clear(self, keep: Callable[[ChannelMessage], bool] | None = None) -> int:
+        """Drop the pending rows and the queued messages, except the queued
+        messages for which `keep` is true, returning the number dropped"""
+        dropped = len(self._pending)
+        self._pending.clear()
+        self._timestamps.clear()
+        self._pending_rows = 0
+        queue = deque(m for m in self._queue if keep is not None and keep(m))
+        dropped += len(self._queue) - len(queue)
+        self._queue = queue
+        return dropped
+
+    def _build(self, channel: Channel, timestamp: Any, rows: list) -> ChannelMessage:
+        if self._binary:
+            proto = responses_pb2.ChannelMessage(
+                channel=channel.to_proto(), timestamp=timestamp
+            )
+            if channel is Channel.TICKERS:
+                proto.tickers.tickers.extend(rows)
+            else:
+                proto.order_book_tops.order_book_tops.extend(rows)
+            return proto
+        data = (
+            Tickers.model_construct(tickers=rows)
+            if channel is Channel.TICKERS
+            else OrderBookTops.model_construct(order_book_tops=rows)
+        )
+        return OtcChannelMessage.model_construct(
+            channel=channel, timestamp=Timestamp(timestamp), data=data
+        )
@@ -0,0 +1,207 @@
+"""Decoding of websocket frames.
+
+These are plain module level functions so that they can be shipped to
+worker threads or processes.
+
+JSON frames are parsed with orjson when installed (``pip install
+onyx-otc[json]``), falling back to the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, TypeAlias, TypeVar
+
+from pydantic import BaseModel
+
+from .common import PriceAmount
+from .responses import (
+    CHANNEL_MESSAGE_TYPES,
+    OrderBook,
+    OrderBooks,
+    OrderBookTop,
+    OrderBookTops,
+    OtcChannelMessage,
+    OtcQuote,
+    OtcResponse,
+    Ticker,
+    Tickers,
+)
+from .symbols import parse_symbol
+from .timestamp import Timestamp
+from .types import Channel, Exchange
+from .v2 import responses_pb2
+
+try:
+    import orjson
+
+    json_loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+DecodedMessage: TypeAlias = (
+    OtcResponse | OtcChannelMessage | responses_pb2.ChannelMessage | None
+)
+# a decoded message and the nanoseconds it took to decode
+TimedMessage: TypeAlias = tuple[DecodedMessage, int]
+M = TypeVar("M", bound=BaseModel)
+
+_new = object.__new__
+_setattr = object.__setattr__
+
+
+def decode_binary(
+    data: bytes, trusted: bool = False, raw_events: bool = False
+) -> DecodedMessage:
+    """Decode a binary frame.
+
+    When `raw_events` is True channel messages are returned as parsed
+    protobuf messages rather than models. Unknown frames, and channel
+    messages of a type without a decoder, decode to None.
+    """
+    msg = responses_pb2.OtcResponseMessage.FromString(data)
+    match msg.WhichOneof("data"):
+        case "otc_response":
+            return OtcResponse.from_proto(msg.otc_response, trusted)
+        case "channel_message":
+            kind = msg.channel_message.WhichOneof("message")
+            if kind not in CHANNEL_MESSAGE_TYPES:
+                logger.debug("No decoder for channel message %s, dropped", kind)
+                return None
+            if raw_events:
+                return msg.channel_message
+            return OtcChannelMessage.from_proto(msg.channel_message, trusted)
+        case _:
+            return None
+
+
+def decode_text(data: str | bytes, trusted: bool = False) -> DecodedMessage:
+    """Decode a JSON text frame.
+
+    When `trusted` is True market data channel messages are built directly
+    from the parsed payload, skipping pydantic validation.
+    """
+    payload = json_loads(data)
+    if trusted and (decode := _CHANNEL_DECODERS.get(payload.get("channel"))):
+        return construct(
+            OtcChannelMessage,
+            channel=Channel(payload["channel"]),
+            timestamp=parse_timestamp(payload["timestamp"]),
+            data=decode(payload["message"]),
+        )
+    return OtcResponse.from_json(payload) or OtcChannelMessage.from_json(payload)
+
+
+def construct(cls: type[M], **values: Any) -> M:
+    """Build a model from values of the right type, without validation.
+
+    Unlike `model_construct` defaults are not filled in, every field must
+    be given. It sets the instance attributes of pydantic models directly,
+    about twice as fast as `model_construct`, which is why pydantic is
+    pinned to the releases it is tested with.
+    """
+    model = _new(cls)
+    _setattr(model, "__dict__", values)
+    _setattr(model, "__pydantic_fields_set__", set(values))
+    _setattr(model, "__pydantic_extra__", None)
+    _setattr(model, "__pydantic_private__", None)
+    return model
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: str | int | float) -> Timestamp:
+    """Timestamp of a JSON value, rows of a message often share it"""
+    return Timestamp.from_any(value)
+
+
+def _price_amount(value: dict) -> PriceAmount:
+    return construct(
+        PriceAmount, price=Decimal(value["price"]), amount=Decimal(value["amount"])
+    )
+
+
+def _tickers(message: list[dict]) -> Tickers:
+    return construct(
+        Tickers,
+        tickers=[
+            construct(
+                Ticker,
+                symbol=row["symbol"],
+                product_symbol=row["product_symbol"],
+                timestamp=parse_timestamp(row["timestamp"]),
+                mid=Decimal(row["mid"]),
+            )
+            for row in message
+        ],
+    )
+
+
+def _order_book_tops(message: list[dict]) -> OrderBookTops:
+    return construct(
+        OrderBookTops,
+        order_book_tops=[
+            construct(
+                OrderBookTop,
+                buy=_price_amount(row["buy"]),
+                sell=_price_amount(row["sell"]),
+                symbol=row["symbol"],
+                product_symbol=row["product_symbol"],
+                timestamp=parse_timestamp(row["timestamp"]),
+            )
+            for row in message
+        ],
+    )
+
+
+def _order_books(message: list[dict]) -> OrderBooks:
+    return construct(
+        OrderBooks,
+        order_books=[
+            construct(
+                OrderBook,
+                bids=[_price_amount(level) for level in row["bids"]],
+                asks=[_price_amount(level) for level in row["asks"]],
+                exchange=Exchange(row["exchange"]),
+                symbol=row["symbol"],
+                product_symbol=row["product_symbol"],
+                timestamp=parse_timestamp(row["timestamp"]),
+            )
+            for row in message
+        ],
+    )
+
+
+def _otc_quote(message: dict) -> OtcQuote:
+    return construct(
+        OtcQuote,
+        symbol=parse_symbol(message["symbol"]),
+        exchange=Exchange(message["exchange"]),
+        timestamp=parse_timestamp(message["timestamp"]),
+        product_symbol=message["product_symbol"],
+        buy=_price_amount(buy) if (buy := message.get("buy")) else None,
+        sell=_price_amount(sell) if (sell := message.get("sell")) else None,
+    )
+
+
+# decoders of the market data channels, other channels and responses are
+# infrequent and always validated
+_CHANNEL_DECODERS: dict[str, Callable[[Any], Any]] = {
+    Channel.TICKERS.value: _tickers,
+    Channel.ORDER_BOOK_TOP.value: _order_book_tops,
+    Channel.ORDER_BOOK.value: _order_books,
+    Channel.RFQ.value: _otc_quote,
+}
+
+
+def timed_decode(decode: Callable[[], DecodedMessage]) -> TimedMessage:
+    """Call a decode function, returning the message and the nanoseconds
+    it took"""
+    start = time.perf_counter_ns()
+    message = decode()
+    return message, time.perf_counter_ns() - start
@@ -0,0 +1,186 @@
+"""Bounded dispatch of channel messages to handlers running on consumer tasks"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from .conflation import ChannelMessage, Conflator
+from .responses import OtcChannelMessage
+from .types import Channel
+from .v2 import types_pb2
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(enum.StrEnum):
+    """What to do when the dispatch queue is full"""
+
+    # wait for room in the queue, which stops the socket reader
+    BLOCK = enum.auto()
+    # drop the oldest queued message which is not an order update
+    DROP_OLDEST = enum.auto()
+    # keep only the newest ticker and order book top per symbol
+    CONFLATE = enum.auto()
+
+
+@dataclass
+class DispatchStats:
+    """Counters of a dispatcher
+
+    Attributes:
+        enqueued: Messages put in the queue
+        dispatched: Messages passed to the handler
+        dropped: Messages dropped because the queue was full or the
+            dispatcher was stopped
+        errors: Handler invocations which raised an exception
+        max_depth: Maximum number of queued messages
+    """
+
+    enqueued: int = 0
+    dispatched: int = 0
+    dropped: int = 0
+    errors: int = 0
+    max_depth: int = 0
+
+
+def is_droppable(message: ChannelMessage) -> bool:
+    """Order updates are never dropped"""
+    if isinstance(message, OtcChannelMessage):
+        return message.channel is not Channel.ORDERS
+    return message.channel != types_pb2.CHANNEL_ORDERS
+
+
+@dataclass
+class Dispatcher:
+    """A bounded queue of channel messages consumed by handler tasks.
+
+    Messages are delivered in order by a single consumer; with more than one
+    consumer handlers run concurrently and ordering is no longer guaranteed.
+    Stopping the dispatcher drops the queued messages other than order
+    updates, which are delivered once started again.
+    """
+
+    handler: Callable[[ChannelMessage], Awaitable[None]]
+    maxsize: int = 10_000
+    consumers: int = 1
+    policy: OverflowPolicy = OverflowPolicy.BLOCK
+    stats: DispatchStats = field(default_factory=DispatchStats)
+    conflator: Conflator | None = None
+    _queue: deque[ChannelMessage] = field(default_factory=deque)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event)
+    _space: asyncio.Event = field(default_factory=asyncio.Event)
+    _idle: asyncio.Event = field(default_factory=asyncio.Event)
+    _tasks: list[asyncio.Task] = field(default_factory=list)
+    _active: int = 0
+
+    def __post_init__(self) -> None:
+        if self.policy is OverflowPolicy.CONFLATE and self.conflator is None:
+            self.conflator = Conflator()
+        self._space.set()
+        self._idle.set()
+
+    @property
+    def depth(self) -> int:
+        """Number of messages waiting to be dispatched"""
+        if self.conflator is not None:
+            return len(self.conflator)
+        return len(self._queue)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._tasks)
+
+    async def put(self, message: ChannelMessage) -> None:
+        """Queue a message, applying the overflow policy when full"""
+        self.stats.enqueued += 1
+        self._idle.clear()
+        if self.conflator is not None:
+            self.conflator.add(message)
+        else:
+            queue = self._queue
+            while len(queue) >= self.maxsize:
+                if self.policy is OverflowPolicy.DROP_OLDEST:
+                    if self._drop_oldest():
+                        continue
+                    break
+                self._space.clear()
+                await self._space.wait()
+            queue.append(message)
+        self.stats.max_depth = max(self.stats.max_depth, self.depth)
+        self._ready.set()
+
+    def start(self) -> None:
+        """Start the consumer tasks"""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._consume()) for _ in range(self.consumers)
+            ]
+
+    async def stop(self) -> None:
+        """Stop the consumer tasks and drop the queued messages other than
+        order updates"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop the queued messages other than order updates"""
+        if self.conflator is not None:
+            dropped = self.conflator.clear(keep=lambda m: not is_droppable(m))
+        else:
+            queue = deque(m for m in self._queue if not is_droppable(m))
+            dropped = len(self._queue) - len(queue)
+            self._queue = queue
+            self._space.set()
+        self.stats.dropped += dropped
+        if not self._active and not self.depth:
+            self._idle.set()
+
+    async def join(self) -> None:
+        """Wait until all queued messages have been handled"""
+        await self._idle.wait()
+
+    def _drop_oldest(self) -> bool:
+        for i, message in enumerate(self._queue):
+            if is_droppable(message):
+                del self._queue[i]
+                self.stats.dropped += 1
+                return True
+        return False
+
+    def _pop(self) -> ChannelMessage | None:
+        if self.conflator is not None:
+            return self.conflator.pop()
+        if self._queue:
+            message = self._queue.popleft()
+            self._space.set()
+            return message
+        return None
+
+    async def _consume(self) -> None:
+        while True:
+            message = self._pop()
+            if message is None:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            self._active += 1
+            try:
+                await self.handler(message)
+            except Exception as e:
+                self.stats.errors += 1
+                logger.error("Error handling event: %s", e, exc_info=True)
+            finally:
+                self._active -= 1
+                if not self._active and not self.depth:
+                    self._idle.set()
+            self.stats.dispatched += 1
+            # let the socket reader run between messages
+            await asyncio.sleep(0)
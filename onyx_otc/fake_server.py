@@ -0,0 +1,787 @@
+"""A local stand-in for the Onyx websocket server.
+
+It implements authentication, subscriptions and synthetic TICKERS,
+ORDER_BOOK_TOP, RFQ and ORDERS streams on both the JSON and the binary
+endpoints, so that clients can be tested and load tested offline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Self
+
+from aiohttp import WSMsgType, web
+from google.protobuf import timestamp_pb2
+
+from .common import TradableSymbol
+from .requests import (
+    AuthRequest,
+    OrderBookChannel,
+    OrderBookTopChannel,
+    OrdersChannel,
+    OtcOrderRequest,
+    OtcRequest,
+    RfqChannel,
+    ServerInfoChannel,
+    SubscribeRequest,
+    SubscriptionChannel,
+    TickersChannel,
+    UnsubscribeRequest,
+)
+from .subscriptions import SubscriptionRegistry
+from .timestamp import Timestamp
+from .types import (
+    Channel,
+    Exchange,
+    OrderState,
+    OrderType,
+    OtcErrorCode,
+    Side,
+    SubscriptionStatus,
+)
+from .v2 import common_pb2, requests_pb2, responses_pb2
+
+logger = logging.getLogger(__name__)
+
+MONTHS = "fghjkmnquvxz"
+# fee rate of the executions of orders
+FEE_RATE = Decimal("0.0001")
+
+
+def contracts(product: str, count: int) -> list[str]:
+    """Synthetic contract symbols of a product, as `<product><month><year>`"""
+    return [f"{product}{MONTHS[i % 12]}{25 + i // 12}" for i in range(count)]
+
+
+@dataclass
+class FakeServerStats:
+    """Counters of a fake server
+
+    Attributes:
+        connections: Websocket connections accepted
+        requests: Requests received
+        errors: Error responses sent
+        messages: Channel messages sent, by channel
+        rows: Tickers, order book tops, quotes and orders sent, by channel
+    """
+
+    connections: int = 0
+    requests: int = 0
+    errors: int = 0
+    messages: Counter[Channel] = field(default_factory=Counter)
+    rows: Counter[Channel] = field(default_factory=Counter)
+
+
+@dataclass
+class FakeConnection:
+    """A client connected to the fake server
+
+    Attributes:
+        ws: The server side of the websocket
+        binary: Connected to the binary endpoint
+        authenticated: The client sent a valid token
+        subscriptions: Channels the client is subscribed to
+        received: Latest requests received from the client
+    """
+
+    ws: web.WebSocketResponse
+    binary: bool
+    authenticated: bool = False
+    subscriptions: SubscriptionRegistry = field(default_factory=SubscriptionRegistry)
+    received: deque[OtcRequest] = field(default_factory=lambda: deque(maxlen=1000))
+    _cursor: Counter[Channel] = field(default_factory=Counter, repr=False)
+
+    async def send_response(self, proto: responses_pb2.OtcResponse) -> None:
+        if self.binary:
+            await self.ws.send_bytes(
+                responses_pb2.OtcResponseMessage(otc_response=proto).SerializeToString()
+            )
+        else:
+            await self.ws.send_str(json.dumps(response_json(proto)))
+
+    async def send_channel(self, proto: responses_pb2.ChannelMessage) -> None:
+        if self.binary:
+            await self.ws.send_bytes(
+                responses_pb2.OtcResponseMessage(
+                    channel_message=proto
+                ).SerializeToString()
+            )
+        else:
+            await self.ws.send_str(json.dumps(channel_json(proto)))
+
+    def next_rows(self, channel: Channel, symbols: list[str], rows: int) -> list[str]:
+        """The next `rows` symbols of a channel, cycling over all of them"""
+        if len(symbols) <= rows:
+            return symbols
+        start = self._cursor[channel] % len(symbols)
+        self._cursor[channel] = start + rows
+        selected = symbols[start : start + rows]
+        return selected + symbols[: rows - len(selected)]
+
+
+@dataclass
+class FakeServer:
+    """Websocket server streaming synthetic market data.
+
+    Clients connect to `url`, or to `url` followed by `/binary` for the
+    protobuf protocol, and must authenticate before subscribing. Every
+    product subscribed to tickers or order book tops has `contracts`
+    synthetic contracts whose prices follow a random walk.
+
+    Attributes:
+        host: Interface to listen on
+        port: Port to listen on, any free port when 0
+        path: Path of the JSON endpoint
+        token: Token accepted by the server, any non empty token when empty
+        contracts: Number of contracts of each product
+        rate: Channel messages sent per second for each subscribed channel
+            of a connection
+        rows: Maximum number of tickers or order book tops per message,
+            messages cycle over all subscribed contracts
+        reject: Products whose subscriptions are rejected with an error
+        respond: Answer requests, when False requests are only recorded
+        seed: Seed of the random prices
+        stats: Server counters
+        connections: Connected clients
+    """
+
+    host: str = "127.0.0.1"
+    port: int = 0
+    path: str = "/stream/v2"
+    token: str = ""
+    contracts: int = 3
+    rate: float = 10.0
+    rows: int = 10
+    reject: set[str] = field(default_factory=set)
+    respond: bool = True
+    seed: int | None = None
+    stats: FakeServerStats = field(default_factory=FakeServerStats)
+    connections: list[FakeConnection] = field(default_factory=list)
+    _runner: web.AppRunner | None = field(default=None, init=False, repr=False)
+    _prices: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _random: random.Random = field(init=False, repr=False)
+    _order_id: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
+
+    @property
+    def url(self) -> str:
+        """URL of the JSON endpoint"""
+        return f"ws://{self.host}:{self.port}{self.path}"
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get(self.path, self.handle)
+        app.router.add_get(f"{self.path}/binary", self.handle)
+        return app
+
+    async def start(self) -> None:
+        """Start listening, setting `port` when it was 0"""
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+        logger.info("Fake server listening on %s", self.url)
+
+    async def stop(self) -> None:
+        """Close all connections and stop listening"""
+        for conn in list(self.connections):
+            await conn.ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        conn = FakeConnection(ws, binary=request.path.endswith("/binary"))
+        self.connections.append(conn)
+        self.stats.connections += 1
+        stream = asyncio.create_task(self._stream(conn))
+        try:
+            async for msg in ws:
+                if msg.type not in (WSMsgType.BINARY, WSMsgType.TEXT):
+                    break
+                try:
+                    if msg.type == WSMsgType.BINARY:
+                        otc_request = request_from_proto(
+                            requests_pb2.OtcRequest.FromString(msg.data)
+                        )
+                    else:
+                        otc_request = request_from_json(json.loads(msg.data))
+                except Exception as e:
+                    logger.warning("Malformed request: %s", e)
+                    otc_request = None
+                await self.handle_request(conn, otc_request)
+        finally:
+            stream.cancel()
+            self.connections.remove(conn)
+        return ws
+
+    async def handle_request(
+        self, conn: FakeConnection, request: OtcRequest | None
+    ) -> None:
+        self.stats.requests += 1
+        if request is None:
+            await self._error(conn, "", OtcErrorCode.INVALID_REQUEST, "Bad request")
+            return
+        conn.received.append(request)
+        if not self.respond:
+            return
+        data = request.request
+        if isinstance(data, AuthRequest):
+            if data.token and (not self.token or data.token == self.token):
+                conn.authenticated = True
+                await conn.send_response(
+                    responses_pb2.OtcResponse(
+                        id=request.id,
+                        timestamp=Timestamp.utcnow().to_proto(),
+                        auth=responses_pb2.AuthResponse(message="Authenticated"),
+                    )
+                )
+            else:
+                await self._error(
+                    conn, request.id, OtcErrorCode.UNAUTHENTICATED, "Invalid token"
+                )
+        elif not conn.authenticated:
+            await self._error(
+                conn, request.id, OtcErrorCode.UNAUTHENTICATED, "Not authenticated"
+            )
+        elif isinstance(data, SubscribeRequest):
+            await self._subscribe(conn, request.id, data)
+        elif isinstance(data, UnsubscribeRequest):
+            conn.subscriptions.remove(data.data)
+            await self._subscription(
+                conn, request.id, data.channel, SubscriptionStatus.UNSUBSCRIBED
+            )
+        elif isinstance(data, OtcOrderRequest):
+            order = self._order(data)
+            await conn.send_response(
+                responses_pb2.OtcResponse(
+                    id=request.id,
+                    timestamp=Timestamp.utcnow().to_proto(),
+                    order=order,
+                )
+            )
+            if conn.subscriptions.orders:
+                await self._send(conn, self._channel(Channel.ORDERS, order=order))
+
+    async def _subscribe(
+        self, conn: FakeConnection, request_id: str, request: SubscribeRequest
+    ) -> None:
+        data = request.data
+        if isinstance(data, OrderBookChannel):
+            await self._error(
+                conn,
+                request_id,
+                OtcErrorCode.NOT_IMPLEMENTED,
+                "Order books are not available",
+            )
+            return
+        products = getattr(data, "products", [])
+        if rejected := sorted(self.reject.intersection(products)):
+            await self._error(
+                conn,
+                request_id,
+                OtcErrorCode.INVALID_REQUEST,
+                f"Unknown products {', '.join(rejected)}",
+            )
+            return
+        conn.subscriptions.add(data)
+        await self._subscription(
+            conn, request_id, request.channel, SubscriptionStatus.SUBSCRIBED
+        )
+        if isinstance(data, ServerInfoChannel):
+            await self._send(
+                conn,
+                self._channel(
+                    Channel.SERVER_INFO,
+                    server_info=responses_pb2.ServerInfo(
+                        socket_uid=str(id(conn)),
+                        age_millis=len(self.connections),
+                    ),
+                ),
+            )
+
+    async def _subscription(
+        self,
+        conn: FakeConnection,
+        request_id: str,
+        channel: Channel,
+        status: SubscriptionStatus,
+    ) -> None:
+        await conn.send_response(
+            responses_pb2.OtcResponse(
+                id=request_id,
+                timestamp=Timestamp.utcnow().to_proto(),
+                subscription=responses_pb2.Subscription(
+                    channel=channel.to_proto(), status=status.to_proto()
+                ),
+            )
+        )
+
+    async def _error(
+        self, conn: FakeConnection, request_id: str, code: OtcErrorCode, message: str
+    ) -> None:
+        self.stats.errors += 1
+        await conn.send_response(
+            responses_pb2.OtcResponse(
+                id=request_id,
+                timestamp=Timestamp.utcnow().to_proto(),
+                error=responses_pb2.OtcError(code=code.to_proto(), message=message),
+            )
+        )
+
+    async def _stream(self, conn: FakeConnection) -> None:
+        """Send the synthetic channel messages of a connection at `rate`"""
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.rate
+        next_time = loop.time()
+        while True:
+            next_time += interval
+            await asyncio.sleep(max(next_time - loop.time(), 0))
+            try:
+                for proto in self._messages(conn):
+                    await self._send(conn, proto)
+            except ConnectionError:
+                break
+
+    async def _send(
+        self, conn: FakeConnection, proto: responses_pb2.ChannelMessage
+    ) -> None:
+        channel = Channel.from_proto(proto.channel)
+        self.stats.messages[channel] += 1
+        match proto.WhichOneof("message"):
+            case "tickers":
+                self.stats.rows[channel] += len(proto.tickers.tickers)
+            case "order_book_tops":
+                self.stats.rows[channel] += len(proto.order_book_tops.order_book_tops)
+            case "otc_quote" | "order":
+                self.stats.rows[channel] += 1
+        await conn.send_channel(proto)
+
+    def _messages(self, conn: FakeConnection) -> list[responses_pb2.ChannelMessage]:
+        subscriptions = conn.subscriptions
+        messages = []
+        if subscriptions.tickers:
+            symbols = self._symbols(subscriptions.tickers)
+            rows = conn.next_rows(Channel.TICKERS, symbols, self.rows)
+            messages.append(
+                self._channel(
+                    Channel.TICKERS,
+                    tickers=responses_pb2.Tickers(
+                        tickers=[self._ticker(symbol) for symbol in rows]
+                    ),
+                )
+            )
+        if subscriptions.obt:
+            symbols = self._symbols(subscriptions.obt)
+            rows = conn.next_rows(Channel.ORDER_BOOK_TOP, symbols, self.rows)
+            messages.append(
+                self._channel(
+                    Channel.ORDER_BOOK_TOP,
+                    order_book_tops=responses_pb2.OrderBookTops(
+                        order_book_tops=[self._obt(symbol) for symbol in rows]
+                    ),
+                )
+            )
+        for rfq in subscriptions.rfqs.values():
+            messages.append(self._channel(Channel.RFQ, otc_quote=self._quote(rfq)))
+        if subscriptions.orders:
+            symbol = self._random.choice(
+                self._symbols(subscriptions.tickers or {"brt"})
+            )
+            order = self._order(
+                OtcOrderRequest(
+                    account_id="fake",
+                    symbol=TradableSymbol.from_string(symbol),
+                    quantity=Decimal(self._random.randint(1, 10)),
+                    side=self._random.choice((Side.BUY, Side.SELL)),
+                    price=Decimal(f"{self._price(symbol):.3f}"),
+                )
+            )
+            messages.append(self._channel(Channel.ORDERS, order=order))
+        return messages
+
+    def _symbols(self, products: set[str]) -> list[str]:
+        return [
+            symbol
+            for product in sorted(products)
+            for symbol in contracts(product, self.contracts)
+        ]
+
+    def _price(self, symbol: str) -> float:
+        price = self._prices.get(symbol)
+        if price is None:
+            price = 50 + 50 * self._random.random()
+        price = max(price + self._random.gauss(0, 0.01), 0.01)
+        self._prices[symbol] = price
+        return price
+
+    def _channel(
+        self, channel: Channel, **message: Any
+    ) -> responses_pb2.ChannelMessage:
+        return responses_pb2.ChannelMessage(
+            channel=channel.to_proto(),
+            timestamp=Timestamp.utcnow().to_proto(),
+            **message,
+        )
+
+    def _ticker(self, symbol: str) -> responses_pb2.Ticker:
+        return responses_pb2.Ticker(
+            symbol=symbol,
+            product_symbol=symbol[:-3],
+            timestamp=Timestamp.utcnow().to_proto(),
+            mid=common_pb2.Decimal(value=f"{self._price(symbol):.3f}"),
+        )
+
+    def _obt(self, symbol: str) -> responses_pb2.OrderBookTop:
+        mid = self._price(symbol)
+        return responses_pb2.OrderBookTop(
+            symbol=symbol,
+            product_symbol=symbol[:-3],
+            exchange=Exchange.ICE.to_proto(),
+            timestamp=Timestamp.utcnow().to_proto(),
+            buy=responses_pb2.PriceAmount(
+                price=common_pb2.Decimal(value=f"{mid - 0.005:.3f}"),
+                amount=common_pb2.Decimal(value=str(self._random.randint(1, 50))),
+            ),
+            sell=responses_pb2.PriceAmount(
+                price=common_pb2.Decimal(value=f"{mid + 0.005:.3f}"),
+                amount=common_pb2.Decimal(value=str(self._random.randint(1, 50))),
+            ),
+        )
+
+    def _quote(self, rfq: RfqChannel) -> responses_pb2.OtcQuote:
+        symbol = rfq.symbol.as_string()
+        mid = self._price(symbol)
+        size = common_pb2.Decimal(value=str(rfq.size))
+        return responses_pb2.OtcQuote(
+            symbol=rfq.symbol.to_proto(),
+            exchange=rfq.exchange.to_proto(),
+            timestamp=Timestamp.utcnow().to_proto(),
+            product_symbol=symbol.split("-")[0][:-3],
+            mid=common_pb2.Decimal(value=f"{mid:.3f}"),
+            buy=responses_pb2.OtcQuoteSide(
+                price=common_pb2.Decimal(value=f"{mid - 0.01:.3f}"), amount=size
+            ),
+            sell=responses_pb2.OtcQuoteSide(
+                price=common_pb2.Decimal(value=f"{mid + 0.01:.3f}"), amount=size
+            ),
+        )
+
+    def _order(self, request: OtcOrderRequest) -> responses_pb2.Order:
+        """Orders are filled in full by a single execution"""
+        self._order_id += 1
+        order_id = f"fake:{self._order_id}"
+        symbol = request.symbol.as_string()
+        amount = common_pb2.Decimal(value=str(request.quantity))
+        price = common_pb2.Decimal(value=str(request.price))
+        fee = Decimal(str(request.quantity)) * Decimal(str(request.price)) * FEE_RATE
+        timestamp = Timestamp.utcnow().to_proto()
+        return responses_pb2.Order(
+            id=order_id,
+            client_order_id=request.client_order_id,
+            account_id=request.account_id,
+            exchange=Exchange.ICE.to_proto(),
+            product_symbol=symbol.split("-")[0][:-3],
+            symbol=request.symbol.to_proto(),
+            order_type=request.order_type.to_proto(),
+            order_state=OrderState.FILLED.to_proto(),
+            amount=amount,
+            price=price,
+            side=request.side.to_proto(),
+            created_timestamp=timestamp,
+            executed_amount=amount,
+            executed_avg_price=price,
+            executions=[
+                responses_pb2.Execution(
+                    id=f"{order_id}:1",
+                    order_id=order_id,
+                    client_order_id=request.client_order_id,
+                    account_id=request.account_id,
+                    exchange=Exchange.ICE.to_proto(),
+                    symbol=symbol,
+                    amount=amount,
+                    price=price,
+                    side=request.side.to_proto(),
+                    created_timestamp=timestamp,
+                    fee=responses_pb2.Fee(
+                        currency="USD",
+                        signed_amount=common_pb2.Decimal(value=str(-fee)),
+                        rate=common_pb2.Decimal(value=str(FEE_RATE)),
+                    ),
+                )
+            ],
+        )
+
+
+def request_from_proto(proto: requests_pb2.OtcRequest) -> OtcRequest | None:
+    """Parse a binary request, None when not supported"""
+    request: Any
+    match proto.WhichOneof("request"):
+        case "auth":
+            request = AuthRequest(token=proto.auth.token)
+        case "subscribe" | "unsubscribe" as method:
+            data = channel_from_proto(getattr(proto, method))
+            if data is None:
+                return None
+            if method == "subscribe":
+                request = SubscribeRequest(data=data)
+            else:
+                request = UnsubscribeRequest(data=data)
+        case "order":
+            order = proto.order
+            request = OtcOrderRequest(
+                account_id=order.account_id,
+                symbol=TradableSymbol.from_proto(order.symbol),
+                quantity=Decimal(order.quantity.value),
+                side=Side.from_proto(order.side),
+                price=Decimal(order.price.value),
+                order_type=OrderType.from_proto(order.order_type),
+                client_order_id=order.client_order_id,
+            )
+        case _:
+            return None
+    return OtcRequest(
+        id=proto.id, timestamp=Timestamp.from_proto(proto.timestamp), request=request
+    )
+
+
+def channel_from_proto(
+    proto: requests_pb2.Subscribe | requests_pb2.Unsubscribe,
+) -> SubscriptionChannel | None:
+    match proto.WhichOneof("channel"):
+        case "server_info":
+            return ServerInfoChannel()
+        case "orders":
+            return OrdersChannel()
+        case "tickers":
+            return TickersChannel(products=list(proto.tickers.products))
+        case "order_book_top":
+            return OrderBookTopChannel(products=list(proto.order_book_top.products))
+        case "rfq_channel":
+            rfq = proto.rfq_channel
+            return RfqChannel(
+                symbol=TradableSymbol.from_proto(rfq.symbol),
+                exchange=Exchange.from_proto(rfq.exchange),
+                size=Decimal(rfq.size.value or 1),
+            )
+        case "order_book":
+            book = proto.order_book
+            return OrderBookChannel(
+                symbol=TradableSymbol.from_proto(book.symbol),
+                exchange=Exchange.from_proto(book.exchange),
+            )
+        case _:
+            return None
+
+
+def request_from_json(payload: dict) -> OtcRequest | None:
+    """Parse a JSON request, None when not supported"""
+    request: Any
+    match payload.get("method"):
+        case "auth":
+            request = AuthRequest(token=payload.get("token", ""))
+        case "subscribe" | "unsubscribe" as method:
+            data = channel_from_json(payload.get("channel") or {})
+            if data is None:
+                return None
+            if method == "subscribe":
+                request = SubscribeRequest(data=data)
+            else:
+                request = UnsubscribeRequest(data=data)
+        case "order":
+            request = OtcOrderRequest.model_validate(payload)
+        case _:
+            return None
+    return OtcRequest(
+        id=payload["id"],
+        timestamp=Timestamp.from_any(payload["timestamp"]),
+        request=request,
+    )
+
+
+def channel_from_json(channel: dict) -> SubscriptionChannel | None:
+    for name, data in channel.items():
+        match name:
+            case "server_info":
+                return ServerInfoChannel()
+            case "orders":
+                return OrdersChannel()
+            case "tickers":
+                return TickersChannel.model_validate(data)
+            case "order_book_top":
+                return OrderBookTopChannel.model_validate(data)
+            case "rfq":
+                return RfqChannel.model_validate(
+                    dict(data, symbol=TradableSymbol.from_string(data["symbol"]))
+                )
+            case "order_book":
+                return OrderBookChannel.model_validate(
+                    dict(data, symbol=TradableSymbol.from_string(data["symbol"]))
+                )
+    return None
+
+
+def _timestamp(proto: timestamp_pb2.Timestamp) -> str:
+    return Timestamp.from_proto(proto).to_datetime().isoformat()
+
+
+def _price_amount(
+    proto: responses_pb2.PriceAmount | responses_pb2.OtcQuoteSide,
+) -> dict:
+    return {"price": proto.price.value, "amount": proto.amount.value}
+
+
+def _order_details(order: responses_pb2.Order) -> dict:
+    """State and executions of an order, as sent by the JSON endpoint"""
+    details: dict[str, Any] = {
+        "exchange": Exchange.from_proto(order.exchange).value,
+        "order_type": OrderType.from_proto(order.order_type).value,
+        "order_state": OrderState.from_proto(order.order_state).value,
+        "created_timestamp": _timestamp(order.created_timestamp),
+        "executions": [
+            {
+                "id": execution.id,
+                "order_id": execution.order_id,
+                "client_order_id": execution.client_order_id,
+                "account_id": execution.account_id,
+                "exchange": Exchange.from_proto(execution.exchange).value,
+                "symbol": execution.symbol,
+                "amount": execution.amount.value,
+                "price": execution.price.value,
+                "side": Side.from_proto(execution.side).value,
+                "created_timestamp": _timestamp(execution.created_timestamp),
+                "fee": {
+                    "currency": execution.fee.currency,
+                    "signed_amount": execution.fee.signed_amount.value,
+                    "rate": execution.fee.rate.value,
+                },
+            }
+            for execution in order.executions
+        ],
+    }
+    if order.HasField("executed_amount"):
+        details["executed_amount"] = order.executed_amount.value
+    if order.HasField("executed_avg_price"):
+        details["executed_avg_price"] = order.executed_avg_price.value
+    return details
+
+
+def response_json(proto: responses_pb2.OtcResponse) -> dict:
+    """JSON payload of a response, as sent by the JSON endpoint"""
+    payload: dict[str, Any] = {"id": proto.id, "timestamp": _timestamp(proto.timestamp)}
+    match proto.WhichOneof("response"):
+        case "auth":
+            payload.update(method="auth", message=proto.auth.message)
+        case "error":
+            payload.update(
+                method="otcerror",
+                code=OtcErrorCode.from_proto(proto.error.code).value,
+                message=proto.error.message,
+            )
+        case "subscription":
+            status = SubscriptionStatus.from_proto(proto.subscription.status)
+            payload.update(
+                method=(
+                    "subscribe"
+                    if status is SubscriptionStatus.SUBSCRIBED
+                    else "unsubscribe"
+                ),
+                channel=Channel.from_proto(proto.subscription.channel).value,
+                status=status.value,
+                message=proto.subscription.message,
+            )
+        case "order":
+            order = proto.order
+            payload.update(
+                method="order",
+                client_order_id=order.client_order_id,
+                account_id=order.account_id,
+                symbol=TradableSymbol.from_proto(order.symbol).as_string(),
+                product_symbol=order.product_symbol,
+                amount=order.amount.value,
+                side=order.side,
+                price=order.price.value,
+                **_order_details(order),
+            )
+    return payload
+
+
+def channel_json(proto: responses_pb2.ChannelMessage) -> dict:
+    """JSON payload of a channel message, as sent by the JSON endpoint"""
+    message: Any
+    match proto.WhichOneof("message"):
+        case "tickers":
+            message = [
+                {
+                    "symbol": ticker.symbol,
+                    "product_symbol": ticker.product_symbol,
+                    "timestamp": _timestamp(ticker.timestamp),
+                    "mid": ticker.mid.value,
+                }
+                for ticker in proto.tickers.tickers
+            ]
+        case "order_book_tops":
+            message = [
+                {
+                    "symbol": obt.symbol,
+                    "product_symbol": obt.product_symbol,
+                    "timestamp": _timestamp(obt.timestamp),
+                    "buy": _price_amount(obt.buy),
+                    "sell": _price_amount(obt.sell),
+                }
+                for obt in proto.order_book_tops.order_book_tops
+            ]
+        case "otc_quote":
+            quote = proto.otc_quote
+            message = {
+                "symbol": TradableSymbol.from_proto(quote.symbol).as_string(),
+                "exchange": Exchange.from_proto(quote.exchange).value,
+                "timestamp": _timestamp(quote.timestamp),
+                "product_symbol": quote.product_symbol,
+                "buy": _price_amount(quote.buy) if quote.HasField("buy") else None,
+                "sell": (_price_amount(quote.sell) if quote.HasField("sell") else None),
+            }
+        case "order":
+            order = proto.order
+            message = {
+                "id": order.id,
+                "client_order_id": order.client_order_id,
+                "account_id": order.account_id,
+                "symbol": TradableSymbol.from_proto(order.symbol).model_dump(),
+                "product_symbol": order.product_symbol,
+                "amount": order.amount.value,
+                "side": Side.from_proto(order.side).value,
+                "price": order.price.value,
+                **_order_details(order),
+            }
+        case "server_info":
+            message = {
+                "socket_uid": proto.server_info.socket_uid,
+                "age_millis": proto.server_info.age_millis,
+            }
+        case _:
+            message = {}
+    return {
+        "channel": Channel.from_proto(proto.channel).value,
+        "timestamp": _timestamp(proto.timestamp),
+        "message": message,
+    }
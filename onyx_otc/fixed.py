@@ -0,0 +1,228 @@
+"""Scaled integer fixed point numbers.
+
+A `Fixed` is an integer mantissa and a decimal scale, the number of digits
+after the decimal point, so that `Fixed(70125, 3)` is 70.125. Parsing the
+proto decimal strings, comparisons, addition, subtraction and
+multiplication are exact and use integer arithmetic only.
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import Any, Self
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+_POW10 = [10**i for i in range(64)]
+_HASH_MODULUS = sys.hash_info.modulus
+
+
+def _pow10(n: int) -> int:
+    return _POW10[n] if n < 64 else 10**n
+
+
+class Fixed:
+    """A decimal number as an integer mantissa scaled by `10**-scale`
+
+    Attributes:
+        mantissa: The integer value of the number times `10**scale`
+        scale: Number of decimal digits, non negative
+    """
+
+    __slots__ = ("mantissa", "scale")
+
+    mantissa: int
+    scale: int
+
+    def __init__(self, mantissa: int = 0, scale: int = 0) -> None:
+        if scale < 0:
+            raise ValueError("scale must be non negative")
+        self.mantissa = mantissa
+        self.scale = scale
+
+    @classmethod
+    def parse(cls, value: str, scale: int = 0) -> Self:
+        """Parse a decimal string, with at least `scale` decimal digits.
+
+        Strings with more decimal digits keep their own scale, no digit is
+        ever lost.
+        """
+        if "e" in value or "E" in value:
+            return cls.from_decimal(Decimal(value), scale)
+        whole, _, fraction = value.partition(".")
+        digits = len(fraction)
+        try:
+            mantissa = int(whole + fraction)
+        except ValueError:
+            raise ValueError(f"Invalid fixed point number: {value!r}") from None
+        if digits < scale:
+            mantissa *= _pow10(scale - digits)
+            digits = scale
+        fixed = object.__new__(cls)
+        fixed.mantissa = mantissa
+        fixed.scale = digits
+        return fixed
+
+    @classmethod
+    def from_decimal(cls, value: Decimal, scale: int = 0) -> Self:
+        sign, digits, exponent = value.as_tuple()
+        if not isinstance(exponent, int):
+            raise ValueError(f"Invalid fixed point number: {value}")
+        mantissa = int("".join(map(str, digits)) or "0")
+        if sign:
+            mantissa = -mantissa
+        if exponent > 0:
+            mantissa *= _pow10(exponent)
+            exponent = 0
+        return cls(mantissa, -exponent).rescale(max(scale, -exponent))
+
+    @classmethod
+    def from_any(cls, value: Any) -> Self:
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            return cls.parse(value)
+        if isinstance(value, int):
+            return cls(value)
+        if isinstance(value, Decimal):
+            return cls.from_decimal(value)
+        if isinstance(value, float):
+            return cls.parse(repr(value))
+        raise ValueError(f"Cannot convert {value!r} to Fixed")
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        # strict validation only accepts Fixed, so that in a union with
+        # Decimal other values are validated as Decimal
+        return core_schema.lax_or_strict_schema(
+            lax_schema=core_schema.no_info_plain_validator_function(cls.from_any),
+            strict_schema=core_schema.is_instance_schema(cls),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                str, when_used="json"
+            ),
+        )
+
+    def rescale(self, scale: int) -> Self:
+        """The same number with `scale` decimal digits, it must be exact"""
+        if scale == self.scale:
+            return self
+        if scale > self.scale:
+            return type(self)(self.mantissa * _pow10(scale - self.scale), scale)
+        mantissa, remainder = divmod(self.mantissa, _pow10(self.scale - scale))
+        if remainder:
+            raise ValueError(f"{self} cannot be represented with scale {scale}")
+        return type(self)(mantissa, scale)
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.mantissa).scaleb(-self.scale)
+
+    def _align(self, other: Fixed) -> tuple[int, int, int]:
+        if self.scale == other.scale:
+            return self.mantissa, other.mantissa, self.scale
+        if self.scale > other.scale:
+            factor = _pow10(self.scale - other.scale)
+            return self.mantissa, other.mantissa * factor, self.scale
+        factor = _pow10(other.scale - self.scale)
+        return self.mantissa * factor, other.mantissa, other.scale
+
+    def _coerce(self, other: object) -> Fixed | None:
+        if isinstance(other, Fixed):
+            return other
+        if isinstance(other, int):
+            return Fixed(other)
+        if isinstance(other, Decimal) and other.is_finite():
+            return Fixed.from_decimal(other)
+        return None
+
+    def __add__(self, other: object) -> Fixed:
+        if (fixed := self._coerce(other)) is None:
+            return NotImplemented
+        a, b, scale = self._align(fixed)
+        return Fixed(a + b, scale)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: object) -> Fixed:
+        if (fixed := self._coerce(other)) is None:
+            return NotImplemented
+        a, b, scale = self._align(fixed)
+        return Fixed(a - b, scale)
+
+    def __rsub__(self, other: object) -> Fixed:
+        if (fixed := self._coerce(other)) is None:
+            return NotImplemented
+        return fixed - self
+
+    def __mul__(self, other: object) -> Fixed:
+        if (fixed := self._coerce(other)) is None:
+            return NotImplemented
+        return Fixed(self.mantissa * fixed.mantissa, self.scale + fixed.scale)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> Fixed:
+        return Fixed(-self.mantissa, self.scale)
+
+    def __abs__(self) -> Fixed:
+        return Fixed(abs(self.mantissa), self.scale)
+
+    def __bool__(self) -> bool:
+        return self.mantissa != 0
+
+    def _compare(self, other: object) -> tuple[int, int] | None:
+        if (fixed := self._coerce(other)) is None:
+            return None
+        a, b, _ = self._align(fixed)
+        return a, b
+
+    def __eq__(self, other: object) -> bool:
+        if (pair := self._compare(other)) is None:
+            return NotImplemented
+        return pair[0] == pair[1]
+
+    def __lt__(self, other: object) -> bool:
+        if (pair := self._compare(other)) is None:
+            return NotImplemented
+        return pair[0] < pair[1]
+
+    def __le__(self, other: object) -> bool:
+        if (pair := self._compare(other)) is None:
+            return NotImplemented
+        return pair[0] <= pair[1]
+
+    def __gt__(self, other: object) -> bool:
+        if (pair := self._compare(other)) is None:
+            return NotImplemented
+        return pair[0] > pair[1]
+
+    def __ge__(self, other: object) -> bool:
+        if (pair := self._compare(other)) is None:
+            return NotImplemented
+        return pair[0] >= pair[1]
+
+    def __hash__(self) -> int:
+        # same hash as equal ints, Decimals and Fractions
+        inverse = pow(_pow10(self.scale), _HASH_MODULUS - 2, _HASH_MODULUS)
+        value = abs(self.mantissa) % _HASH_MODULUS * inverse % _HASH_MODULUS
+        value = value if self.mantissa >= 0 else -value
+        return -2 if value == -1 else value
+
+    def __float__(self) -> float:
+        return self.mantissa / _pow10(self.scale)
+
+    def __str__(self) -> str:
+        if not self.scale:
+            return str(self.mantissa)
+        digits = str(abs(self.mantissa)).rjust(self.scale + 1, "0")
+        sign = "-" if self.mantissa < 0 else ""
+        return f"{sign}{digits[: -self.scale]}.{digits[-self.scale :]}"
+
+    def __repr__(self) -> str:
+        return f"Fixed('{self}')"
+
+    def __reduce__(self) -> tuple[type[Fixed], tuple[int, int]]:
+        return type(self), (self.mantissa, self.scale)
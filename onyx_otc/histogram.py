@@ -0,0 +1,224 @@
+"""Log-linear latency histograms.
+
+Values are counted in buckets which are linear up to `2 ** (SUB_BITS + 1)`
+nanoseconds and then split every power of two in `2 ** SUB_BITS` linear
+sub-buckets, so that the relative error of a percentile is below
+`2 ** -SUB_BITS` (about 3%) while recording is a few integer operations.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, TypeVar
+
+from .conflation import ChannelMessage
+from .responses import OtcChannelMessage
+from .timestamp import NANOS_PER_SECOND, Timestamp
+from .types import Channel
+from .v2 import responses_pb2
+
+SUB_BITS = 5
+SUB_BUCKETS = 1 << SUB_BITS
+# buckets of 64 bit values
+BUCKETS = (64 - SUB_BITS) << SUB_BITS
+
+K = TypeVar("K")
+
+
+def bucket_index(value: int) -> int:
+    """Bucket of a non negative value"""
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BITS - 1
+    return ((shift + 1) << SUB_BITS) + (value >> shift) - SUB_BUCKETS
+
+
+def bucket_upper(index: int) -> int:
+    """Highest value counted in a bucket"""
+    if index < 2 * SUB_BUCKETS:
+        return index
+    shift = (index >> SUB_BITS) - 1
+    mantissa = (index & (SUB_BUCKETS - 1)) + SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+@dataclass
+class LatencyHistogram:
+    """Histogram of latencies in nanoseconds
+
+    Attributes:
+        count: Number of recorded values
+        total: Sum of the recorded values
+        min: Minimum recorded value
+        max: Maximum recorded value
+        negative: Negative values, recorded as 0, from clocks out of sync
+    """
+
+    count: int = 0
+    total: int = 0
+    min: int = 0
+    max: int = 0
+    negative: int = 0
+    counts: list[int] = field(default_factory=lambda: [0] * BUCKETS, repr=False)
+
+    def record(self, value: int) -> None:
+        if value < 0:
+            self.negative += 1
+            value = 0
+        self.counts[bucket_index(value)] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Value below which `q` percent of the recorded values fall"""
+        if not self.count:
+            return 0
+        target = max(int(q * self.count / 100 + 0.5), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(bucket_upper(index), self.max)
+        return self.max
+
+    @property
+    def p50(self) -> int:
+        return self.percentile(50)
+
+    @property
+    def p99(self) -> int:
+        return self.percentile(99)
+
+    @property
+    def p999(self) -> int:
+        return self.percentile(99.9)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add the values recorded by another histogram"""
+        if not other.count:
+            return
+        if not self.count or other.min < self.min:
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+        self.negative += other.negative
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+
+    def reset(self) -> None:
+        self.count = self.total = self.min = self.max = self.negative = 0
+        self.counts = [0] * BUCKETS
+
+    def summary(self) -> dict[str, float]:
+        """Count and percentiles in milliseconds"""
+        millis = 1000 / NANOS_PER_SECOND
+        return {
+            "count": self.count,
+            "p50": self.p50 * millis,
+            "p99": self.p99 * millis,
+            "p999": self.p999 * millis,
+            "max": self.max * millis,
+        }
+
+    def __str__(self) -> str:
+        s = self.summary()
+        return (
+            f"count={self.count} p50={s['p50']:.3f}ms p99={s['p99']:.3f}ms "
+            f"p999={s['p999']:.3f}ms max={s['max']:.3f}ms"
+        )
+
+
+@dataclass
+class FeedLatency:
+    """Feed and handler latency histograms of a client.
+
+    Feed latency is the receive time of a frame minus the server timestamp
+    of its channel message, handler latency is the time the event handlers
+    return minus the receive time. Both are recorded per channel, and the
+    feed latency of tickers and order book tops per product as well when
+    `per_product` is True, using the timestamp of each row.
+
+    Attributes:
+        per_product: Record feed latency per product
+        feed: Feed latency by channel
+        handler: Handler latency by channel
+        products: Feed latency by product symbol
+    """
+
+    per_product: bool = False
+    feed: dict[Channel, LatencyHistogram] = field(default_factory=dict)
+    handler: dict[Channel, LatencyHistogram] = field(default_factory=dict)
+    products: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def record_proto(self, proto: responses_pb2.ChannelMessage, recv_ns: int) -> None:
+        """Record the feed latency of a binary channel message"""
+        ts = proto.timestamp
+        channel = Channel.from_proto(proto.channel)
+        self._histogram(self.feed, channel).record(
+            recv_ns - ts.seconds * NANOS_PER_SECOND - ts.nanos
+        )
+        if self.per_product:
+            if proto.HasField("tickers"):
+                self._record_rows(proto.tickers.tickers, recv_ns)
+            elif proto.HasField("order_book_tops"):
+                self._record_rows(proto.order_book_tops.order_book_tops, recv_ns)
+
+    def record_message(self, message: OtcChannelMessage, recv_ns: int) -> None:
+        """Record the feed latency of a channel message model"""
+        self._histogram(self.feed, message.channel).record(recv_ns - message.timestamp)
+        if self.per_product:
+            products = self.products
+            rows: list = []
+            if tickers := message.tickers():
+                rows = tickers.tickers
+            elif obts := message.order_book_tops():
+                rows = obts.order_book_tops
+            for row in rows:
+                self._histogram(products, row.product_symbol).record(
+                    recv_ns - row.timestamp
+                )
+
+    def record_handler(
+        self,
+        message: ChannelMessage,
+        latency_ns: int,
+    ) -> None:
+        """Record the handler latency of a channel message"""
+        if isinstance(message, OtcChannelMessage):
+            channel = message.channel
+        else:
+            channel = Channel.from_proto(message.channel)
+        self._histogram(self.handler, channel).record(latency_ns)
+
+    def reset(self) -> None:
+        self.feed.clear()
+        self.handler.clear()
+        self.products.clear()
+
+    def _record_rows(
+        self,
+        rows: Iterable[responses_pb2.Ticker | responses_pb2.OrderBookTop],
+        recv_ns: int,
+    ) -> None:
+        products = self.products
+        for row in rows:
+            self._histogram(products, row.product_symbol).record(
+                recv_ns - Timestamp.from_proto(row.timestamp)
+            )
+
+    @staticmethod
+    def _histogram(histograms: dict[K, LatencyHistogram], key: K) -> LatencyHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram()
+        return histogram
@@ -0,0 +1,367 @@
+"""Client metrics: throughput, bytes, decode and handler time, queue depths.
+
+Metrics are kept by `ClientMetrics`, updated by the client when passed as
+`metrics`, and can be exported in the Prometheus text format on a local
+HTTP port with `MetricsExporter` or logged periodically with `log_metrics`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+from aiohttp import web
+
+from .decoding import DecodedMessage
+from .responses import (
+    OrderBooks,
+    OrderBookTops,
+    OtcChannelMessage,
+    OtcOrder,
+    OtcQuote,
+    OtcResponse,
+    Tickers,
+)
+from .timestamp import NANOS_PER_SECOND
+from .types import Channel
+from .v2 import responses_pb2
+
+if TYPE_CHECKING:
+    from .websocket_v2 import OnyxWebsocketClientV2
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# busiest subscriptions in the stats line
+TOP_SUBSCRIPTIONS = 5
+
+
+def message_products(
+    message: responses_pb2.ChannelMessage | OtcChannelMessage,
+) -> list[str]:
+    """Product symbols of the rows of a channel message, one per row"""
+    if isinstance(message, OtcChannelMessage):
+        data = message.data
+        if isinstance(data, Tickers):
+            return [row.product_symbol for row in data.tickers]
+        if isinstance(data, OrderBookTops):
+            return [row.product_symbol for row in data.order_book_tops]
+        if isinstance(data, OrderBooks):
+            return [row.product_symbol for row in data.order_books]
+        if isinstance(data, OtcQuote | OtcOrder):
+            return [data.product_symbol]
+        return []
+    match message.WhichOneof("message"):
+        case "tickers":
+            return [row.product_symbol for row in message.tickers.tickers]
+        case "order_book_tops":
+            return [
+                row.product_symbol for row in message.order_book_tops.order_book_tops
+            ]
+        case "order_books":
+            return [row.product_symbol for row in message.order_books.order_books]
+        case "otc_quote":
+            return [message.otc_quote.product_symbol]
+        case "order":
+            return [message.order.product_symbol]
+    return []
+
+
+@dataclass
+class ClientMetrics:
+    """Counters of the frames received and handled by a client
+
+    Attributes:
+        started_ns: Monotonic time the counters were started or reset
+        frames: Frames received
+        bytes: Bytes received
+        responses: Responses received
+        decode_ns: Time spent decoding frames
+        handler_calls: Calls of the event handlers
+        handler_ns: Time spent in the event handlers
+        connections: Successful connections, every one after the first
+            is a reconnect
+        messages: Channel messages received by channel
+        channel_bytes: Bytes received by channel
+        rows: Rows received by channel and product symbol, the unit of
+            tickers and order book top subscriptions
+        snapshot_ns: Monotonic time a snapshot was taken
+    """
+
+    started_ns: int = field(default_factory=time.monotonic_ns)
+    frames: int = 0
+    bytes: int = 0
+    responses: int = 0
+    decode_ns: int = 0
+    handler_calls: int = 0
+    handler_ns: int = 0
+    connections: int = 0
+    messages: Counter[Channel] = field(default_factory=Counter)
+    channel_bytes: Counter[Channel] = field(default_factory=Counter)
+    rows: Counter[tuple[Channel, str]] = field(default_factory=Counter)
+    snapshot_ns: int = 0
+
+    @property
+    def reconnects(self) -> int:
+        return max(self.connections - 1, 0)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the counters were started"""
+        return (time.monotonic_ns() - self.started_ns) / NANOS_PER_SECOND
+
+    @property
+    def frames_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.frames / elapsed if elapsed else 0.0
+
+    @property
+    def mean_decode_ns(self) -> float:
+        return self.decode_ns / self.frames if self.frames else 0.0
+
+    @property
+    def mean_handler_ns(self) -> float:
+        return self.handler_ns / self.handler_calls if self.handler_calls else 0.0
+
+    def record_frame(self, message: DecodedMessage, size: int, decode_ns: int) -> None:
+        """Count a received frame, its decoded message and decode time"""
+        self.frames += 1
+        self.bytes += size
+        self.decode_ns += decode_ns
+        if message is None:
+            return
+        if isinstance(message, OtcResponse):
+            self.responses += 1
+            return
+        if isinstance(message, OtcChannelMessage):
+            channel = message.channel
+        else:
+            channel = Channel.from_proto(message.channel)
+        self.messages[channel] += 1
+        self.channel_bytes[channel] += size
+        if products := message_products(message):
+            self.rows.update((channel, product) for product in products)
+
+    def record_handler(self, elapsed_ns: int) -> None:
+        self.handler_calls += 1
+        self.handler_ns += elapsed_ns
+
+    def connected(self) -> None:
+        self.connections += 1
+
+    def snapshot(self) -> Self:
+        """A copy of the counters, to compute rates over an interval"""
+        snapshot = copy.deepcopy(self)
+        snapshot.snapshot_ns = time.monotonic_ns()
+        return snapshot
+
+    def since(self, previous: ClientMetrics | None) -> float:
+        """Seconds since a snapshot was taken, or since the counters were
+        started when there is no snapshot"""
+        if previous is None or not previous.snapshot_ns:
+            return self.elapsed
+        return (time.monotonic_ns() - previous.snapshot_ns) / NANOS_PER_SECOND
+
+    def rates(
+        self, previous: ClientMetrics | None = None
+    ) -> dict[tuple[Channel, str], float]:
+        """Rows per second by subscription since a previous snapshot"""
+        elapsed = self.since(previous)
+        if elapsed <= 0:
+            return {}
+        if previous is None:
+            return {key: count / elapsed for key, count in self.rows.items()}
+        return {
+            key: (count - previous.rows[key]) / elapsed
+            for key, count in self.rows.items()
+            if count > previous.rows[key]
+        }
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{label}"' for key, label in labels.items()) + "}"
+
+
+def prometheus_text(client: OnyxWebsocketClientV2) -> str:
+    """Metrics of a client in the Prometheus text exposition format"""
+    metrics = client.metrics or ClientMetrics()
+    families: list[tuple[str, str, str, list[tuple[str, float]]]] = [
+        ("frames_total", "counter", "Frames received", [("", metrics.frames)]),
+        ("received_bytes_total", "counter", "Bytes received", [("", metrics.bytes)]),
+        (
+            "responses_total",
+            "counter",
+            "Responses received",
+            [("", metrics.responses)],
+        ),
+        (
+            "channel_messages_total",
+            "counter",
+            "Channel messages received by channel",
+            [
+                (_labels(channel=str(channel)), count)
+                for channel, count in sorted(metrics.messages.items())
+            ],
+        ),
+        (
+            "channel_bytes_total",
+            "counter",
+            "Bytes received by channel",
+            [
+                (_labels(channel=str(channel)), count)
+                for channel, count in sorted(metrics.channel_bytes.items())
+            ],
+        ),
+        (
+            "subscription_rows_total",
+            "counter",
+            "Rows received by channel and product symbol",
+            [
+                (_labels(channel=str(channel), product=product), count)
+                for (channel, product), count in sorted(metrics.rows.items())
+            ],
+        ),
+        (
+            "decode_seconds_total",
+            "counter",
+            "Time spent decoding frames",
+            [("", metrics.decode_ns / NANOS_PER_SECOND)],
+        ),
+        (
+            "handler_seconds_total",
+            "counter",
+            "Time spent in the event handlers",
+            [("", metrics.handler_ns / NANOS_PER_SECOND)],
+        ),
+        (
+            "handler_calls_total",
+            "counter",
+            "Calls of the event handlers",
+            [("", metrics.handler_calls)],
+        ),
+        (
+            "reconnects_total",
+            "counter",
+            "Reconnections to the server",
+            [("", metrics.reconnects)],
+        ),
+        (
+            "write_queue_depth",
+            "gauge",
+            "Requests waiting to be written",
+            [("", client.write_queue_depth)],
+        ),
+        (
+            "dispatch_queue_depth",
+            "gauge",
+            "Channel messages waiting to be dispatched",
+            [("", client.dispatch_queue_depth)],
+        ),
+    ]
+    lines = []
+    for name, kind, help_, samples in families:
+        name = f"onyx_{name}"
+        lines.append(f"# HELP {name} {help_}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(f"{name}{labels} {value}" for labels, value in samples)
+    return "\n".join(lines) + "\n"
+
+
+def stats_line(
+    client: OnyxWebsocketClientV2, previous: ClientMetrics | None = None
+) -> str:
+    """One line summary of the metrics of a client, with rates since a
+    previous snapshot or since the counters were started"""
+    metrics = client.metrics or ClientMetrics()
+    elapsed = metrics.since(previous) or 1.0
+    previous = previous or ClientMetrics()
+    frames = metrics.frames - previous.frames
+    calls = metrics.handler_calls - previous.handler_calls
+    decode_us = (metrics.decode_ns - previous.decode_ns) / max(frames, 1) / 1000
+    handler_us = (metrics.handler_ns - previous.handler_ns) / max(calls, 1) / 1000
+    kib = (metrics.bytes - previous.bytes) / 1024
+    line = (
+        f"{frames / elapsed:,.0f} frames/s {kib / elapsed:,.1f} KiB/s "
+        f"decode {decode_us:,.1f} us handler {handler_us:,.1f} us "
+        f"write queue {client.write_queue_depth} reconnects {metrics.reconnects}"
+    )
+    rates = sorted(metrics.rates(previous).items(), key=lambda item: -item[1])
+    if rates:
+        line += " - " + ", ".join(
+            f"{channel}:{product or '*'} {rate:,.1f}/s"
+            for (channel, product), rate in rates[:TOP_SUBSCRIPTIONS]
+        )
+    return line
+
+
+async def log_metrics(client: OnyxWebsocketClientV2, interval: float = 10.0) -> None:
+    """Log the metrics of a client every `interval` seconds until cancelled"""
+    if client.metrics is None:
+        client.metrics = ClientMetrics()
+    previous = client.metrics.snapshot()
+    while True:
+        await asyncio.sleep(interval)
+        logger.info(stats_line(client, previous))
+        previous = client.metrics.snapshot()
+
+
+@dataclass
+class MetricsExporter:
+    """Serve the metrics of a client in the Prometheus text format
+
+    Attributes:
+        client: Client whose metrics are served, metrics are enabled
+            if not set
+        host: Interface to listen on, local only by default
+        port: Port to listen on, any free port when 0
+        path: Path of the metrics endpoint
+    """
+
+    client: OnyxWebsocketClientV2
+    host: str = "127.0.0.1"
+    port: int = 9464
+    path: str = "/metrics"
+    _runner: web.AppRunner | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.client.metrics is None:
+            self.client.metrics = ClientMetrics()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    async def handle(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=prometheus_text(self.client).encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+    async def start(self) -> None:
+        """Start listening, setting `port` when it was 0"""
+        app = web.Application()
+        app.router.add_get(self.path, self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+        logger.info("Serving metrics on %s", self.url)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
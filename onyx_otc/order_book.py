@@ -0,0 +1,214 @@
+"""Local full depth order books maintained from the ORDER_BOOK channel"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from .responses import OrderBook, OrderBooks
+from .timestamp import Timestamp
+from .types import Exchange
+from .v2 import responses_pb2
+
+
+def _proto_levels(
+    levels: Iterable[responses_pb2.OrderBookLevel],
+) -> Iterator[tuple[float, float]]:
+    for level in levels:
+        yield float(level.price.value or 0), float(level.amount.value or 0)
+
+
+@dataclass(slots=True)
+class BookSide:
+    """One side of an order book as parallel sorted arrays of doubles.
+
+    Prices are stored as sort keys in ascending order with the best level
+    last, so that the most active part of the book sits at the end of the
+    arrays: bids use the price as key, asks use the negated price.
+    """
+
+    is_bid: bool
+    keys: array = field(default_factory=lambda: array("d"))
+    amounts: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Iterate over (price, amount) levels from the best one"""
+        for i in range(len(self.keys) - 1, -1, -1):
+            yield self._price(self.keys[i]), self.amounts[i]
+
+    def _key(self, price: float) -> float:
+        return price if self.is_bid else -price
+
+    # the key mapping is its own inverse
+    _price = _key
+
+    def update(self, price: float, amount: float) -> None:
+        """Set the amount at a price level, removing the level if amount <= 0"""
+        key = self._key(price)
+        keys = self.keys
+        i = bisect_left(keys, key)
+        found = i < len(keys) and keys[i] == key
+        if amount > 0:
+            if found:
+                self.amounts[i] = amount
+            else:
+                keys.insert(i, key)
+                self.amounts.insert(i, amount)
+        elif found:
+            del keys[i]
+            del self.amounts[i]
+
+    def replace(self, levels: Iterable[tuple[float, float]]) -> None:
+        """Replace all levels of the side, reusing the arrays"""
+        del self.keys[:]
+        del self.amounts[:]
+        for price, amount in sorted((self._key(p), a) for p, a in levels if a > 0):
+            self.keys.append(price)
+            self.amounts.append(amount)
+
+    def clear(self) -> None:
+        del self.keys[:]
+        del self.amounts[:]
+
+    def best(self) -> tuple[float, float] | None:
+        """Best (price, amount) level in O(1)"""
+        if self.keys:
+            return self._price(self.keys[-1]), self.amounts[-1]
+        return None
+
+    def level(self, depth: int) -> tuple[float, float] | None:
+        """The (price, amount) level at a given depth, 0 being the best one"""
+        if 0 <= depth < len(self.keys):
+            i = len(self.keys) - 1 - depth
+            return self._price(self.keys[i]), self.amounts[i]
+        return None
+
+    def amount_at(self, price: float) -> float:
+        """Amount resting at a price, 0 if there is no such level"""
+        key = self._key(price)
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.amounts[i]
+        return 0.0
+
+    def depth_of(self, price: float) -> int:
+        """Number of levels with a strictly better price than `price`"""
+        return len(self.keys) - bisect_right(self.keys, self._key(price))
+
+    def levels(self, depth: int) -> list[tuple[float, float]]:
+        """The first `depth` levels from the best one"""
+        n = len(self.keys)
+        return [
+            (self._price(self.keys[i]), self.amounts[i])
+            for i in range(n - 1, max(n - 1 - depth, -1), -1)
+        ]
+
+    def amount_to_depth(self, depth: int) -> float:
+        """Cumulative amount of the first `depth` levels"""
+        n = len(self.amounts)
+        return sum(self.amounts[max(n - depth, 0) :])
+
+
+@dataclass(slots=True)
+class LocalOrderBook:
+    """Full depth order book for a symbol on an exchange"""
+
+    symbol: str
+    exchange: Exchange
+    product_symbol: str = ""
+    timestamp: Timestamp = Timestamp()
+    bids: BookSide = field(default_factory=lambda: BookSide(is_bid=True))
+    asks: BookSide = field(default_factory=lambda: BookSide(is_bid=False))
+
+    def best_bid(self) -> tuple[float, float] | None:
+        return self.bids.best()
+
+    def best_ask(self) -> tuple[float, float] | None:
+        return self.asks.best()
+
+    def mid(self) -> float | None:
+        if self.bids.keys and self.asks.keys:
+            return 0.5 * (self.bids.keys[-1] - self.asks.keys[-1])
+        return None
+
+    def spread(self) -> float | None:
+        if self.bids.keys and self.asks.keys:
+            return -self.asks.keys[-1] - self.bids.keys[-1]
+        return None
+
+    def apply_proto(self, proto: responses_pb2.OrderBook, snapshot: bool) -> None:
+        """Apply an order book message from the binary protocol"""
+        self.product_symbol = proto.product_symbol
+        self.timestamp = Timestamp.from_proto(proto.timestamp)
+        self._apply(_proto_levels(proto.bids), _proto_levels(proto.asks), snapshot)
+
+    def apply(self, order_book: OrderBook, snapshot: bool) -> None:
+        """Apply an order book model, as decoded from the JSON protocol"""
+        self.product_symbol = order_book.product_symbol
+        self.timestamp = order_book.timestamp
+        bids = ((float(lv.price), float(lv.amount)) for lv in order_book.bids)
+        asks = ((float(lv.price), float(lv.amount)) for lv in order_book.asks)
+        self._apply(bids, asks, snapshot)
+
+    def _apply(
+        self,
+        bids: Iterable[tuple[float, float]],
+        asks: Iterable[tuple[float, float]],
+        snapshot: bool,
+    ) -> None:
+        if snapshot:
+            self.bids.replace(bids)
+            self.asks.replace(asks)
+        else:
+            for price, amount in bids:
+                self.bids.update(price, amount)
+            for price, amount in asks:
+                self.asks.update(price, amount)
+
+
+@dataclass
+class OrderBookEngine:
+    """Local order books keyed by (symbol, exchange).
+
+    By default each order book message is applied incrementally: every level
+    sets the amount at its price and a zero amount removes the level.
+    When `snapshot` is True each message replaces the whole book instead.
+    """
+
+    snapshot: bool = False
+    books: dict[tuple[str, Exchange], LocalOrderBook] = field(default_factory=dict)
+
+    def get(self, symbol: str, exchange: Exchange) -> LocalOrderBook | None:
+        return self.books.get((symbol, exchange))
+
+    def _book(self, symbol: str, exchange: Exchange) -> LocalOrderBook:
+        key = (symbol, exchange)
+        book = self.books.get(key)
+        if book is None:
+            book = self.books[key] = LocalOrderBook(symbol=symbol, exchange=exchange)
+        return book
+
+    def apply_proto(self, proto: responses_pb2.OrderBooks) -> None:
+        for order_book in proto.order_books:
+            exchange = Exchange.from_proto(order_book.exchange)
+            self._book(order_book.symbol, exchange).apply_proto(
+                order_book, self.snapshot
+            )
+
+    def apply(self, order_books: OrderBooks) -> None:
+        for order_book in order_books.order_books:
+            self._book(order_book.symbol, order_book.exchange).apply(
+                order_book, self.snapshot
+            )
+
+    def remove(self, symbol: str, exchange: Exchange) -> None:
+        self.books.pop((symbol, exchange), None)
+
+    def clear(self) -> None:
+        """Remove all books, they are stale once the connection is lost"""
+        self.books.clear()
@@ -0,0 +1,100 @@
+"""Order entry with pre-encoded request templates.
+
+A template prepares the new order request of an account, symbol, side and
+order type once, so that sending an order only patches the request id,
+timestamp, price, quantity and client order id before serializing it,
+rather than building and validating the request models every time.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from .common import TradableSymbol
+from .fixed import Fixed
+from .requests import OtcOrderRequest
+from .timestamp import NANOS_PER_SECOND, Timestamp
+from .types import Method, OrderType, Side
+from .v2 import common_pb2, requests_pb2
+from .writer import Frame
+
+
+@dataclass(slots=True)
+class OrderTemplate:
+    """A new order request encoded once and patched for every order
+
+    Attributes:
+        account_id: Account placing the orders
+        symbol: Symbol of the orders
+        side: Side of the orders
+        order_type: Type of the orders
+        binary: Encode protobuf frames rather than JSON ones
+    """
+
+    account_id: str
+    symbol: TradableSymbol
+    side: Side
+    order_type: OrderType = OrderType.FILL_OR_KILL
+    binary: bool = True
+    _proto: requests_pb2.OtcRequest = field(init=False, repr=False)
+    _order: requests_pb2.NewOrderRequest = field(init=False, repr=False)
+    _price: common_pb2.Decimal = field(init=False, repr=False)
+    _quantity: common_pb2.Decimal = field(init=False, repr=False)
+    _json: dict[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        order = OtcOrderRequest(
+            account_id=self.account_id,
+            symbol=self.symbol,
+            quantity=Decimal(0),
+            side=self.side,
+            price=Decimal(0),
+            order_type=self.order_type,
+        )
+        self._proto = requests_pb2.OtcRequest(
+            method=Method.ORDER.to_proto(), order=order.to_proto()
+        )
+        # references to the nested messages patched by every encode
+        self._order = self._proto.order
+        self._price = self._order.price
+        self._quantity = self._order.quantity
+        self._json = order.model_dump(mode="json")
+
+    def encode(
+        self,
+        request_id: str,
+        price: Decimal | Fixed | str,
+        quantity: Decimal | Fixed | str,
+        client_order_id: str = "",
+        timestamp_ns: int | None = None,
+    ) -> Frame:
+        """The frame of an order, timestamped now unless `timestamp_ns` is
+        given"""
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        if not self.binary:
+            return json.dumps(
+                dict(
+                    id=request_id,
+                    method=Method.ORDER.value,
+                    timestamp=Timestamp(timestamp_ns).to_datetime().isoformat(),
+                    **dict(
+                        self._json,
+                        quantity=str(quantity),
+                        price=str(price),
+                        client_order_id=client_order_id,
+                    ),
+                )
+            )
+        proto = self._proto
+        proto.id = request_id
+        timestamp = proto.timestamp
+        timestamp.seconds, timestamp.nanos = divmod(timestamp_ns, NANOS_PER_SECOND)
+        self._price.value = str(price)
+        self._quantity.value = str(quantity)
+        self._order.client_order_id = client_order_id
+        return proto.SerializeToString()
@@ -0,0 +1,208 @@
+"""Book keeping of orders and their executions.
+
+The `OrderManager` keeps the live state of orders from the order responses
+and the messages of the orders channel, applying every update
+incrementally, so that orders are found by id or client order id and the
+aggregates of an account, or of an account and symbol, are read in O(1).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import islice
+
+from .responses import Execution, OtcOrder
+from .types import Side
+from .v2 import responses_pb2
+
+ZERO = Decimal(0)
+
+
+@dataclass
+class OrderTotals:
+    """Aggregates of open orders and executions
+
+    Attributes:
+        open_orders: Number of orders which are not in a terminal state
+        open_amount: Amount of the open orders not executed yet
+        executions: Number of executions
+        bought: Executed amount of buy executions
+        sold: Executed amount of sell executions
+        bought_notional: Sum of amount times price of buy executions
+        sold_notional: Sum of amount times price of sell executions
+        fees: Signed fee amounts by currency
+    """
+
+    open_orders: int = 0
+    open_amount: Decimal = ZERO
+    executions: int = 0
+    bought: Decimal = ZERO
+    sold: Decimal = ZERO
+    bought_notional: Decimal = ZERO
+    sold_notional: Decimal = ZERO
+    fees: dict[str, Decimal] = field(default_factory=dict)
+
+    @property
+    def position(self) -> Decimal:
+        """Net executed amount, positive when more was bought than sold"""
+        return self.bought - self.sold
+
+    @property
+    def avg_buy_price(self) -> Decimal | None:
+        return self.bought_notional / self.bought if self.bought else None
+
+    @property
+    def avg_sell_price(self) -> Decimal | None:
+        return self.sold_notional / self.sold if self.sold else None
+
+    def add_open(self, order: OtcOrder, sign: int) -> None:
+        self.open_orders += sign
+        self.open_amount += sign * order.remaining_amount
+
+    def add_execution(self, execution: Execution) -> None:
+        self.executions += 1
+        notional = execution.amount * execution.price
+        if execution.side is Side.SELL:
+            self.sold += execution.amount
+            self.sold_notional += notional
+        else:
+            self.bought += execution.amount
+            self.bought_notional += notional
+        if (fee := execution.fee) is not None:
+            self.fees[fee.currency] = (
+                self.fees.get(fee.currency, ZERO) + fee.signed_amount
+            )
+
+
+@dataclass
+class OrderManager:
+    """Live orders by id and client order id, with their aggregates
+
+    Executions are deduplicated by id, so that the repeated executions of
+    successive updates of an order are counted once, and orders keep every
+    execution received for them. An order in a terminal state ignores later
+    updates which are not terminal, as they are stale, and updates of pruned
+    orders are ignored.
+
+    Attributes:
+        orders: Orders by id
+        client_orders: Orders by client order id, when given
+        execution_ids: Ids of the executions of the orders kept
+        totals: Aggregates by account id and symbol
+        account_totals: Aggregates by account id
+        pruned: Ids of the orders removed by `prune`, the oldest are
+            forgotten beyond `max_pruned`
+        max_pruned: Maximum number of pruned order ids remembered
+    """
+
+    orders: dict[str, OtcOrder] = field(default_factory=dict)
+    client_orders: dict[str, OtcOrder] = field(default_factory=dict)
+    execution_ids: set[str] = field(default_factory=set)
+    totals: dict[tuple[str, str], OrderTotals] = field(default_factory=dict)
+    account_totals: dict[str, OrderTotals] = field(default_factory=dict)
+    pruned: dict[str, None] = field(default_factory=dict)
+    max_pruned: int = 100_000
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def get(self, order_id: str) -> OtcOrder | None:
+        return self.orders.get(order_id)
+
+    def get_by_client_order_id(self, client_order_id: str) -> OtcOrder | None:
+        return self.client_orders.get(client_order_id)
+
+    def totals_for(self, account_id: str, symbol: str | None = None) -> OrderTotals:
+        """Aggregates of an account, or of an account and symbol"""
+        if symbol is None:
+            totals = self.account_totals.get(account_id)
+        else:
+            totals = self.totals.get((account_id, symbol))
+        return totals if totals is not None else OrderTotals()
+
+    def open_orders(self) -> list[OtcOrder]:
+        """Orders which are not in a terminal state"""
+        return [
+            order for order in self.orders.values() if not order.order_state.is_terminal
+        ]
+
+    def apply_proto(self, proto: responses_pb2.Order) -> list[Execution]:
+        return self.apply(OtcOrder.from_proto(proto, trusted=True))
+
+    def apply(self, order: OtcOrder) -> list[Execution]:
+        """Apply an order update, returning its executions not seen before"""
+        if order.id in self.pruned:
+            return []
+        previous = self.orders.get(order.id)
+        if (
+            previous is not None
+            and previous.order_state.is_terminal
+            and not order.order_state.is_terminal
+        ):
+            return []
+        aggregates = self._aggregates(order)
+        if previous is not None and not previous.order_state.is_terminal:
+            for totals in self._aggregates(previous):
+                totals.add_open(previous, -1)
+        if not order.order_state.is_terminal:
+            for totals in aggregates:
+                totals.add_open(order, 1)
+        executions = [
+            execution
+            for execution in order.executions
+            if execution.id not in self.execution_ids
+        ]
+        for execution in executions:
+            self.execution_ids.add(execution.id)
+            for totals in aggregates:
+                totals.add_execution(execution)
+        if previous is not None and previous.executions:
+            order = order.model_copy(
+                update=dict(executions=previous.executions + executions)
+            )
+        self.orders[order.id] = order
+        if order.client_order_id:
+            self.client_orders[order.client_order_id] = order
+        return executions
+
+    def prune(self) -> int:
+        """Remove orders in a terminal state and their execution ids,
+        keeping their aggregates, and return the number removed.
+
+        Their ids are remembered in `pruned`, so that late duplicates of
+        removed orders add nothing to the aggregates.
+        """
+        terminal = [
+            order for order in self.orders.values() if order.order_state.is_terminal
+        ]
+        pruned = self.pruned
+        for order in terminal:
+            del self.orders[order.id]
+            if self.client_orders.get(order.client_order_id) is order:
+                del self.client_orders[order.client_order_id]
+            self.execution_ids.difference_update(
+                execution.id for execution in order.executions
+            )
+            pruned[order.id] = None
+        for order_id in list(islice(pruned, max(len(pruned) - self.max_pruned, 0))):
+            del pruned[order_id]
+        return len(terminal)
+
+    def clear(self) -> None:
+        self.orders.clear()
+        self.client_orders.clear()
+        self.execution_ids.clear()
+        self.totals.clear()
+        self.account_totals.clear()
+        self.pruned.clear()
+
+    def _aggregates(self, order: OtcOrder) -> tuple[OrderTotals, OrderTotals]:
+        key = (order.account_id, order.symbol.as_string())
+        totals = self.totals.get(key)
+        if totals is None:
+            totals = self.totals[key] = OrderTotals()
+        account = self.account_totals.get(order.account_id)
+        if account is None:
+            account = self.account_totals[order.account_id] = OrderTotals()
+        return totals, account
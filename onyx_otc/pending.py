@@ -0,0 +1,143 @@
+"""Correlation of requests with their responses by request id"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from .requests import OtcRequest
+from .responses import OtcResponse, OtcResponseError
+from .types import Method
+
+
+@dataclass
+class RequestStats:
+    """Round trip latency of the requests of a method
+
+    Attributes:
+        count: Requests answered by a response
+        errors: Requests answered by an error response
+        timeouts: Requests which expired without a response
+        total_ns: Sum of round trip times in nanoseconds
+        max_ns: Maximum round trip time in nanoseconds
+    """
+
+    count: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def record(self, elapsed_ns: int) -> None:
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+
+
+@dataclass(slots=True)
+class PendingRequest:
+    """A request waiting for its response"""
+
+    method: Method
+    sent_ns: int
+    future: asyncio.Future[OtcResponse]
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class PendingRequests:
+    """Requests waiting for a response, indexed by request id.
+
+    Each request expires after `timeout` seconds, failing its future with
+    a `TimeoutError`; error responses fail the future with an
+    `OtcResponseError`.
+    """
+
+    timeout: float = 10.0
+    stats: dict[Method, RequestStats] = field(default_factory=dict)
+    _pending: dict[str, PendingRequest] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._pending
+
+    def add(
+        self, request: OtcRequest, timeout: float | None = None
+    ) -> asyncio.Future[OtcResponse]:
+        """Track a request and return the future of its response"""
+        return self.track(request.id, request.method, timeout)
+
+    def track(
+        self, request_id: str, method: Method, timeout: float | None = None
+    ) -> asyncio.Future[OtcResponse]:
+        """Track a request sent as a frame by its id and method"""
+        loop = asyncio.get_running_loop()
+        pending = PendingRequest(
+            method=method,
+            sent_ns=time.monotonic_ns(),
+            future=loop.create_future(),
+        )
+        timeout = self.timeout if timeout is None else timeout
+        if timeout > 0:
+            pending.timer = loop.call_later(timeout, self._expire, request_id)
+        self._pending[request_id] = pending
+        return pending.future
+
+    def discard(self, request_id: str) -> None:
+        """Stop tracking a request which could not be sent"""
+        pending = self._pending.pop(request_id, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        pending.future.cancel()
+
+    def resolve(self, response: OtcResponse) -> bool:
+        """Resolve the request a response belongs to, if any"""
+        pending = self._pending.pop(response.id, None)
+        if pending is None:
+            return False
+        if pending.timer is not None:
+            pending.timer.cancel()
+        stats = self._stats(pending.method)
+        stats.record(time.monotonic_ns() - pending.sent_ns)
+        if pending.future.done():
+            return True
+        if response.error():
+            stats.errors += 1
+            pending.future.set_exception(OtcResponseError(response))
+        else:
+            pending.future.set_result(response)
+        return True
+
+    def fail_all(self, exc: BaseException) -> None:
+        """Fail every pending request, when the connection is lost"""
+        pending_requests, self._pending = self._pending, {}
+        for pending in pending_requests.values():
+            if pending.timer is not None:
+                pending.timer.cancel()
+            if not pending.future.done():
+                pending.future.set_exception(exc)
+
+    def _stats(self, method: Method) -> RequestStats:
+        stats = self.stats.get(method)
+        if stats is None:
+            stats = self.stats[method] = RequestStats()
+        return stats
+
+    def _expire(self, request_id: str) -> None:
+        pending = self._pending.pop(request_id, None)
+        if pending is None:
+            return
+        self._stats(pending.method).timeouts += 1
+        if not pending.future.done():
+            pending.future.set_exception(
+                TimeoutError(f"No response to request {request_id}")
+            )
@@ -0,0 +1,195 @@
+"""A pool of websocket connections sharing market data subscriptions"""
+
+from __future__ import annotations
+
+import asyncio
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from .websocket_v2 import (
+    EventHandler,
+    OnyxWebsocketClientV2,
+    ResponseHandler,
+    on_event,
+    on_response,
+)
+
+
+def stable_shard(product: str, shards: int) -> int:
+    """Shard of a product, stable across processes and restarts"""
+    return zlib.crc32(product.encode()) % shards
+
+
+@dataclass
+class ShardedClient:
+    """Spread ticker and order book top subscriptions over N connections.
+
+    Each product is assigned to one connection, by a stable hash of its
+    symbol when first subscribed, or by measured message rate after calling
+    `rebalance`. Every connection authenticates and restores its own
+    subscriptions, while events from all connections are merged into a
+    single `on_event` handler, or the view, compact or column handlers
+    given in `client_options`.
+    Orders, RFQs, server info and full depth order books are not sharded and
+    should be subscribed with the `primary` client.
+
+    Attributes:
+        shards: Number of connections
+        on_response: Callback for handling responses of all connections
+        on_event: Callback for handling channel events of all connections
+        binary: Use the binary endpoint
+        ws_url: WebSocket endpoint URL
+        client_options: Extra keyword arguments passed to every client
+        rates: Ticker and order book top rows received by product symbol,
+            counted by every client since the last `rebalance`
+    """
+
+    shards: int = 2
+    on_response: ResponseHandler = field(default=on_response)
+    on_event: EventHandler = field(default=on_event)
+    binary: bool = True
+    ws_url: str | None = None
+    client_options: dict[str, Any] = field(default_factory=dict)
+    clients: list[OnyxWebsocketClientV2] = field(default_factory=list, init=False)
+    rates: Counter[str] = field(default_factory=Counter, init=False)
+    _tickers: dict[str, int] = field(default_factory=dict, init=False)
+    _obt: dict[str, int] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        if self.shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.clients = [
+            OnyxWebsocketClientV2.create(
+                binary=self.binary,
+                ws_url=self.ws_url,
+                on_response=self.on_response,
+                on_event=self.on_event,
+                product_rates=self.rates,
+                **self.client_options,
+            )
+            for _ in range(self.shards)
+        ]
+
+    @property
+    def primary(self) -> OnyxWebsocketClientV2:
+        """Client used for channels which are not sharded"""
+        return self.clients[0]
+
+    def shard_of(self, product: str) -> int:
+        """Shard a product is assigned to, or would be assigned to"""
+        shard = self._tickers.get(product)
+        if shard is None:
+            shard = self._obt.get(product)
+        if shard is None:
+            shard = stable_shard(product, self.shards)
+        return shard
+
+    def shard_products(self, shard: int) -> tuple[list[str], list[str]]:
+        """Ticker and order book top products assigned to a shard"""
+        return (
+            sorted(p for p, s in self._tickers.items() if s == shard),
+            sorted(p for p, s in self._obt.items() if s == shard),
+        )
+
+    def subscribe_tickers(self, products: list[str]) -> None:
+        """Subscribe to ticker updates for specific products."""
+        for shard, group in self._assign(self._tickers, products).items():
+            self.clients[shard].subscribe_tickers(group)
+
+    def unsubscribe_tickers(self, products: list[str]) -> None:
+        """Unsubscribe from ticker updates for specific products."""
+        for shard, group in self._release(self._tickers, products).items():
+            self.clients[shard].unsubscribe_tickers(group)
+
+    def subscribe_obt(self, products: list[str]) -> None:
+        """Subscribe to order-book-top updates for specific products."""
+        for shard, group in self._assign(self._obt, products).items():
+            self.clients[shard].subscribe_obt(group)
+
+    def unsubscribe_obt(self, products: list[str]) -> None:
+        """Unsubscribe from order-book-top updates for specific products."""
+        for shard, group in self._release(self._obt, products).items():
+            self.clients[shard].unsubscribe_obt(group)
+
+    def set_tickers(self, products: list[str]) -> None:
+        """Set the products subscribed to the tickers channel."""
+        self._set_products(self._tickers, products)
+        for shard, client in enumerate(self.clients):
+            client.set_tickers(self.shard_products(shard)[0])
+
+    def set_obt(self, products: list[str]) -> None:
+        """Set the products subscribed to the order-book-top channel."""
+        self._set_products(self._obt, products)
+        for shard, client in enumerate(self.clients):
+            client.set_obt(self.shard_products(shard)[1])
+
+    def rebalance(self) -> int:
+        """Reassign products to shards by their measured message rate.
+
+        Products are placed from the busiest one on the least loaded shard,
+        and moved products are unsubscribed from their old connection and
+        subscribed on the new one. Message counts are reset afterwards.
+        Returns the number of products which moved.
+        """
+        products = sorted(
+            set(self._tickers) | set(self._obt),
+            key=lambda p: (-self.rates[p], p),
+        )
+        loads = [0] * self.shards
+        target: dict[str, int] = {}
+        for product in products:
+            shard = min(range(self.shards), key=lambda s: (loads[s], s))
+            target[product] = shard
+            loads[shard] += self.rates[product]
+        moved = 0
+        for product, shard in target.items():
+            if shard == self.shard_of(product):
+                continue
+            moved += 1
+            if product in self._tickers:
+                self.unsubscribe_tickers([product])
+                self._tickers[product] = shard
+                self.subscribe_tickers([product])
+            if product in self._obt:
+                self.unsubscribe_obt([product])
+                self._obt[product] = shard
+                self.subscribe_obt([product])
+        self.rates.clear()
+        return moved
+
+    async def connect(self) -> None:
+        """Connect all clients, with automatic reconnection."""
+        await asyncio.gather(*(client.connect() for client in self.clients))
+
+    async def close(self) -> None:
+        """Gracefully close all connections."""
+        await asyncio.gather(*(client.close() for client in self.clients))
+
+    def _assign(
+        self, assigned: dict[str, int], products: list[str]
+    ) -> dict[int, list[str]]:
+        groups: dict[int, list[str]] = {}
+        for product in products:
+            shard = assigned[product] = self.shard_of(product)
+            groups.setdefault(shard, []).append(product)
+        return groups
+
+    def _set_products(self, assigned: dict[str, int], products: list[str]) -> None:
+        desired = set(products)
+        for product in list(assigned):
+            if product not in desired:
+                del assigned[product]
+        for product in desired:
+            assigned[product] = self.shard_of(product)
+
+    def _release(
+        self, assigned: dict[str, int], products: list[str]
+    ) -> dict[int, list[str]]:
+        groups: dict[int, list[str]] = {}
+        for product in products:
+            shard = assigned.pop(product, None)
+            if shard is not None:
+                groups.setdefault(shard, []).append(product)
+        return groups
@@ -0,0 +1,200 @@
+"""Replay of captured frames through the handlers of a client"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from .capture import CaptureFrame, CaptureReader
+from .conflation import ChannelMessage
+from .decoding import DecodedMessage, decode_binary, decode_text
+from .responses import OrderBooks, OrderBookTops, OtcChannelMessage, Tickers
+from .timestamp import NANOS_PER_SECOND
+from .types import Channel
+from .v2 import responses_pb2
+from .websocket_v2 import OnyxWebsocketClientV2
+
+logger = logging.getLogger(__name__)
+# rows filtered by symbol, by data model, named as the channel message field
+_ROW_FIELDS: dict[type, str] = {
+    Tickers: "tickers",
+    OrderBookTops: "order_book_tops",
+    OrderBooks: "order_books",
+}
+
+
+@dataclass
+class ReplayStats:
+    """Counters of a replay
+
+    Attributes:
+        frames: Frames read from the capture
+        replayed: Frames passed to the client
+        filtered: Frames skipped by the channel and symbol filters
+        errors: Frames which raised an exception when handled
+        handle_ns: Time spent decoding and handling frames
+        elapsed_ns: Total time of the replay, including pacing
+    """
+
+    frames: int = 0
+    replayed: int = 0
+    filtered: int = 0
+    errors: int = 0
+    handle_ns: int = 0
+    elapsed_ns: int = 0
+
+    @property
+    def ns_per_frame(self) -> float:
+        return self.handle_ns / self.replayed if self.replayed else 0.0
+
+    @property
+    def frames_per_second(self) -> float:
+        """Decode and handler throughput"""
+        return (
+            NANOS_PER_SECOND * self.replayed / self.handle_ns if self.handle_ns else 0.0
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"replayed {self.replayed} of {self.frames} frames "
+            f"({self.filtered} filtered, {self.errors} errors) "
+            f"in {self.elapsed_ns / NANOS_PER_SECOND:.3f}s - "
+            f"{self.frames_per_second:,.0f} frames/s, "
+            f"{self.ns_per_frame:,.0f} ns/frame"
+        )
+
+
+@dataclass
+class Replayer:
+    """Feed the frames of a capture file to a client.
+
+    Frames go through `handle_binary_message` and `handle_text_message`, as
+    when received live, unless filters are set: frames are then decoded
+    first and filtered messages are passed to `handle_decoded`.
+
+    Attributes:
+        client: Client handling the frames, it does not need a connection
+        speed: Pace frames at `speed` times real time, as fast as possible
+            when 0
+        channels: Only replay channel messages of these channels
+        symbols: Only replay tickers, order book tops and order books of
+            these symbols or product symbols
+        start_ns: Skip frames received before this time
+        stats: Replay counters
+    """
+
+    client: OnyxWebsocketClientV2
+    speed: float = 0.0
+    channels: set[Channel] = field(default_factory=set)
+    symbols: set[str] = field(default_factory=set)
+    start_ns: int = 0
+    stats: ReplayStats = field(default_factory=ReplayStats)
+
+    async def run(self, reader: CaptureReader) -> ReplayStats:
+        """Replay all frames of a capture, returning the replay counters"""
+        client = self.client
+        stats = self.stats
+        filtered = bool(self.channels or self.symbols)
+        first_ns = 0
+        started_ns = time.monotonic_ns()
+        client.start_tasks()
+        try:
+            for frame in reader.frames(self.start_ns):
+                stats.frames += 1
+                if self.speed > 0:
+                    if not first_ns:
+                        first_ns = frame.recv_ns
+                    await self._pace(started_ns, frame.recv_ns - first_ns)
+                t0 = time.perf_counter_ns()
+                try:
+                    if filtered:
+                        await self._replay_filtered(frame)
+                    else:
+                        await self._replay(frame)
+                except Exception as e:
+                    stats.errors += 1
+                    logger.error("Error replaying frame: %s", e, exc_info=True)
+                stats.handle_ns += time.perf_counter_ns() - t0
+            t0 = time.perf_counter_ns()
+            await client.drain()
+            stats.handle_ns += time.perf_counter_ns() - t0
+        finally:
+            await client.stop_tasks()
+            stats.elapsed_ns = time.monotonic_ns() - started_ns
+        return stats
+
+    async def _pace(self, started_ns: int, offset_ns: int) -> None:
+        delay_ns = started_ns + offset_ns / self.speed - time.monotonic_ns()
+        if delay_ns > 0:
+            await asyncio.sleep(delay_ns / NANOS_PER_SECOND)
+
+    async def _replay(self, frame: CaptureFrame) -> None:
+        data = frame.data()
+        self.stats.replayed += 1
+        if isinstance(data, bytes):
+            await self.client.handle_binary_message(data)
+        else:
+            await self.client.handle_text_message(data)
+
+    async def _replay_filtered(self, frame: CaptureFrame) -> None:
+        data = frame.data()
+        message: DecodedMessage
+        if isinstance(data, bytes):
+            message = decode_binary(data, self.client.trusted, raw_events=True)
+        else:
+            message = decode_text(data, self.client.trusted)
+        # responses are always replayed
+        if isinstance(message, responses_pb2.ChannelMessage | OtcChannelMessage):
+            message = self._filter(message)
+            if message is None:
+                self.stats.filtered += 1
+                return
+        self.stats.replayed += 1
+        await self.client.handle_decoded(message)
+
+    def _filter(self, message: ChannelMessage) -> ChannelMessage | None:
+        """The message with the rows of the filtered symbols only, as a new
+        message when rows are dropped, or None when nothing is left"""
+        if isinstance(message, OtcChannelMessage):
+            channel = message.channel
+        else:
+            channel = Channel.from_proto(message.channel)
+        if self.channels and channel not in self.channels:
+            return None
+        if not self.symbols:
+            return message
+        data: Any
+        name: str | None
+        if isinstance(message, OtcChannelMessage):
+            data = message.data
+            name = _ROW_FIELDS.get(type(data))
+        else:
+            name = message.WhichOneof("message")
+            if name is None or name not in _ROW_FIELDS.values():
+                return message
+            data = getattr(message, name)
+        if name is None:
+            return message
+        symbols = self.symbols
+        rows = getattr(data, name)
+        kept = [
+            row
+            for row in rows
+            if row.symbol in symbols or row.product_symbol in symbols
+        ]
+        if not kept:
+            return None
+        if len(kept) == len(rows):
+            return message
+        if isinstance(message, OtcChannelMessage):
+            return message.model_copy(
+                update=dict(data=data.model_copy(update={name: kept}))
+            )
+        filtered = responses_pb2.ChannelMessage(
+            channel=message.channel, timestamp=message.timestamp
+        )
+        getattr(getattr(filtered, name), name).extend(kept)
+        return filtered
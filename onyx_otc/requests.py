@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Any, Self
+from typing import Any, Self, TypeAlias
 
 from pydantic import BaseModel
 
 from .common import TradableSymbol
+from .fixed import Fixed
 from .timestamp import Timestamp
 from .types import Channel, Exchange, Method, OrderType, Side
 from .v2 import common_pb2, requests_pb2
@@ -29,9 +30,9 @@ class OtcOrderRequest(BaseModel):
 
     account_id: str
     symbol: TradableSymbol
-    quantity: Decimal
+    quantity: Decimal | Fixed
     side: Side
-    price: Decimal
+    price: Decimal | Fixed
     order_type: OrderType = OrderType.FILL_OR_KILL
     client_order_id: str = ""
 
@@ -67,6 +68,38 @@ class OrderBookTopChannel(BaseModel):
         return requests_pb2.OrderBookTopChannel(products=self.products)
 
 
+class OrderBookChannel(BaseModel):
+    """Request for subscribing to full depth order book updates for a symbol."""
+
+    symbol: TradableSymbol
+    exchange: Exchange
+
+    @classmethod
+    def from_string(cls, book: str) -> Self:
+        bits = book.split("@")
+        if len(bits) == 2:
+            return cls(
+                symbol=TradableSymbol.from_string(bits[0]),
+                exchange=Exchange[bits[1].upper()],
+            )
+        else:
+            raise InvalidInputError(
+                f"Invalid order book format: {book}. Expected <symbol>@<exchange>"
+            )
+
+    def to_proto(self) -> requests_pb2.OrderBookChannel:
+        return requests_pb2.OrderBookChannel(
+            symbol=self.symbol.to_proto(),
+            exchange=self.exchange.to_proto(),
+        )
+
+    def model_dump(self, **kwargs: Any) -> dict:
+        """Customize serialization to ensure `symbol` is a string."""
+        data = super().model_dump(**kwargs)
+        data["symbol"] = self.symbol.as_string()
+        return data
+
+
 class ServerInfoChannel(BaseModel):
 
     def to_proto(self) -> requests_pb2.ServerInfoChannel:
@@ -119,17 +152,22 @@ channel_from_data_type = {
     OrdersChannel: Channel.ORDERS,
     OrderBookTopChannel: Channel.ORDER_BOOK_TOP,
     RfqChannel: Channel.RFQ,
+    OrderBookChannel: Channel.ORDER_BOOK,
 }
 
 
+SubscriptionChannel: TypeAlias = (
+    ServerInfoChannel
+    | TickersChannel
+    | OrdersChannel
+    | RfqChannel
+    | OrderBookTopChannel
+    | OrderBookChannel
+)
+
+
 class SubscribeRequestBase(BaseModel):
-    data: (
-        ServerInfoChannel
-        | TickersChannel
-        | OrdersChannel
-        | RfqChannel
-        | OrderBookTopChannel
-    )
+    data: SubscriptionChannel
 
     @property
     def channel(self) -> Channel:
@@ -191,5 +229,5 @@ class OtcRequest(BaseModel):
             id=self.id,
             method=self.method.value,
             timestamp=self.timestamp.to_datetime().isoformat(),
-            **self.request.model_dump(),
+            **self.request.model_dump(mode="json"),
         )
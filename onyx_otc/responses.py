@@ -8,11 +8,35 @@ from typing import Annotated, Self
 from pydantic import BaseModel, BeforeValidator, Field, field_validator
 
 from .common import PriceAmount, TradableSymbol
+from .symbols import parse_symbol, symbol_from_proto
 from .timestamp import NANOS_PER_MICROS, Timestamp
-from .types import Channel, Exchange, OtcErrorCode, Side, SubscriptionStatus
+from .types import (
+    Channel,
+    Exchange,
+    OrderState,
+    OrderType,
+    OtcErrorCode,
+    Side,
+    SubscriptionStatus,
+)
 from .v2 import responses_pb2
 
 logger = logging.getLogger(__name__)
+# optional order fields of JSON order responses
+_ORDER_DETAILS = (
+    "exchange",
+    "order_type",
+    "order_state",
+    "created_timestamp",
+    "executed_amount",
+    "executed_avg_price",
+    "executions",
+)
+# channel message types with a decoder, channel messages of other types
+# (dy tickers and notifications) are dropped
+CHANNEL_MESSAGE_TYPES = frozenset(
+    ("server_info", "tickers", "otc_quote", "order_book_tops", "order_books", "order")
+)
 AnnotatedTimestamp = Annotated[Timestamp, BeforeValidator(Timestamp.from_any)]
 
 
@@ -20,8 +44,11 @@ class Auth(BaseModel):
     message: str = ""
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.AuthResponse) -> Self:
-        return cls(message=proto.message)
+    def from_proto(
+        cls, proto: responses_pb2.AuthResponse, trusted: bool = False
+    ) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(message=proto.message)
 
 
 class LiveWebsocket(BaseModel):
@@ -37,8 +64,11 @@ class LiveWebsocket(BaseModel):
     protocol: str = ""
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.LiveWebsocket) -> Self:
-        return cls(
+    def from_proto(
+        cls, proto: responses_pb2.LiveWebsocket, trusted: bool = False
+    ) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             socket_uid=proto.socket_uid,
             message_received=proto.message_received,
             message_sent=proto.message_sent,
@@ -64,12 +94,13 @@ class ServerInfo(BaseModel):
     live_websockets: list[LiveWebsocket] = Field(default_factory=list)
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.ServerInfo) -> Self:
-        return cls(
+    def from_proto(cls, proto: responses_pb2.ServerInfo, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             socket_uid=proto.socket_uid,
             age_millis=proto.age_millis,
             live_websockets=[
-                LiveWebsocket.from_proto(live_websocket)
+                LiveWebsocket.from_proto(live_websocket, trusted)
                 for live_websocket in proto.live_websockets
             ],
         )
@@ -90,8 +121,9 @@ class Ticker(BaseModel):
     mid: Decimal
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.Ticker) -> Self:
-        return cls(
+    def from_proto(cls, proto: responses_pb2.Ticker, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             symbol=proto.symbol,
             product_symbol=proto.product_symbol,
             timestamp=Timestamp.from_proto(proto.timestamp),
@@ -107,10 +139,13 @@ class OrderBookTop(BaseModel):
     timestamp: AnnotatedTimestamp
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.OrderBookTop) -> Self:
-        return cls(
-            buy=PriceAmount.from_proto(proto.buy),
-            sell=PriceAmount.from_proto(proto.sell),
+    def from_proto(
+        cls, proto: responses_pb2.OrderBookTop, trusted: bool = False
+    ) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
+            buy=PriceAmount.from_proto(proto.buy, trusted),
+            sell=PriceAmount.from_proto(proto.sell, trusted),
             symbol=proto.symbol,
             product_symbol=proto.product_symbol,
             timestamp=Timestamp.from_proto(proto.timestamp),
@@ -121,22 +156,61 @@ class OrderBookTops(BaseModel):
     order_book_tops: list[OrderBookTop]
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.OrderBookTops) -> Self:
-        return cls(
+    def from_proto(
+        cls, proto: responses_pb2.OrderBookTops, trusted: bool = False
+    ) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             order_book_tops=[
-                OrderBookTop.from_proto(order_book_top)
+                OrderBookTop.from_proto(order_book_top, trusted)
                 for order_book_top in proto.order_book_tops
             ]
         )
 
 
+class OrderBook(BaseModel):
+    bids: list[PriceAmount]
+    asks: list[PriceAmount]
+    exchange: Exchange
+    symbol: str
+    product_symbol: str
+    timestamp: AnnotatedTimestamp
+
+    @classmethod
+    def from_proto(cls, proto: responses_pb2.OrderBook, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
+            bids=[PriceAmount.from_proto(level, trusted) for level in proto.bids],
+            asks=[PriceAmount.from_proto(level, trusted) for level in proto.asks],
+            exchange=Exchange.from_proto(proto.exchange),
+            symbol=proto.symbol,
+            product_symbol=proto.product_symbol,
+            timestamp=Timestamp.from_proto(proto.timestamp),
+        )
+
+
+class OrderBooks(BaseModel):
+    order_books: list[OrderBook]
+
+    @classmethod
+    def from_proto(cls, proto: responses_pb2.OrderBooks, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
+            order_books=[
+                OrderBook.from_proto(order_book, trusted)
+                for order_book in proto.order_books
+            ]
+        )
+
+
 class Tickers(BaseModel):
     tickers: list[Ticker]
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.Tickers) -> Self:
-        return cls(
-            tickers=[Ticker.from_proto(ticker) for ticker in proto.tickers],
+    def from_proto(cls, proto: responses_pb2.Tickers, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
+            tickers=[Ticker.from_proto(ticker, trusted) for ticker in proto.tickers],
         )
 
 
@@ -146,8 +220,11 @@ class OtcSubscription(BaseModel):
     message: str
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.Subscription) -> Self:
-        return cls(
+    def from_proto(
+        cls, proto: responses_pb2.Subscription, trusted: bool = False
+    ) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             channel=Channel.from_proto(proto.channel),
             status=SubscriptionStatus.from_proto(proto.status),
             message=proto.message,
@@ -159,8 +236,9 @@ class OtcError(BaseModel):
     message: str
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.OtcError) -> Self:
-        return cls(
+    def from_proto(cls, proto: responses_pb2.OtcError, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             code=OtcErrorCode.from_proto(proto.code),
             message=proto.message,
         )
@@ -173,25 +251,34 @@ class OtcQuote(BaseModel):
     exchange: Exchange
     timestamp: AnnotatedTimestamp
     product_symbol: str
-    buy: PriceAmount
-    sell: PriceAmount
+    buy: PriceAmount | None = None
+    sell: PriceAmount | None = None
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.OtcQuote) -> Self:
-        return cls(
-            symbol=TradableSymbol.from_proto(proto.symbol),
+    def from_proto(cls, proto: responses_pb2.OtcQuote, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
+            symbol=symbol_from_proto(proto.symbol),
             exchange=Exchange.from_proto(proto.exchange),
             timestamp=Timestamp.from_proto(proto.timestamp),
             product_symbol=proto.product_symbol,
-            buy=PriceAmount.from_proto(proto.buy),
-            sell=PriceAmount.from_proto(proto.sell),
+            buy=(
+                PriceAmount.from_proto(proto.buy, trusted)
+                if proto.HasField("buy")
+                else None
+            ),
+            sell=(
+                PriceAmount.from_proto(proto.sell, trusted)
+                if proto.HasField("sell")
+                else None
+            ),
         )
 
     def as_string(self) -> str:
         return (
             f"{self.symbol.as_string()} "
-            f"buy: {self.buy.as_string()}, "
-            f"sell: {self.sell.as_string()}"
+            f"buy: {self.buy.as_string() if self.buy else None}, "
+            f"sell: {self.sell.as_string() if self.sell else None}"
         )
 
     @field_validator("symbol", mode="before")
@@ -199,10 +286,62 @@ class OtcQuote(BaseModel):
     def validate_symbol(cls, value: str) -> TradableSymbol:
         """Custom validator to create TradableSymbol from a string."""
         if isinstance(value, str):
-            return TradableSymbol.from_string(value)
+            return parse_symbol(value)
         return value
 
 
+class Fee(BaseModel):
+    currency: str
+    signed_amount: Decimal
+    rate: Decimal
+
+    @classmethod
+    def from_proto(cls, proto: responses_pb2.Fee, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
+            currency=proto.currency,
+            signed_amount=Decimal(proto.signed_amount.value or 0),
+            rate=Decimal(proto.rate.value or 0),
+        )
+
+
+class Execution(BaseModel):
+    """An execution, a fill of an order"""
+
+    id: str
+    order_id: str
+    client_order_id: str
+    account_id: str
+    exchange: Exchange
+    symbol: str
+    amount: Decimal
+    price: Decimal
+    side: Side
+    created_timestamp: AnnotatedTimestamp | None = None
+    fee: Fee | None = None
+
+    @classmethod
+    def from_proto(cls, proto: responses_pb2.Execution, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
+            id=proto.id,
+            order_id=proto.order_id,
+            client_order_id=proto.client_order_id,
+            account_id=proto.account_id,
+            exchange=Exchange.from_proto(proto.exchange),
+            symbol=proto.symbol,
+            amount=Decimal(proto.amount.value),
+            price=Decimal(proto.price.value),
+            side=Side.from_proto(proto.side),
+            created_timestamp=(
+                Timestamp.from_proto(proto.created_timestamp)
+                if proto.HasField("created_timestamp")
+                else None
+            ),
+            fee=Fee.from_proto(proto.fee, trusted) if proto.HasField("fee") else None,
+        )
+
+
 class OtcOrder(BaseModel):
     id: str
     client_order_id: str
@@ -212,20 +351,55 @@ class OtcOrder(BaseModel):
     amount: Decimal
     side: Side
     price: Decimal
+    exchange: Exchange = Exchange.UNSPECIFIED
+    order_type: OrderType = OrderType.UNSPECIFIED
+    order_state: OrderState = OrderState.UNSPECIFIED
+    created_timestamp: AnnotatedTimestamp | None = None
+    executed_amount: Decimal | None = None
+    executed_avg_price: Decimal | None = None
+    executions: list[Execution] = Field(default_factory=list)
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.Order) -> Self:
-        return cls(
+    def from_proto(cls, proto: responses_pb2.Order, trusted: bool = False) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             id=proto.id,
             client_order_id=proto.client_order_id,
             account_id=proto.account_id,
-            symbol=TradableSymbol.from_proto(proto.symbol),
+            symbol=symbol_from_proto(proto.symbol),
             product_symbol=proto.product_symbol,
             amount=Decimal(proto.amount.value),
             side=Side.from_proto(proto.side),
             price=Decimal(proto.price.value),
+            exchange=Exchange.from_proto(proto.exchange),
+            order_type=OrderType.from_proto(proto.order_type),
+            order_state=OrderState.from_proto(proto.order_state),
+            created_timestamp=(
+                Timestamp.from_proto(proto.created_timestamp)
+                if proto.HasField("created_timestamp")
+                else None
+            ),
+            executed_amount=(
+                Decimal(proto.executed_amount.value)
+                if proto.HasField("executed_amount")
+                else None
+            ),
+            executed_avg_price=(
+                Decimal(proto.executed_avg_price.value)
+                if proto.HasField("executed_avg_price")
+                else None
+            ),
+            executions=[
+                Execution.from_proto(execution, trusted)
+                for execution in proto.executions
+            ],
         )
 
+    @property
+    def remaining_amount(self) -> Decimal:
+        """Amount not executed yet"""
+        return self.amount - (self.executed_amount or 0)
+
 
 class OtcResponse(BaseModel):
     id: str
@@ -260,26 +434,29 @@ class OtcResponse(BaseModel):
             logger.info("%s - %s - %s", self.timestamp, name, self.data)
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.OtcResponse) -> Self:
-        return cls(
+    def from_proto(
+        cls, proto: responses_pb2.OtcResponse, trusted: bool = False
+    ) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             id=proto.id,
             timestamp=Timestamp.from_proto(proto.timestamp),
-            data=cls.get_data_from_proto(proto),
+            data=cls.get_data_from_proto(proto, trusted),
         )
 
     @classmethod
     def get_data_from_proto(
-        cls, proto: responses_pb2.OtcResponse
+        cls, proto: responses_pb2.OtcResponse, trusted: bool = False
     ) -> Auth | OtcError | OtcSubscription | OtcOrder:
         match proto.WhichOneof("response"):  # type: ignore[arg-type]
             case "auth":
-                return Auth.from_proto(proto.auth)
+                return Auth.from_proto(proto.auth, trusted)
             case "error":
-                return OtcError.from_proto(proto.error)
+                return OtcError.from_proto(proto.error, trusted)
             case "subscription":
-                return OtcSubscription.from_proto(proto.subscription)
+                return OtcSubscription.from_proto(proto.subscription, trusted)
             case "order":
-                return OtcOrder.from_proto(proto.order)
+                return OtcOrder.from_proto(proto.order, trusted)
             case _:
                 raise ValueError(f"Unknown response type {proto}")
 
@@ -327,18 +504,34 @@ class OtcResponse(BaseModel):
                         amount=Decimal(payload["amount"]),
                         side=Side.from_proto(payload["side"]),
                         price=Decimal(payload["price"]),
+                        **{
+                            key: payload[key]
+                            for key in _ORDER_DETAILS
+                            if key in payload
+                        },
                     ),
                 )
             case _:
                 raise ValueError(f"Unknown method: {method}")
 
 
+class OtcResponseError(Exception):
+    """Raised when a request is answered by an error response"""
+
+    def __init__(self, response: OtcResponse) -> None:
+        self.response = response
+        error = response.error()
+        self.code = error.code if error else OtcErrorCode.UNSPECIFIED
+        message = error.message if error else ""
+        super().__init__(f"{self.code}: {message}")
+
+
 class OtcChannelMessage(BaseModel):
     """A message in a subscribed channel"""
 
     channel: Channel
     timestamp: AnnotatedTimestamp
-    data: ServerInfo | Tickers | OtcQuote | OrderBookTops | OtcOrder
+    data: ServerInfo | Tickers | OtcQuote | OrderBookTops | OrderBooks | OtcOrder
 
     def server_info(self) -> ServerInfo | None:
         if isinstance(self.data, ServerInfo):
@@ -355,6 +548,11 @@ class OtcChannelMessage(BaseModel):
             return self.data
         return None
 
+    def order_books(self) -> OrderBooks | None:
+        if isinstance(self.data, OrderBooks):
+            return self.data
+        return None
+
     def otc_quote(self) -> OtcQuote | None:
         if isinstance(self.data, OtcQuote):
             return self.data
@@ -373,32 +571,40 @@ class OtcChannelMessage(BaseModel):
         elif order_book_tops := self.order_book_tops():
             for obt in order_book_tops.order_book_tops:
                 logger.info("%s - %s - %s", self.timestamp, name, obt)
+        elif order_books := self.order_books():
+            for order_book in order_books.order_books:
+                logger.info("%s - %s - %s", self.timestamp, name, order_book)
         else:
             logger.info("%s - %s - %s", self.timestamp, name, self.data)
 
     @classmethod
-    def from_proto(cls, proto: responses_pb2.ChannelMessage) -> Self:
-        return cls(
+    def from_proto(
+        cls, proto: responses_pb2.ChannelMessage, trusted: bool = False
+    ) -> Self:
+        build = cls.model_construct if trusted else cls
+        return build(
             channel=Channel.from_proto(proto.channel),
             timestamp=Timestamp.from_proto(proto.timestamp),
-            data=cls.get_data_from_proto(proto),
+            data=cls.get_data_from_proto(proto, trusted),
         )
 
     @classmethod
     def get_data_from_proto(
-        cls, proto: responses_pb2.ChannelMessage
-    ) -> ServerInfo | Tickers | OtcQuote | OrderBookTops | OtcOrder:
+        cls, proto: responses_pb2.ChannelMessage, trusted: bool = False
+    ) -> ServerInfo | Tickers | OtcQuote | OrderBookTops | OrderBooks | OtcOrder:
         match proto.WhichOneof("message"):  # type: ignore[arg-type]
             case "server_info":
-                return ServerInfo.from_proto(proto.server_info)
+                return ServerInfo.from_proto(proto.server_info, trusted)
             case "tickers":
-                return Tickers.from_proto(proto.tickers)
+                return Tickers.from_proto(proto.tickers, trusted)
             case "otc_quote":
-                return OtcQuote.from_proto(proto.otc_quote)
+                return OtcQuote.from_proto(proto.otc_quote, trusted)
             case "order_book_tops":
-                return OrderBookTops.from_proto(proto.order_book_tops)
+                return OrderBookTops.from_proto(proto.order_book_tops, trusted)
+            case "order_books":
+                return OrderBooks.from_proto(proto.order_books, trusted)
             case "order":
-                return OtcOrder.from_proto(proto.order)
+                return OtcOrder.from_proto(proto.order, trusted)
             case _:
                 raise ValueError(f"Unknown channel message type {proto}")
 
@@ -440,19 +646,30 @@ class OtcChannelMessage(BaseModel):
                     timestamp=timestamp,
                     data=OrderBookTops(order_book_tops=message),
                 )
+            case Channel.ORDER_BOOK:
+                return cls(
+                    channel=channel,
+                    timestamp=timestamp,
+                    data=OrderBooks(order_books=message),
+                )
             case _:
-                raise ValueError(f"Unknown channel: {channel}")
+                logger.debug("No decoder for channel %s, message dropped", channel)
+                return None
 
 
 def otc_response_from_proto_bytes(
     proto_bytes: bytes,
+    trusted: bool = False,
 ) -> OtcResponse | OtcChannelMessage:
-    """Convert a protobuf response to an OtcResponse object."""
-    msg = responses_pb2.OtcResponseMessage.FromString(proto_bytes)
-    match msg.WhichOneof("data"):
-        case "otc_response":
-            return OtcResponse.from_proto(msg.otc_response)
-        case "channel_message":
-            return OtcChannelMessage.from_proto(msg.channel_message)
-        case _:
-            raise ValueError("Unknown response type")
+    """Convert a protobuf response to an OtcResponse object.
+
+    When `trusted` is True the models are built with `model_construct`,
+    skipping pydantic validation - the values decoded from the proto
+    already have the right types.
+    """
+    from .decoding import decode_binary
+
+    message = decode_binary(proto_bytes, trusted)
+    if not isinstance(message, (OtcResponse, OtcChannelMessage)):
+        raise ValueError("Unknown response type")
+    return message
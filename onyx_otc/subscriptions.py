@@ -0,0 +1,110 @@
+"""Registry of the active subscriptions of a client"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .requests import (
+    OrderBookChannel,
+    OrderBookTopChannel,
+    OrdersChannel,
+    RfqChannel,
+    ServerInfoChannel,
+    SubscriptionChannel,
+    TickersChannel,
+)
+from .types import Exchange
+
+
+def rfq_key(rfq: RfqChannel) -> tuple[str, Exchange, str]:
+    return rfq.symbol.as_string(), rfq.exchange, str(rfq.size)
+
+
+def book_key(book: OrderBookChannel) -> tuple[str, Exchange]:
+    return book.symbol.as_string(), book.exchange
+
+
+@dataclass
+class SubscriptionRegistry:
+    """Subscriptions to restore when a client authenticates again.
+
+    Attributes:
+        server_info: Subscribed to the server info channel
+        orders: Subscribed to the orders channel
+        tickers: Product symbols subscribed to the tickers channel
+        obt: Product symbols subscribed to the order book top channel
+        rfqs: Subscribed RFQ channels
+        books: Subscribed full depth order book channels
+    """
+
+    server_info: bool = False
+    orders: bool = False
+    tickers: set[str] = field(default_factory=set)
+    obt: set[str] = field(default_factory=set)
+    rfqs: dict[tuple[str, Exchange, str], RfqChannel] = field(default_factory=dict)
+    books: dict[tuple[str, Exchange], OrderBookChannel] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Number of subscriptions, counting each product"""
+        return (
+            self.server_info
+            + self.orders
+            + len(self.tickers)
+            + len(self.obt)
+            + len(self.rfqs)
+            + len(self.books)
+        )
+
+    def add(self, data: SubscriptionChannel) -> None:
+        """Register a subscription"""
+        match data:
+            case ServerInfoChannel():
+                self.server_info = True
+            case OrdersChannel():
+                self.orders = True
+            case TickersChannel():
+                self.tickers.update(data.products)
+            case OrderBookTopChannel():
+                self.obt.update(data.products)
+            case RfqChannel():
+                self.rfqs[rfq_key(data)] = data
+            case OrderBookChannel():
+                self.books[book_key(data)] = data
+
+    def remove(self, data: SubscriptionChannel) -> None:
+        """Remove a subscription, when unsubscribed or rejected"""
+        match data:
+            case ServerInfoChannel():
+                self.server_info = False
+            case OrdersChannel():
+                self.orders = False
+            case TickersChannel():
+                self.tickers.difference_update(data.products)
+            case OrderBookTopChannel():
+                self.obt.difference_update(data.products)
+            case RfqChannel():
+                self.rfqs.pop(rfq_key(data), None)
+            case OrderBookChannel():
+                self.books.pop(book_key(data), None)
+
+    def clear(self) -> None:
+        self.server_info = self.orders = False
+        self.tickers.clear()
+        self.obt.clear()
+        self.rfqs.clear()
+        self.books.clear()
+
+    def channels(self) -> list[SubscriptionChannel]:
+        """The subscriptions merged into as few channel requests as possible"""
+        channels: list[SubscriptionChannel] = []
+        if self.orders:
+            channels.append(OrdersChannel())
+        if self.server_info:
+            channels.append(ServerInfoChannel())
+        if self.tickers:
+            channels.append(TickersChannel(products=sorted(self.tickers)))
+        if self.obt:
+            channels.append(OrderBookTopChannel(products=sorted(self.obt)))
+        channels.extend(self.rfqs.values())
+        channels.extend(self.books.values())
+        return channels
@@ -0,0 +1,136 @@
+"""Interned symbols.
+
+A `SymbolRegistry` assigns small integer ids to symbol strings, usable as
+array indices, and memoizes their parsing into `TradableSymbol` so that the
+few hundred symbols of a feed are parsed once rather than on every message.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from .common import TradableSymbol
+from .v2 import common_pb2
+
+DEFAULT_MAXSIZE = 4096
+
+
+@dataclass(slots=True)
+class SymbolRegistry:
+    """Interns symbol strings into dense integer ids and parsed symbols
+
+    When `maxsize` is set the least recently used symbol is evicted once the
+    registry is full and its id reused, so that an id is stable only while
+    its symbol stays registered. Parsed symbols are shared between callers
+    and must not be mutated.
+
+    Attributes:
+        maxsize: Maximum number of symbols, unbounded when None
+        ids: Id of each symbol, least recently used first
+        symbols: Symbol of each id
+        tradables: Parsed symbol of each id, None until first requested
+        evictions: Number of symbols evicted
+    """
+
+    maxsize: int | None = None
+    ids: OrderedDict[str, int] = field(default_factory=OrderedDict)
+    symbols: list[str] = field(default_factory=list)
+    tradables: list[TradableSymbol | None] = field(default_factory=list)
+    evictions: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.ids
+
+    def get_id(self, symbol: str) -> int:
+        """Get the id of a symbol, assigning a new one if not registered"""
+        if self.maxsize is None:
+            # ids of an unbounded registry never change once assigned
+            id_ = self.ids.get(symbol)
+            if id_ is not None:
+                return id_
+        with self._lock:
+            id_ = self._insert(symbol)
+            self.ids.move_to_end(symbol)
+            return id_
+
+    def symbol(self, id_: int) -> str:
+        return self.symbols[id_]
+
+    def intern(self, symbol: str) -> str:
+        """The registered string equal to `symbol`"""
+        return self.symbols[self.get_id(symbol)]
+
+    def tradable(self, symbol: str) -> TradableSymbol:
+        """The parsed symbol of a symbol string"""
+        id_ = self.get_id(symbol)
+        tradable = self.tradables[id_]
+        # the id may have been reused by another thread since
+        if tradable is None or self.symbols[id_] != symbol:
+            with self._lock:
+                id_ = self._insert(symbol)
+                tradable = self.tradables[id_]
+                if tradable is None:
+                    tradable = TradableSymbol.from_string(symbol)
+                    self.tradables[id_] = tradable
+        return tradable
+
+    def from_proto(self, proto: common_pb2.TradableSymbol) -> TradableSymbol:
+        """The parsed symbol of a proto symbol"""
+        match proto.WhichOneof("symbol"):
+            case "flat":
+                if "-" in proto.flat:
+                    return TradableSymbol.from_proto(proto)
+                return self.tradable(proto.flat)
+            case "spread":
+                spread = proto.spread
+                return self.tradable(f"{spread.front}-{spread.back}")
+            case "butterfly":
+                butterfly = proto.butterfly
+                return self.tradable(
+                    f"{butterfly.front}-{butterfly.middle}-{butterfly.back}"
+                )
+            case _:
+                raise ValueError(f"Unknown symbol type: {proto}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self.ids.clear()
+            self.symbols.clear()
+            self.tradables.clear()
+
+    def _insert(self, symbol: str) -> int:
+        # must be called with the lock held
+        id_ = self.ids.get(symbol)
+        if id_ is not None:
+            return id_
+        if self.maxsize is not None and len(self.ids) >= self.maxsize:
+            _, id_ = self.ids.popitem(last=False)
+            self.symbols[id_] = symbol
+            self.tradables[id_] = None
+            self.evictions += 1
+        else:
+            id_ = len(self.symbols)
+            self.symbols.append(symbol)
+            self.tradables.append(None)
+        self.ids[symbol] = id_
+        return id_
+
+
+# registry of the symbols of decoded messages
+registry = SymbolRegistry(maxsize=DEFAULT_MAXSIZE)
+
+
+def parse_symbol(value: str) -> TradableSymbol:
+    """Parse a symbol string, memoized by the shared registry"""
+    return registry.tradable(value)
+
+
+def symbol_from_proto(proto: common_pb2.TradableSymbol) -> TradableSymbol:
+    """Parse a proto symbol, memoized by the shared registry"""
+    return registry.from_proto(proto)
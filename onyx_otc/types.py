@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import enum
-from typing import Self
+from typing import Any, Callable, ClassVar, Self
 
 from .v2 import types_pb2
 
 
-class ProtoEnum(enum.StrEnum):
+class _ProtoTables:
+    _from_proto_table: ClassVar[dict[int, Any]]
+    _to_proto_table: ClassVar[dict[Any, Any]]
+
+
+class ProtoEnum(_ProtoTables, enum.StrEnum):
+    """A string enum mirroring a proto enum.
+
+    Conversions go through tables built once the enum is defined, and proto
+    values without a member convert to `UNSPECIFIED`.
+    """
 
     def __repr__(self) -> str:
         return self.value
@@ -16,13 +26,14 @@ class Exchange(ProtoEnum):
     UNSPECIFIED = enum.auto()
     ICE = enum.auto()
     CME = enum.auto()
+    SGX = enum.auto()
 
     @classmethod
     def from_proto(cls, proto: types_pb2.Exchange.ValueType) -> Self:
-        return cls[types_pb2.Exchange.Name(proto)[9:]]
+        return cls._from_proto_table.get(proto, cls.UNSPECIFIED)
 
     def to_proto(self) -> types_pb2.Exchange.ValueType:
-        return getattr(types_pb2.Exchange, f"EXCHANGE_{self.name}")
+        return self._to_proto_table[self]
 
     def __str__(self) -> str:
         return self.value
@@ -34,13 +45,15 @@ class Method(ProtoEnum):
     ORDER = enum.auto()
     SUBSCRIBE = enum.auto()
     UNSUBSCRIBE = enum.auto()
+    UPDATE_DASHBOARD = enum.auto()
+    CANCEL_ORDER = enum.auto()
 
     @classmethod
     def from_proto(cls, proto: types_pb2.Method.ValueType) -> Self:
-        return cls[types_pb2.Method.Name(proto)[7:]]
+        return cls._from_proto_table.get(proto, cls.UNSPECIFIED)
 
     def to_proto(self) -> types_pb2.Method.ValueType:
-        return getattr(types_pb2.Method, f"METHOD_{self.name}")
+        return self._to_proto_table[self]
 
 
 class Channel(ProtoEnum):
@@ -50,13 +63,16 @@ class Channel(ProtoEnum):
     ORDERS = enum.auto()
     ORDER_BOOK_TOP = enum.auto()
     RFQ = enum.auto()
+    ORDER_BOOK = enum.auto()
+    DY_TICKERS = enum.auto()
+    NOTIFICATIONS = enum.auto()
 
     @classmethod
     def from_proto(cls, proto: types_pb2.Channel.ValueType) -> Self:
-        return cls[types_pb2.Channel.Name(proto)[8:]]
+        return cls._from_proto_table.get(proto, cls.UNSPECIFIED)
 
     def to_proto(self) -> types_pb2.Channel.ValueType:
-        return getattr(types_pb2.Channel, f"CHANNEL_{self.name}")
+        return self._to_proto_table[self]
 
     @property
     def subscribe_proto_key(self) -> str:
@@ -69,13 +85,14 @@ class Channel(ProtoEnum):
 class OrderType(ProtoEnum):
     UNSPECIFIED = enum.auto()
     FILL_OR_KILL = enum.auto()
+    LIMIT = enum.auto()
 
     @classmethod
     def from_proto(cls, proto: types_pb2.OrderType.ValueType) -> Self:
-        return cls[types_pb2.OrderType.Name(proto)[11:]]
+        return cls._from_proto_table.get(proto, cls.UNSPECIFIED)
 
     def to_proto(self) -> types_pb2.OrderType.ValueType:
-        return getattr(types_pb2.OrderType, f"ORDER_TYPE_{self.name}")
+        return self._to_proto_table[self]
 
 
 class Side(ProtoEnum):
@@ -85,10 +102,10 @@ class Side(ProtoEnum):
 
     @classmethod
     def from_proto(cls, proto: types_pb2.Side.ValueType) -> Self:
-        return cls[types_pb2.Side.Name(proto)[5:]]
+        return cls._from_proto_table.get(proto, cls.UNSPECIFIED)
 
     def to_proto(self) -> types_pb2.Side.ValueType:
-        return getattr(types_pb2.Side, f"SIDE_{self.name}")
+        return self._to_proto_table[self]
 
 
 class SubscriptionStatus(ProtoEnum):
@@ -98,10 +115,10 @@ class SubscriptionStatus(ProtoEnum):
 
     @classmethod
     def from_proto(cls, proto: types_pb2.SubscriptionStatus.ValueType) -> Self:
-        return cls[types_pb2.SubscriptionStatus.Name(proto)[20:]]
+        return cls._from_proto_table.get(proto, cls.UNSPECIFIED)
 
     def to_proto(self) -> types_pb2.SubscriptionStatus.ValueType:
-        return getattr(types_pb2.SubscriptionStatus, f"SUBSCRIPTION_STATUS_{self.name}")
+        return self._to_proto_table[self]
 
 
 class OtcErrorCode(ProtoEnum):
@@ -116,7 +133,58 @@ class OtcErrorCode(ProtoEnum):
 
     @classmethod
     def from_proto(cls, proto: types_pb2.OtcErrorCode.ValueType) -> Self:
-        return cls[types_pb2.OtcErrorCode.Name(proto)[15:]]
+        return cls._from_proto_table.get(proto, cls.UNSPECIFIED)
 
     def to_proto(self) -> types_pb2.OtcErrorCode.ValueType:
-        return getattr(types_pb2.OtcErrorCode, f"OTC_ERROR_CODE_{self.name}")
+        return self._to_proto_table[self]
+
+
+class OrderState(ProtoEnum):
+    UNSPECIFIED = enum.auto()
+    PENDING_CREATED = enum.auto()
+    CREATED = enum.auto()
+    NEW = enum.auto()
+    PARTIALLY_FILLED = enum.auto()
+    FILLED = enum.auto()
+    CANCELLED = enum.auto()
+    EXPIRED = enum.auto()
+    ERRORED = enum.auto()
+
+    @classmethod
+    def from_proto(cls, proto: types_pb2.OrderState.ValueType) -> Self:
+        return cls._from_proto_table.get(proto, cls.UNSPECIFIED)
+
+    def to_proto(self) -> types_pb2.OrderState.ValueType:
+        return self._to_proto_table[self]
+
+    @property
+    def is_terminal(self) -> bool:
+        """The order can no longer be executed nor change state"""
+        return self in _TERMINAL_ORDER_STATES
+
+
+_TERMINAL_ORDER_STATES = frozenset(
+    (OrderState.FILLED, OrderState.CANCELLED, OrderState.EXPIRED, OrderState.ERRORED)
+)
+
+
+def _proto_tables(
+    cls: type[ProtoEnum], proto_value: Callable[[str], Any], prefix: str
+) -> None:
+    """Build the conversion tables of an enum from the `Value` function of
+    its proto enum"""
+    to_proto = {member: proto_value(f"{prefix}{member.name}") for member in cls}
+    cls._to_proto_table = to_proto
+    cls._from_proto_table = {value: member for member, value in to_proto.items()}
+
+
+_proto_tables(Exchange, types_pb2.Exchange.Value, "EXCHANGE_")
+_proto_tables(Method, types_pb2.Method.Value, "METHOD_")
+_proto_tables(Channel, types_pb2.Channel.Value, "CHANNEL_")
+_proto_tables(OrderType, types_pb2.OrderType.Value, "ORDER_TYPE_")
+_proto_tables(OrderState, types_pb2.OrderState.Value, "ORDER_STATE_")
+_proto_tables(Side, types_pb2.Side.Value, "SIDE_")
+_proto_tables(
+    SubscriptionStatus, types_pb2.SubscriptionStatus.Value, "SUBSCRIPTION_STATUS_"
+)
+_proto_tables(OtcErrorCode, types_pb2.OtcErrorCode.Value, "OTC_ERROR_CODE_")
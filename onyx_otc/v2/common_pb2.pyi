@@ -0,0 +1,112 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class Decimal(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    VALUE_FIELD_NUMBER: _builtins.int
+    value: _builtins.str
+    def __init__(
+        self,
+        *,
+        value: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Decimal: _TypeAlias = Decimal  # noqa: Y015
+
+@_typing.final
+class Spread(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FRONT_FIELD_NUMBER: _builtins.int
+    BACK_FIELD_NUMBER: _builtins.int
+    front: _builtins.str
+    back: _builtins.str
+    def __init__(
+        self,
+        *,
+        front: _builtins.str = ...,
+        back: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["back", b"back", "front", b"front"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Spread: _TypeAlias = Spread  # noqa: Y015
+
+@_typing.final
+class Butterfly(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FRONT_FIELD_NUMBER: _builtins.int
+    MIDDLE_FIELD_NUMBER: _builtins.int
+    BACK_FIELD_NUMBER: _builtins.int
+    front: _builtins.str
+    middle: _builtins.str
+    back: _builtins.str
+    def __init__(
+        self,
+        *,
+        front: _builtins.str = ...,
+        middle: _builtins.str = ...,
+        back: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["back", b"back", "front", b"front", "middle", b"middle"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Butterfly: _TypeAlias = Butterfly  # noqa: Y015
+
+@_typing.final
+class TradableSymbol(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FLAT_FIELD_NUMBER: _builtins.int
+    SPREAD_FIELD_NUMBER: _builtins.int
+    BUTTERFLY_FIELD_NUMBER: _builtins.int
+    flat: _builtins.str
+    @_builtins.property
+    def spread(self) -> Global___Spread: ...
+    @_builtins.property
+    def butterfly(self) -> Global___Butterfly: ...
+    def __init__(
+        self,
+        *,
+        flat: _builtins.str = ...,
+        spread: Global___Spread | None = ...,
+        butterfly: Global___Butterfly | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["butterfly", b"butterfly", "flat", b"flat", "spread", b"spread", "symbol", b"symbol"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["butterfly", b"butterfly", "flat", b"flat", "spread", b"spread", "symbol", b"symbol"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_symbol: _TypeAlias = _typing.Literal["flat", "spread", "butterfly"]  # noqa: Y015
+    _WhichOneofArgType_symbol: _TypeAlias = _typing.Literal["symbol", b"symbol"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_symbol) -> _WhichOneofReturnType_symbol | None: ...
+
+Global___TradableSymbol: _TypeAlias = TradableSymbol  # noqa: Y015
@@ -0,0 +1,507 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from onyx_otc.v2 import common_pb2 as _common_pb2
+from onyx_otc.v2 import types_pb2 as _types_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class NewOrderRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CLIENT_ORDER_ID_FIELD_NUMBER: _builtins.int
+    ACCOUNT_ID_FIELD_NUMBER: _builtins.int
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    QUANTITY_FIELD_NUMBER: _builtins.int
+    SIDE_FIELD_NUMBER: _builtins.int
+    ORDER_TYPE_FIELD_NUMBER: _builtins.int
+    PRICE_FIELD_NUMBER: _builtins.int
+    EXCHANGE_FIELD_NUMBER: _builtins.int
+    client_order_id: _builtins.str
+    account_id: _builtins.str
+    side: _types_pb2.Side.ValueType
+    order_type: _types_pb2.OrderType.ValueType
+    exchange: _types_pb2.Exchange.ValueType
+    @_builtins.property
+    def symbol(self) -> _common_pb2.TradableSymbol: ...
+    @_builtins.property
+    def quantity(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def price(self) -> _common_pb2.Decimal: ...
+    def __init__(
+        self,
+        *,
+        client_order_id: _builtins.str | None = ...,
+        account_id: _builtins.str = ...,
+        symbol: _common_pb2.TradableSymbol | None = ...,
+        quantity: _common_pb2.Decimal | None = ...,
+        side: _types_pb2.Side.ValueType = ...,
+        order_type: _types_pb2.OrderType.ValueType = ...,
+        price: _common_pb2.Decimal | None = ...,
+        exchange: _types_pb2.Exchange.ValueType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_client_order_id", b"_client_order_id", "_exchange", b"_exchange", "client_order_id", b"client_order_id", "exchange", b"exchange", "price", b"price", "quantity", b"quantity", "symbol", b"symbol"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_client_order_id", b"_client_order_id", "_exchange", b"_exchange", "account_id", b"account_id", "client_order_id", b"client_order_id", "exchange", b"exchange", "order_type", b"order_type", "price", b"price", "quantity", b"quantity", "side", b"side", "symbol", b"symbol"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__client_order_id: _TypeAlias = _typing.Literal["client_order_id"]  # noqa: Y015
+    _WhichOneofArgType__client_order_id: _TypeAlias = _typing.Literal["_client_order_id", b"_client_order_id"]  # noqa: Y015
+    _WhichOneofReturnType__exchange: _TypeAlias = _typing.Literal["exchange"]  # noqa: Y015
+    _WhichOneofArgType__exchange: _TypeAlias = _typing.Literal["_exchange", b"_exchange"]  # noqa: Y015
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__client_order_id) -> _WhichOneofReturnType__client_order_id | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__exchange) -> _WhichOneofReturnType__exchange | None: ...
+
+Global___NewOrderRequest: _TypeAlias = NewOrderRequest  # noqa: Y015
+
+@_typing.final
+class CancelOrderRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ORDER_ID_FIELD_NUMBER: _builtins.int
+    order_id: _builtins.str
+    def __init__(
+        self,
+        *,
+        order_id: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["order_id", b"order_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CancelOrderRequest: _TypeAlias = CancelOrderRequest  # noqa: Y015
+
+@_typing.final
+class TickersChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRODUCTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def products(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        products: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["products", b"products"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___TickersChannel: _TypeAlias = TickersChannel  # noqa: Y015
+
+@_typing.final
+class ContractTickersChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CONTRACTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def contracts(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        contracts: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["contracts", b"contracts"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ContractTickersChannel: _TypeAlias = ContractTickersChannel  # noqa: Y015
+
+@_typing.final
+class RfqChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    SIZE_FIELD_NUMBER: _builtins.int
+    EXCHANGE_FIELD_NUMBER: _builtins.int
+    exchange: _types_pb2.Exchange.ValueType
+    @_builtins.property
+    def symbol(self) -> _common_pb2.TradableSymbol: ...
+    @_builtins.property
+    def size(self) -> _common_pb2.Decimal: ...
+    def __init__(
+        self,
+        *,
+        symbol: _common_pb2.TradableSymbol | None = ...,
+        size: _common_pb2.Decimal | None = ...,
+        exchange: _types_pb2.Exchange.ValueType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_exchange", b"_exchange", "exchange", b"exchange", "size", b"size", "symbol", b"symbol"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_exchange", b"_exchange", "exchange", b"exchange", "size", b"size", "symbol", b"symbol"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__exchange: _TypeAlias = _typing.Literal["exchange"]  # noqa: Y015
+    _WhichOneofArgType__exchange: _TypeAlias = _typing.Literal["_exchange", b"_exchange"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__exchange) -> _WhichOneofReturnType__exchange | None: ...
+
+Global___RfqChannel: _TypeAlias = RfqChannel  # noqa: Y015
+
+@_typing.final
+class OrderBookTopChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRODUCTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def products(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        products: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["products", b"products"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrderBookTopChannel: _TypeAlias = OrderBookTopChannel  # noqa: Y015
+
+@_typing.final
+class ContractOrderBookTopChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CONTRACTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def contracts(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        contracts: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["contracts", b"contracts"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ContractOrderBookTopChannel: _TypeAlias = ContractOrderBookTopChannel  # noqa: Y015
+
+@_typing.final
+class OrderBookChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    EXCHANGE_FIELD_NUMBER: _builtins.int
+    exchange: _types_pb2.Exchange.ValueType
+    @_builtins.property
+    def symbol(self) -> _common_pb2.TradableSymbol: ...
+    def __init__(
+        self,
+        *,
+        symbol: _common_pb2.TradableSymbol | None = ...,
+        exchange: _types_pb2.Exchange.ValueType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_exchange", b"_exchange", "exchange", b"exchange", "symbol", b"symbol"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_exchange", b"_exchange", "exchange", b"exchange", "symbol", b"symbol"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__exchange: _TypeAlias = _typing.Literal["exchange"]  # noqa: Y015
+    _WhichOneofArgType__exchange: _TypeAlias = _typing.Literal["_exchange", b"_exchange"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__exchange) -> _WhichOneofReturnType__exchange | None: ...
+
+Global___OrderBookChannel: _TypeAlias = OrderBookChannel  # noqa: Y015
+
+@_typing.final
+class DyTickerProduct(_message.Message):
+    """One dynamic-pricer cross-product subscription: the product-pair key plus the
+    target unit the difference should be priced in (e.g. "05brg-brtsw" + "bbl").
+    Optional cross-tenor strip start tenors (e.g. "u26"/"z26"); both empty ->
+    matched same-tenor differences (default), both set -> stepped strip.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    KEY_FIELD_NUMBER: _builtins.int
+    UNIT_FIELD_NUMBER: _builtins.int
+    FRONT_TENOR_FIELD_NUMBER: _builtins.int
+    BACK_TENOR_FIELD_NUMBER: _builtins.int
+    key: _builtins.str
+    unit: _builtins.str
+    front_tenor: _builtins.str
+    back_tenor: _builtins.str
+    def __init__(
+        self,
+        *,
+        key: _builtins.str = ...,
+        unit: _builtins.str = ...,
+        front_tenor: _builtins.str = ...,
+        back_tenor: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["back_tenor", b"back_tenor", "front_tenor", b"front_tenor", "key", b"key", "unit", b"unit"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DyTickerProduct: _TypeAlias = DyTickerProduct  # noqa: Y015
+
+@_typing.final
+class DyTickerChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRODUCTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def products(self) -> _containers.RepeatedCompositeFieldContainer[Global___DyTickerProduct]: ...
+    def __init__(
+        self,
+        *,
+        products: _abc.Iterable[Global___DyTickerProduct] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["products", b"products"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DyTickerChannel: _TypeAlias = DyTickerChannel  # noqa: Y015
+
+@_typing.final
+class ServerInfoChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ServerInfoChannel: _TypeAlias = ServerInfoChannel  # noqa: Y015
+
+@_typing.final
+class OrdersChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrdersChannel: _TypeAlias = OrdersChannel  # noqa: Y015
+
+@_typing.final
+class Auth(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TOKEN_FIELD_NUMBER: _builtins.int
+    token: _builtins.str
+    def __init__(
+        self,
+        *,
+        token: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["token", b"token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Auth: _TypeAlias = Auth  # noqa: Y015
+
+@_typing.final
+class NotificationsChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NotificationsChannel: _TypeAlias = NotificationsChannel  # noqa: Y015
+
+@_typing.final
+class Subscribe(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SERVER_INFO_FIELD_NUMBER: _builtins.int
+    ORDERS_FIELD_NUMBER: _builtins.int
+    TICKERS_FIELD_NUMBER: _builtins.int
+    RFQ_CHANNEL_FIELD_NUMBER: _builtins.int
+    ORDER_BOOK_TOP_FIELD_NUMBER: _builtins.int
+    ORDER_BOOK_FIELD_NUMBER: _builtins.int
+    DY_TICKER_FIELD_NUMBER: _builtins.int
+    NOTIFICATIONS_FIELD_NUMBER: _builtins.int
+    CONTRACT_TICKERS_FIELD_NUMBER: _builtins.int
+    CONTRACT_ORDER_BOOK_TOP_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def server_info(self) -> Global___ServerInfoChannel: ...
+    @_builtins.property
+    def orders(self) -> Global___OrdersChannel: ...
+    @_builtins.property
+    def tickers(self) -> Global___TickersChannel: ...
+    @_builtins.property
+    def rfq_channel(self) -> Global___RfqChannel: ...
+    @_builtins.property
+    def order_book_top(self) -> Global___OrderBookTopChannel: ...
+    @_builtins.property
+    def order_book(self) -> Global___OrderBookChannel: ...
+    @_builtins.property
+    def dy_ticker(self) -> Global___DyTickerChannel: ...
+    @_builtins.property
+    def notifications(self) -> Global___NotificationsChannel: ...
+    @_builtins.property
+    def contract_tickers(self) -> Global___ContractTickersChannel: ...
+    @_builtins.property
+    def contract_order_book_top(self) -> Global___ContractOrderBookTopChannel: ...
+    def __init__(
+        self,
+        *,
+        server_info: Global___ServerInfoChannel | None = ...,
+        orders: Global___OrdersChannel | None = ...,
+        tickers: Global___TickersChannel | None = ...,
+        rfq_channel: Global___RfqChannel | None = ...,
+        order_book_top: Global___OrderBookTopChannel | None = ...,
+        order_book: Global___OrderBookChannel | None = ...,
+        dy_ticker: Global___DyTickerChannel | None = ...,
+        notifications: Global___NotificationsChannel | None = ...,
+        contract_tickers: Global___ContractTickersChannel | None = ...,
+        contract_order_book_top: Global___ContractOrderBookTopChannel | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "contract_order_book_top", b"contract_order_book_top", "contract_tickers", b"contract_tickers", "dy_ticker", b"dy_ticker", "notifications", b"notifications", "order_book", b"order_book", "order_book_top", b"order_book_top", "orders", b"orders", "rfq_channel", b"rfq_channel", "server_info", b"server_info", "tickers", b"tickers"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "contract_order_book_top", b"contract_order_book_top", "contract_tickers", b"contract_tickers", "dy_ticker", b"dy_ticker", "notifications", b"notifications", "order_book", b"order_book", "order_book_top", b"order_book_top", "orders", b"orders", "rfq_channel", b"rfq_channel", "server_info", b"server_info", "tickers", b"tickers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_channel: _TypeAlias = _typing.Literal["server_info", "orders", "tickers", "rfq_channel", "order_book_top", "order_book", "dy_ticker", "notifications", "contract_tickers", "contract_order_book_top"]  # noqa: Y015
+    _WhichOneofArgType_channel: _TypeAlias = _typing.Literal["channel", b"channel"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_channel) -> _WhichOneofReturnType_channel | None: ...
+
+Global___Subscribe: _TypeAlias = Subscribe  # noqa: Y015
+
+@_typing.final
+class Unsubscribe(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SERVER_INFO_FIELD_NUMBER: _builtins.int
+    ORDERS_FIELD_NUMBER: _builtins.int
+    TICKERS_FIELD_NUMBER: _builtins.int
+    RFQ_CHANNEL_FIELD_NUMBER: _builtins.int
+    ORDER_BOOK_TOP_FIELD_NUMBER: _builtins.int
+    ORDER_BOOK_FIELD_NUMBER: _builtins.int
+    DY_TICKER_FIELD_NUMBER: _builtins.int
+    NOTIFICATIONS_FIELD_NUMBER: _builtins.int
+    CONTRACT_TICKERS_FIELD_NUMBER: _builtins.int
+    CONTRACT_ORDER_BOOK_TOP_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def server_info(self) -> Global___ServerInfoChannel: ...
+    @_builtins.property
+    def orders(self) -> Global___OrdersChannel: ...
+    @_builtins.property
+    def tickers(self) -> Global___TickersChannel: ...
+    @_builtins.property
+    def rfq_channel(self) -> Global___RfqChannel: ...
+    @_builtins.property
+    def order_book_top(self) -> Global___OrderBookTopChannel: ...
+    @_builtins.property
+    def order_book(self) -> Global___OrderBookChannel: ...
+    @_builtins.property
+    def dy_ticker(self) -> Global___DyTickerChannel: ...
+    @_builtins.property
+    def notifications(self) -> Global___NotificationsChannel: ...
+    @_builtins.property
+    def contract_tickers(self) -> Global___ContractTickersChannel: ...
+    @_builtins.property
+    def contract_order_book_top(self) -> Global___ContractOrderBookTopChannel: ...
+    def __init__(
+        self,
+        *,
+        server_info: Global___ServerInfoChannel | None = ...,
+        orders: Global___OrdersChannel | None = ...,
+        tickers: Global___TickersChannel | None = ...,
+        rfq_channel: Global___RfqChannel | None = ...,
+        order_book_top: Global___OrderBookTopChannel | None = ...,
+        order_book: Global___OrderBookChannel | None = ...,
+        dy_ticker: Global___DyTickerChannel | None = ...,
+        notifications: Global___NotificationsChannel | None = ...,
+        contract_tickers: Global___ContractTickersChannel | None = ...,
+        contract_order_book_top: Global___ContractOrderBookTopChannel | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "contract_order_book_top", b"contract_order_book_top", "contract_tickers", b"contract_tickers", "dy_ticker", b"dy_ticker", "notifications", b"notifications", "order_book", b"order_book", "order_book_top", b"order_book_top", "orders", b"orders", "rfq_channel", b"rfq_channel", "server_info", b"server_info", "tickers", b"tickers"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "contract_order_book_top", b"contract_order_book_top", "contract_tickers", b"contract_tickers", "dy_ticker", b"dy_ticker", "notifications", b"notifications", "order_book", b"order_book", "order_book_top", b"order_book_top", "orders", b"orders", "rfq_channel", b"rfq_channel", "server_info", b"server_info", "tickers", b"tickers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_channel: _TypeAlias = _typing.Literal["server_info", "orders", "tickers", "rfq_channel", "order_book_top", "order_book", "dy_ticker", "notifications", "contract_tickers", "contract_order_book_top"]  # noqa: Y015
+    _WhichOneofArgType_channel: _TypeAlias = _typing.Literal["channel", b"channel"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_channel) -> _WhichOneofReturnType_channel | None: ...
+
+Global___Unsubscribe: _TypeAlias = Unsubscribe  # noqa: Y015
+
+@_typing.final
+class OtcRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    METHOD_FIELD_NUMBER: _builtins.int
+    AUTH_FIELD_NUMBER: _builtins.int
+    SUBSCRIBE_FIELD_NUMBER: _builtins.int
+    UNSUBSCRIBE_FIELD_NUMBER: _builtins.int
+    ORDER_FIELD_NUMBER: _builtins.int
+    CANCEL_ORDER_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    method: _types_pb2.Method.ValueType
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def auth(self) -> Global___Auth: ...
+    @_builtins.property
+    def subscribe(self) -> Global___Subscribe: ...
+    @_builtins.property
+    def unsubscribe(self) -> Global___Unsubscribe: ...
+    @_builtins.property
+    def order(self) -> Global___NewOrderRequest: ...
+    @_builtins.property
+    def cancel_order(self) -> Global___CancelOrderRequest: ...
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        method: _types_pb2.Method.ValueType = ...,
+        auth: Global___Auth | None = ...,
+        subscribe: Global___Subscribe | None = ...,
+        unsubscribe: Global___Unsubscribe | None = ...,
+        order: Global___NewOrderRequest | None = ...,
+        cancel_order: Global___CancelOrderRequest | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["auth", b"auth", "cancel_order", b"cancel_order", "order", b"order", "request", b"request", "subscribe", b"subscribe", "timestamp", b"timestamp", "unsubscribe", b"unsubscribe"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["auth", b"auth", "cancel_order", b"cancel_order", "id", b"id", "method", b"method", "order", b"order", "request", b"request", "subscribe", b"subscribe", "timestamp", b"timestamp", "unsubscribe", b"unsubscribe"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_request: _TypeAlias = _typing.Literal["auth", "subscribe", "unsubscribe", "order", "cancel_order"]  # noqa: Y015
+    _WhichOneofArgType_request: _TypeAlias = _typing.Literal["request", b"request"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_request) -> _WhichOneofReturnType_request | None: ...
+
+Global___OtcRequest: _TypeAlias = OtcRequest  # noqa: Y015
@@ -0,0 +1,961 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from onyx_otc.v2 import common_pb2 as _common_pb2
+from onyx_otc.v2 import types_pb2 as _types_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class Trader(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    ACCOUNT_NAME_FIELD_NUMBER: _builtins.int
+    FULL_NAME_FIELD_NUMBER: _builtins.int
+    EMAIL_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    account_name: _builtins.str
+    full_name: _builtins.str
+    email: _builtins.str
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+        account_name: _builtins.str = ...,
+        full_name: _builtins.str = ...,
+        email: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["account_name", b"account_name", "email", b"email", "full_name", b"full_name", "id", b"id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Trader: _TypeAlias = Trader  # noqa: Y015
+
+@_typing.final
+class PriceAmount(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRICE_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def price(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def amount(self) -> _common_pb2.Decimal: ...
+    def __init__(
+        self,
+        *,
+        price: _common_pb2.Decimal | None = ...,
+        amount: _common_pb2.Decimal | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "price", b"price"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "price", b"price"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PriceAmount: _TypeAlias = PriceAmount  # noqa: Y015
+
+@_typing.final
+class Ticker(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    MID_FIELD_NUMBER: _builtins.int
+    FULL_PRICE_FIELD_NUMBER: _builtins.int
+    ACCRUED_PRICE_FIELD_NUMBER: _builtins.int
+    PRODUCT_SYMBOL_FIELD_NUMBER: _builtins.int
+    symbol: _builtins.str
+    product_symbol: _builtins.str
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def mid(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def full_price(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def accrued_price(self) -> _common_pb2.Decimal: ...
+    def __init__(
+        self,
+        *,
+        symbol: _builtins.str = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        mid: _common_pb2.Decimal | None = ...,
+        full_price: _common_pb2.Decimal | None = ...,
+        accrued_price: _common_pb2.Decimal | None = ...,
+        product_symbol: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["accrued_price", b"accrued_price", "full_price", b"full_price", "mid", b"mid", "timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["accrued_price", b"accrued_price", "full_price", b"full_price", "mid", b"mid", "product_symbol", b"product_symbol", "symbol", b"symbol", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Ticker: _TypeAlias = Ticker  # noqa: Y015
+
+@_typing.final
+class Fee(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CURRENCY_FIELD_NUMBER: _builtins.int
+    SIGNED_AMOUNT_FIELD_NUMBER: _builtins.int
+    RATE_FIELD_NUMBER: _builtins.int
+    currency: _builtins.str
+    @_builtins.property
+    def signed_amount(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def rate(self) -> _common_pb2.Decimal: ...
+    def __init__(
+        self,
+        *,
+        currency: _builtins.str = ...,
+        signed_amount: _common_pb2.Decimal | None = ...,
+        rate: _common_pb2.Decimal | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["rate", b"rate", "signed_amount", b"signed_amount"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["currency", b"currency", "rate", b"rate", "signed_amount", b"signed_amount"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Fee: _TypeAlias = Fee  # noqa: Y015
+
+@_typing.final
+class Execution(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    ORDER_ID_FIELD_NUMBER: _builtins.int
+    CLIENT_ORDER_ID_FIELD_NUMBER: _builtins.int
+    ACCOUNT_ID_FIELD_NUMBER: _builtins.int
+    EXCHANGE_FIELD_NUMBER: _builtins.int
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    PRICE_FIELD_NUMBER: _builtins.int
+    SIDE_FIELD_NUMBER: _builtins.int
+    CREATED_TIMESTAMP_FIELD_NUMBER: _builtins.int
+    FEE_FIELD_NUMBER: _builtins.int
+    USER_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    order_id: _builtins.str
+    client_order_id: _builtins.str
+    account_id: _builtins.str
+    exchange: _types_pb2.Exchange.ValueType
+    symbol: _builtins.str
+    side: _types_pb2.Side.ValueType
+    @_builtins.property
+    def amount(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def price(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def created_timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def fee(self) -> Global___Fee: ...
+    @_builtins.property
+    def user(self) -> Global___Trader: ...
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+        order_id: _builtins.str = ...,
+        client_order_id: _builtins.str = ...,
+        account_id: _builtins.str = ...,
+        exchange: _types_pb2.Exchange.ValueType = ...,
+        symbol: _builtins.str = ...,
+        amount: _common_pb2.Decimal | None = ...,
+        price: _common_pb2.Decimal | None = ...,
+        side: _types_pb2.Side.ValueType = ...,
+        created_timestamp: _timestamp_pb2.Timestamp | None = ...,
+        fee: Global___Fee | None = ...,
+        user: Global___Trader | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "created_timestamp", b"created_timestamp", "fee", b"fee", "price", b"price", "user", b"user"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["account_id", b"account_id", "amount", b"amount", "client_order_id", b"client_order_id", "created_timestamp", b"created_timestamp", "exchange", b"exchange", "fee", b"fee", "id", b"id", "order_id", b"order_id", "price", b"price", "side", b"side", "symbol", b"symbol", "user", b"user"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Execution: _TypeAlias = Execution  # noqa: Y015
+
+@_typing.final
+class Tickers(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TICKERS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def tickers(self) -> _containers.RepeatedCompositeFieldContainer[Global___Ticker]: ...
+    def __init__(
+        self,
+        *,
+        tickers: _abc.Iterable[Global___Ticker] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["tickers", b"tickers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Tickers: _TypeAlias = Tickers  # noqa: Y015
+
+@_typing.final
+class DyTicker(_message.Message):
+    """A dynamic-pricer cross-product difference FV, priced in the client-chosen
+    unit (self-describing so the client knows the unit of `mid`).
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    PRODUCT_SYMBOL_FIELD_NUMBER: _builtins.int
+    MID_FIELD_NUMBER: _builtins.int
+    UNIT_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    symbol: _builtins.str
+    product_symbol: _builtins.str
+    unit: _builtins.str
+    @_builtins.property
+    def mid(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    def __init__(
+        self,
+        *,
+        symbol: _builtins.str = ...,
+        product_symbol: _builtins.str = ...,
+        mid: _common_pb2.Decimal | None = ...,
+        unit: _builtins.str = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["mid", b"mid", "timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["mid", b"mid", "product_symbol", b"product_symbol", "symbol", b"symbol", "timestamp", b"timestamp", "unit", b"unit"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DyTicker: _TypeAlias = DyTicker  # noqa: Y015
+
+@_typing.final
+class DyTickers(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DY_TICKERS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def dy_tickers(self) -> _containers.RepeatedCompositeFieldContainer[Global___DyTicker]: ...
+    def __init__(
+        self,
+        *,
+        dy_tickers: _abc.Iterable[Global___DyTicker] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["dy_tickers", b"dy_tickers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DyTickers: _TypeAlias = DyTickers  # noqa: Y015
+
+@_typing.final
+class LiveWebsocket(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SOCKET_UID_FIELD_NUMBER: _builtins.int
+    MESSAGE_RECEIVED_FIELD_NUMBER: _builtins.int
+    MESSAGE_SENT_FIELD_NUMBER: _builtins.int
+    STARTED_FIELD_NUMBER: _builtins.int
+    CURRENT_TIME_FIELD_NUMBER: _builtins.int
+    LAST_MESSAGE_RECEIVED_FIELD_NUMBER: _builtins.int
+    LAST_MESSAGE_SENT_FIELD_NUMBER: _builtins.int
+    CLIENT_TYPE_FIELD_NUMBER: _builtins.int
+    REMOTE_IP_FIELD_NUMBER: _builtins.int
+    PROTOCOL_FIELD_NUMBER: _builtins.int
+    socket_uid: _builtins.str
+    message_received: _builtins.int
+    message_sent: _builtins.int
+    client_type: _builtins.str
+    remote_ip: _builtins.str
+    protocol: _builtins.str
+    @_builtins.property
+    def started(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def current_time(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def last_message_received(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def last_message_sent(self) -> _timestamp_pb2.Timestamp: ...
+    def __init__(
+        self,
+        *,
+        socket_uid: _builtins.str = ...,
+        message_received: _builtins.int = ...,
+        message_sent: _builtins.int = ...,
+        started: _timestamp_pb2.Timestamp | None = ...,
+        current_time: _timestamp_pb2.Timestamp | None = ...,
+        last_message_received: _timestamp_pb2.Timestamp | None = ...,
+        last_message_sent: _timestamp_pb2.Timestamp | None = ...,
+        client_type: _builtins.str = ...,
+        remote_ip: _builtins.str = ...,
+        protocol: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["current_time", b"current_time", "last_message_received", b"last_message_received", "last_message_sent", b"last_message_sent", "started", b"started"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["client_type", b"client_type", "current_time", b"current_time", "last_message_received", b"last_message_received", "last_message_sent", b"last_message_sent", "message_received", b"message_received", "message_sent", b"message_sent", "protocol", b"protocol", "remote_ip", b"remote_ip", "socket_uid", b"socket_uid", "started", b"started"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LiveWebsocket: _TypeAlias = LiveWebsocket  # noqa: Y015
+
+@_typing.final
+class ServerInfo(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SOCKET_UID_FIELD_NUMBER: _builtins.int
+    AGE_MILLIS_FIELD_NUMBER: _builtins.int
+    LIVE_WEBSOCKETS_FIELD_NUMBER: _builtins.int
+    socket_uid: _builtins.str
+    age_millis: _builtins.int
+    @_builtins.property
+    def live_websockets(self) -> _containers.RepeatedCompositeFieldContainer[Global___LiveWebsocket]: ...
+    def __init__(
+        self,
+        *,
+        socket_uid: _builtins.str = ...,
+        age_millis: _builtins.int = ...,
+        live_websockets: _abc.Iterable[Global___LiveWebsocket] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["age_millis", b"age_millis", "live_websockets", b"live_websockets", "socket_uid", b"socket_uid"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ServerInfo: _TypeAlias = ServerInfo  # noqa: Y015
+
+@_typing.final
+class OtcQuoteSide(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRICE_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def price(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def amount(self) -> _common_pb2.Decimal: ...
+    def __init__(
+        self,
+        *,
+        price: _common_pb2.Decimal | None = ...,
+        amount: _common_pb2.Decimal | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "price", b"price"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "price", b"price"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OtcQuoteSide: _TypeAlias = OtcQuoteSide  # noqa: Y015
+
+@_typing.final
+class OtcQuote(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    EXCHANGE_FIELD_NUMBER: _builtins.int
+    BUY_FIELD_NUMBER: _builtins.int
+    SELL_FIELD_NUMBER: _builtins.int
+    MID_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    PRODUCT_SYMBOL_FIELD_NUMBER: _builtins.int
+    exchange: _types_pb2.Exchange.ValueType
+    product_symbol: _builtins.str
+    @_builtins.property
+    def symbol(self) -> _common_pb2.TradableSymbol: ...
+    @_builtins.property
+    def buy(self) -> Global___OtcQuoteSide: ...
+    @_builtins.property
+    def sell(self) -> Global___OtcQuoteSide: ...
+    @_builtins.property
+    def mid(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    def __init__(
+        self,
+        *,
+        symbol: _common_pb2.TradableSymbol | None = ...,
+        exchange: _types_pb2.Exchange.ValueType = ...,
+        buy: Global___OtcQuoteSide | None = ...,
+        sell: Global___OtcQuoteSide | None = ...,
+        mid: _common_pb2.Decimal | None = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        product_symbol: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_buy", b"_buy", "_sell", b"_sell", "buy", b"buy", "mid", b"mid", "sell", b"sell", "symbol", b"symbol", "timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_buy", b"_buy", "_sell", b"_sell", "buy", b"buy", "exchange", b"exchange", "mid", b"mid", "product_symbol", b"product_symbol", "sell", b"sell", "symbol", b"symbol", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__buy: _TypeAlias = _typing.Literal["buy"]  # noqa: Y015
+    _WhichOneofArgType__buy: _TypeAlias = _typing.Literal["_buy", b"_buy"]  # noqa: Y015
+    _WhichOneofReturnType__sell: _TypeAlias = _typing.Literal["sell"]  # noqa: Y015
+    _WhichOneofArgType__sell: _TypeAlias = _typing.Literal["_sell", b"_sell"]  # noqa: Y015
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__buy) -> _WhichOneofReturnType__buy | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__sell) -> _WhichOneofReturnType__sell | None: ...
+
+Global___OtcQuote: _TypeAlias = OtcQuote  # noqa: Y015
+
+@_typing.final
+class OrderBookTop(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    BUY_FIELD_NUMBER: _builtins.int
+    SELL_FIELD_NUMBER: _builtins.int
+    EXCHANGE_FIELD_NUMBER: _builtins.int
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    PRODUCT_SYMBOL_FIELD_NUMBER: _builtins.int
+    exchange: _types_pb2.Exchange.ValueType
+    symbol: _builtins.str
+    product_symbol: _builtins.str
+    @_builtins.property
+    def buy(self) -> Global___PriceAmount: ...
+    @_builtins.property
+    def sell(self) -> Global___PriceAmount: ...
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    def __init__(
+        self,
+        *,
+        buy: Global___PriceAmount | None = ...,
+        sell: Global___PriceAmount | None = ...,
+        exchange: _types_pb2.Exchange.ValueType = ...,
+        symbol: _builtins.str = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        product_symbol: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["buy", b"buy", "sell", b"sell", "timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["buy", b"buy", "exchange", b"exchange", "product_symbol", b"product_symbol", "sell", b"sell", "symbol", b"symbol", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrderBookTop: _TypeAlias = OrderBookTop  # noqa: Y015
+
+@_typing.final
+class OrderBookTops(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ORDER_BOOK_TOPS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def order_book_tops(self) -> _containers.RepeatedCompositeFieldContainer[Global___OrderBookTop]: ...
+    def __init__(
+        self,
+        *,
+        order_book_tops: _abc.Iterable[Global___OrderBookTop] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["order_book_tops", b"order_book_tops"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrderBookTops: _TypeAlias = OrderBookTops  # noqa: Y015
+
+@_typing.final
+class OrderBookLevel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRICE_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def price(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def amount(self) -> _common_pb2.Decimal: ...
+    def __init__(
+        self,
+        *,
+        price: _common_pb2.Decimal | None = ...,
+        amount: _common_pb2.Decimal | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "price", b"price"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "price", b"price"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrderBookLevel: _TypeAlias = OrderBookLevel  # noqa: Y015
+
+@_typing.final
+class OrderBook(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    BIDS_FIELD_NUMBER: _builtins.int
+    ASKS_FIELD_NUMBER: _builtins.int
+    EXCHANGE_FIELD_NUMBER: _builtins.int
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    PRODUCT_SYMBOL_FIELD_NUMBER: _builtins.int
+    exchange: _types_pb2.Exchange.ValueType
+    symbol: _builtins.str
+    product_symbol: _builtins.str
+    @_builtins.property
+    def bids(self) -> _containers.RepeatedCompositeFieldContainer[Global___OrderBookLevel]: ...
+    @_builtins.property
+    def asks(self) -> _containers.RepeatedCompositeFieldContainer[Global___OrderBookLevel]: ...
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    def __init__(
+        self,
+        *,
+        bids: _abc.Iterable[Global___OrderBookLevel] | None = ...,
+        asks: _abc.Iterable[Global___OrderBookLevel] | None = ...,
+        exchange: _types_pb2.Exchange.ValueType = ...,
+        symbol: _builtins.str = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        product_symbol: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["asks", b"asks", "bids", b"bids", "exchange", b"exchange", "product_symbol", b"product_symbol", "symbol", b"symbol", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrderBook: _TypeAlias = OrderBook  # noqa: Y015
+
+@_typing.final
+class OrderBooks(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ORDER_BOOKS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def order_books(self) -> _containers.RepeatedCompositeFieldContainer[Global___OrderBook]: ...
+    def __init__(
+        self,
+        *,
+        order_books: _abc.Iterable[Global___OrderBook] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["order_books", b"order_books"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrderBooks: _TypeAlias = OrderBooks  # noqa: Y015
+
+@_typing.final
+class Order(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    CLIENT_ORDER_ID_FIELD_NUMBER: _builtins.int
+    USER_FIELD_NUMBER: _builtins.int
+    ACCOUNT_ID_FIELD_NUMBER: _builtins.int
+    EXCHANGE_FIELD_NUMBER: _builtins.int
+    PRODUCT_SYMBOL_FIELD_NUMBER: _builtins.int
+    SYMBOL_FIELD_NUMBER: _builtins.int
+    ORDER_TYPE_FIELD_NUMBER: _builtins.int
+    ORDER_STATE_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    PRICE_FIELD_NUMBER: _builtins.int
+    SIDE_FIELD_NUMBER: _builtins.int
+    CREATED_TIMESTAMP_FIELD_NUMBER: _builtins.int
+    EXECUTED_AVG_PRICE_FIELD_NUMBER: _builtins.int
+    EXECUTED_AMOUNT_FIELD_NUMBER: _builtins.int
+    EXECUTIONS_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    client_order_id: _builtins.str
+    account_id: _builtins.str
+    exchange: _types_pb2.Exchange.ValueType
+    product_symbol: _builtins.str
+    order_type: _types_pb2.OrderType.ValueType
+    order_state: _types_pb2.OrderState.ValueType
+    side: _types_pb2.Side.ValueType
+    @_builtins.property
+    def user(self) -> Global___Trader: ...
+    @_builtins.property
+    def symbol(self) -> _common_pb2.TradableSymbol: ...
+    @_builtins.property
+    def amount(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def price(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def created_timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def executed_avg_price(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def executed_amount(self) -> _common_pb2.Decimal: ...
+    @_builtins.property
+    def executions(self) -> _containers.RepeatedCompositeFieldContainer[Global___Execution]: ...
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+        client_order_id: _builtins.str = ...,
+        user: Global___Trader | None = ...,
+        account_id: _builtins.str = ...,
+        exchange: _types_pb2.Exchange.ValueType = ...,
+        product_symbol: _builtins.str = ...,
+        symbol: _common_pb2.TradableSymbol | None = ...,
+        order_type: _types_pb2.OrderType.ValueType = ...,
+        order_state: _types_pb2.OrderState.ValueType = ...,
+        amount: _common_pb2.Decimal | None = ...,
+        price: _common_pb2.Decimal | None = ...,
+        side: _types_pb2.Side.ValueType = ...,
+        created_timestamp: _timestamp_pb2.Timestamp | None = ...,
+        executed_avg_price: _common_pb2.Decimal | None = ...,
+        executed_amount: _common_pb2.Decimal | None = ...,
+        executions: _abc.Iterable[Global___Execution] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_executed_amount", b"_executed_amount", "_executed_avg_price", b"_executed_avg_price", "_price", b"_price", "amount", b"amount", "created_timestamp", b"created_timestamp", "executed_amount", b"executed_amount", "executed_avg_price", b"executed_avg_price", "price", b"price", "symbol", b"symbol", "user", b"user"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_executed_amount", b"_executed_amount", "_executed_avg_price", b"_executed_avg_price", "_price", b"_price", "account_id", b"account_id", "amount", b"amount", "client_order_id", b"client_order_id", "created_timestamp", b"created_timestamp", "exchange", b"exchange", "executed_amount", b"executed_amount", "executed_avg_price", b"executed_avg_price", "executions", b"executions", "id", b"id", "order_state", b"order_state", "order_type", b"order_type", "price", b"price", "product_symbol", b"product_symbol", "side", b"side", "symbol", b"symbol", "user", b"user"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__executed_amount: _TypeAlias = _typing.Literal["executed_amount"]  # noqa: Y015
+    _WhichOneofArgType__executed_amount: _TypeAlias = _typing.Literal["_executed_amount", b"_executed_amount"]  # noqa: Y015
+    _WhichOneofReturnType__executed_avg_price: _TypeAlias = _typing.Literal["executed_avg_price"]  # noqa: Y015
+    _WhichOneofArgType__executed_avg_price: _TypeAlias = _typing.Literal["_executed_avg_price", b"_executed_avg_price"]  # noqa: Y015
+    _WhichOneofReturnType__price: _TypeAlias = _typing.Literal["price"]  # noqa: Y015
+    _WhichOneofArgType__price: _TypeAlias = _typing.Literal["_price", b"_price"]  # noqa: Y015
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__executed_amount) -> _WhichOneofReturnType__executed_amount | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__executed_avg_price) -> _WhichOneofReturnType__executed_avg_price | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__price) -> _WhichOneofReturnType__price | None: ...
+
+Global___Order: _TypeAlias = Order  # noqa: Y015
+
+@_typing.final
+class NotificationTarget(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    BROADCAST_FIELD_NUMBER: _builtins.int
+    USER_ID_FIELD_NUMBER: _builtins.int
+    broadcast: _builtins.bool
+    user_id: _builtins.str
+    def __init__(
+        self,
+        *,
+        broadcast: _builtins.bool = ...,
+        user_id: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["broadcast", b"broadcast", "to", b"to", "user_id", b"user_id"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["broadcast", b"broadcast", "to", b"to", "user_id", b"user_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_to: _TypeAlias = _typing.Literal["broadcast", "user_id"]  # noqa: Y015
+    _WhichOneofArgType_to: _TypeAlias = _typing.Literal["to", b"to"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_to) -> _WhichOneofReturnType_to | None: ...
+
+Global___NotificationTarget: _TypeAlias = NotificationTarget  # noqa: Y015
+
+@_typing.final
+class Notification(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    KIND_FIELD_NUMBER: _builtins.int
+    SEVERITY_FIELD_NUMBER: _builtins.int
+    TARGET_FIELD_NUMBER: _builtins.int
+    TITLE_FIELD_NUMBER: _builtins.int
+    MESSAGE_FIELD_NUMBER: _builtins.int
+    META_FIELD_NUMBER: _builtins.int
+    SOURCE_FIELD_NUMBER: _builtins.int
+    CATEGORY_FIELD_NUMBER: _builtins.int
+    READ_FIELD_NUMBER: _builtins.int
+    ACTIVE_FIELD_NUMBER: _builtins.int
+    id: _builtins.int
+    kind: _types_pb2.NotificationKind.ValueType
+    severity: _types_pb2.Level.ValueType
+    title: _builtins.str
+    message: _builtins.str
+    meta: _builtins.str
+    source: _types_pb2.NotificationSource.ValueType
+    category: _types_pb2.NotificationCategory.ValueType
+    read: _builtins.bool
+    active: _builtins.bool
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def target(self) -> Global___NotificationTarget: ...
+    def __init__(
+        self,
+        *,
+        id: _builtins.int = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        kind: _types_pb2.NotificationKind.ValueType = ...,
+        severity: _types_pb2.Level.ValueType = ...,
+        target: Global___NotificationTarget | None = ...,
+        title: _builtins.str = ...,
+        message: _builtins.str = ...,
+        meta: _builtins.str = ...,
+        source: _types_pb2.NotificationSource.ValueType = ...,
+        category: _types_pb2.NotificationCategory.ValueType = ...,
+        read: _builtins.bool = ...,
+        active: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["target", b"target", "timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["active", b"active", "category", b"category", "id", b"id", "kind", b"kind", "message", b"message", "meta", b"meta", "read", b"read", "severity", b"severity", "source", b"source", "target", b"target", "timestamp", b"timestamp", "title", b"title"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Notification: _TypeAlias = Notification  # noqa: Y015
+
+@_typing.final
+class Notifications(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NOTIFICATIONS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def notifications(self) -> _containers.RepeatedCompositeFieldContainer[Global___Notification]: ...
+    def __init__(
+        self,
+        *,
+        notifications: _abc.Iterable[Global___Notification] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["notifications", b"notifications"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Notifications: _TypeAlias = Notifications  # noqa: Y015
+
+@_typing.final
+class ChannelMessage(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNEL_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    ORDER_FIELD_NUMBER: _builtins.int
+    SERVER_INFO_FIELD_NUMBER: _builtins.int
+    TICKERS_FIELD_NUMBER: _builtins.int
+    OTC_QUOTE_FIELD_NUMBER: _builtins.int
+    ORDER_BOOK_TOPS_FIELD_NUMBER: _builtins.int
+    ORDER_BOOKS_FIELD_NUMBER: _builtins.int
+    DY_TICKERS_FIELD_NUMBER: _builtins.int
+    NOTIFICATION_FIELD_NUMBER: _builtins.int
+    NOTIFICATIONS_FIELD_NUMBER: _builtins.int
+    channel: _types_pb2.Channel.ValueType
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def order(self) -> Global___Order: ...
+    @_builtins.property
+    def server_info(self) -> Global___ServerInfo: ...
+    @_builtins.property
+    def tickers(self) -> Global___Tickers: ...
+    @_builtins.property
+    def otc_quote(self) -> Global___OtcQuote: ...
+    @_builtins.property
+    def order_book_tops(self) -> Global___OrderBookTops: ...
+    @_builtins.property
+    def order_books(self) -> Global___OrderBooks: ...
+    @_builtins.property
+    def dy_tickers(self) -> Global___DyTickers: ...
+    @_builtins.property
+    def notification(self) -> Global___Notification: ...
+    @_builtins.property
+    def notifications(self) -> Global___Notifications: ...
+    def __init__(
+        self,
+        *,
+        channel: _types_pb2.Channel.ValueType = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        order: Global___Order | None = ...,
+        server_info: Global___ServerInfo | None = ...,
+        tickers: Global___Tickers | None = ...,
+        otc_quote: Global___OtcQuote | None = ...,
+        order_book_tops: Global___OrderBookTops | None = ...,
+        order_books: Global___OrderBooks | None = ...,
+        dy_tickers: Global___DyTickers | None = ...,
+        notification: Global___Notification | None = ...,
+        notifications: Global___Notifications | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["dy_tickers", b"dy_tickers", "message", b"message", "notification", b"notification", "notifications", b"notifications", "order", b"order", "order_book_tops", b"order_book_tops", "order_books", b"order_books", "otc_quote", b"otc_quote", "server_info", b"server_info", "tickers", b"tickers", "timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "dy_tickers", b"dy_tickers", "message", b"message", "notification", b"notification", "notifications", b"notifications", "order", b"order", "order_book_tops", b"order_book_tops", "order_books", b"order_books", "otc_quote", b"otc_quote", "server_info", b"server_info", "tickers", b"tickers", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_message: _TypeAlias = _typing.Literal["order", "server_info", "tickers", "otc_quote", "order_book_tops", "order_books", "dy_tickers", "notification", "notifications"]  # noqa: Y015
+    _WhichOneofArgType_message: _TypeAlias = _typing.Literal["message", b"message"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_message) -> _WhichOneofReturnType_message | None: ...
+
+Global___ChannelMessage: _TypeAlias = ChannelMessage  # noqa: Y015
+
+@_typing.final
+class Subscription(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNEL_FIELD_NUMBER: _builtins.int
+    MESSAGE_FIELD_NUMBER: _builtins.int
+    STATUS_FIELD_NUMBER: _builtins.int
+    channel: _types_pb2.Channel.ValueType
+    message: _builtins.str
+    status: _types_pb2.SubscriptionStatus.ValueType
+    def __init__(
+        self,
+        *,
+        channel: _types_pb2.Channel.ValueType = ...,
+        message: _builtins.str = ...,
+        status: _types_pb2.SubscriptionStatus.ValueType = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "message", b"message", "status", b"status"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Subscription: _TypeAlias = Subscription  # noqa: Y015
+
+@_typing.final
+class AuthResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MESSAGE_FIELD_NUMBER: _builtins.int
+    message: _builtins.str
+    def __init__(
+        self,
+        *,
+        message: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["message", b"message"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AuthResponse: _TypeAlias = AuthResponse  # noqa: Y015
+
+@_typing.final
+class OtcError(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MESSAGE_FIELD_NUMBER: _builtins.int
+    CODE_FIELD_NUMBER: _builtins.int
+    message: _builtins.str
+    code: _types_pb2.OtcErrorCode.ValueType
+    def __init__(
+        self,
+        *,
+        message: _builtins.str = ...,
+        code: _types_pb2.OtcErrorCode.ValueType = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["code", b"code", "message", b"message"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OtcError: _TypeAlias = OtcError  # noqa: Y015
+
+@_typing.final
+class OrderCanceledResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ORDER_ID_FIELD_NUMBER: _builtins.int
+    MESSAGE_FIELD_NUMBER: _builtins.int
+    order_id: _builtins.str
+    message: _builtins.str
+    def __init__(
+        self,
+        *,
+        order_id: _builtins.str = ...,
+        message: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["message", b"message", "order_id", b"order_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrderCanceledResponse: _TypeAlias = OrderCanceledResponse  # noqa: Y015
+
+@_typing.final
+class OtcResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    ORDER_FIELD_NUMBER: _builtins.int
+    SUBSCRIPTION_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    AUTH_FIELD_NUMBER: _builtins.int
+    ORDER_CANCELED_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def order(self) -> Global___Order: ...
+    @_builtins.property
+    def subscription(self) -> Global___Subscription: ...
+    @_builtins.property
+    def error(self) -> Global___OtcError: ...
+    @_builtins.property
+    def auth(self) -> Global___AuthResponse: ...
+    @_builtins.property
+    def order_canceled(self) -> Global___OrderCanceledResponse: ...
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        order: Global___Order | None = ...,
+        subscription: Global___Subscription | None = ...,
+        error: Global___OtcError | None = ...,
+        auth: Global___AuthResponse | None = ...,
+        order_canceled: Global___OrderCanceledResponse | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["auth", b"auth", "error", b"error", "order", b"order", "order_canceled", b"order_canceled", "response", b"response", "subscription", b"subscription", "timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["auth", b"auth", "error", b"error", "id", b"id", "order", b"order", "order_canceled", b"order_canceled", "response", b"response", "subscription", b"subscription", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_response: _TypeAlias = _typing.Literal["order", "subscription", "error", "auth", "order_canceled"]  # noqa: Y015
+    _WhichOneofArgType_response: _TypeAlias = _typing.Literal["response", b"response"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_response) -> _WhichOneofReturnType_response | None: ...
+
+Global___OtcResponse: _TypeAlias = OtcResponse  # noqa: Y015
+
+@_typing.final
+class OtcResponseMessage(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OTC_RESPONSE_FIELD_NUMBER: _builtins.int
+    CHANNEL_MESSAGE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def otc_response(self) -> Global___OtcResponse: ...
+    @_builtins.property
+    def channel_message(self) -> Global___ChannelMessage: ...
+    def __init__(
+        self,
+        *,
+        otc_response: Global___OtcResponse | None = ...,
+        channel_message: Global___ChannelMessage | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["channel_message", b"channel_message", "data", b"data", "otc_response", b"otc_response"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_message", b"channel_message", "data", b"data", "otc_response", b"otc_response"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_data: _TypeAlias = _typing.Literal["otc_response", "channel_message"]  # noqa: Y015
+    _WhichOneofArgType_data: _TypeAlias = _typing.Literal["data", b"data"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_data) -> _WhichOneofReturnType_data | None: ...
+
+Global___OtcResponseMessage: _TypeAlias = OtcResponseMessage  # noqa: Y015
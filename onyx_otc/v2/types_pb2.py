@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: onyx_otc/v2/types.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'onyx_otc/v2/types.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17onyx_otc/v2/types.proto\x12\x0bonyx_otc.v2*\xab\x02\n\x0cOtcErrorCode\x12\x1e\n\x1aOTC_ERROR_CODE_UNSPECIFIED\x10\x00\x12\"\n\x1eOTC_ERROR_CODE_INVALID_REQUEST\x10\x01\x12\"\n\x1eOTC_ERROR_CODE_NOT_IMPLEMENTED\x10\x02\x12\"\n\x1eOTC_ERROR_CODE_UNAUTHENTICATED\x10\x03\x12$\n OTC_ERROR_CODE_TOO_MANY_REQUESTS\x10\x04\x12!\n\x1dOTC_ERROR_CODE_NOT_SUBSCRIBED\x10\x05\x12\x1c\n\x18OTC_ERROR_CODE_FORBIDDEN\x10\x06\x12(\n$OTC_ERROR_CODE_INTERNAL_SERVER_ERROR\x10\x1e*9\n\x04Side\x12\x14\n\x10SIDE_UNSPECIFIED\x10\x00\x12\x0c\n\x08SIDE_BUY\x10\x01\x12\r\n\tSIDE_SELL\x10\x02*\x83\x01\n\x12SubscriptionStatus\x12#\n\x1fSUBSCRIPTION_STATUS_UNSPECIFIED\x10\x00\x12\"\n\x1eSUBSCRIPTION_STATUS_SUBSCRIBED\x10\x01\x12$\n SUBSCRIPTION_STATUS_UNSUBSCRIBED\x10\x02*\xa7\x01\n\x06Method\x12\x16\n\x12METHOD_UNSPECIFIED\x10\x00\x12\x0f\n\x0bMETHOD_AUTH\x10\x01\x12\x10\n\x0cMETHOD_ORDER\x10\x02\x12\x14\n\x10METHOD_SUBSCRIBE\x10\x03\x12\x16\n\x12METHOD_UNSUBSCRIBE\x10\x04\x12\x1b\n\x17METHOD_UPDATE_DASHBOARD\x10\x05\x12\x17\n\x13METHOD_CANCEL_ORDER\x10\x06*Z\n\x08\x45xchange\x12\x18\n\x14\x45XCHANGE_UNSPECIFIED\x10\x00\x12\x10\n\x0c\x45XCHANGE_ICE\x10\x01\x12\x10\n\x0c\x45XCHANGE_CME\x10\x02\x12\x10\n\x0c\x45XCHANGE_SGX\x10\x03*Z\n\tOrderType\x12\x1a\n\x16ORDER_TYPE_UNSPECIFIED\x10\x00\x12\x1b\n\x17ORDER_TYPE_FILL_OR_KILL\x10\x01\x12\x14\n\x10ORDER_TYPE_LIMIT\x10\x02*\xff\x01\n\nOrderState\x12\x1b\n\x17ORDER_STATE_UNSPECIFIED\x10\x00\x12\x1f\n\x1bORDER_STATE_PENDING_CREATED\x10\x01\x12\x17\n\x13ORDER_STATE_CREATED\x10\x02\x12\x13\n\x0fORDER_STATE_NEW\x10\x03\x12 \n\x1cORDER_STATE_PARTIALLY_FILLED\x10\x04\x12\x16\n\x12ORDER_STATE_FILLED\x10\x06\x12\x19\n\x15ORDER_STATE_CANCELLED\x10\x08\x12\x17\n\x13ORDER_STATE_EXPIRED\x10\t\x12\x17\n\x13ORDER_STATE_ERRORED\x10\n*\xcd\x03\n\x0cTradingError\x12\x1d\n\x19TRADING_ERROR_UNSPECIFIED\x10\x00\x12\x1c\n\x17TRADING_ERROR_FORBIDDEN\x10\x93\x03\x12\x1c\n\x17TRADING_ERROR_NOT_FOUND\x10\x94\x03\x12#\n\x1eTRADING_ERROR_TRADING_DISABLED\x10\x95\x03\x12$\n\x1fTRADING_ERROR_TRADING_SUSPENDED\x10\x96\x03\x12!\n\x1cTRADING_ERROR_NOT_SUBSCRIBED\x10\x97\x03\x12!\n\x1cTRADING_ERROR_INVALID_SYMBOL\x10\x9d\x03\x12 \n\x1bTRADING_ERROR_INVALID_VALUE\x10\xa6\x03\x12 \n\x1bTRADING_ERROR_INVALID_STATE\x10\xa8\x03\x12 \n\x1bTRADING_ERROR_INVALID_PRICE\x10\xa9\x03\x12$\n\x1fTRADING_ERROR_CONTRACT_EXPIRING\x10\xaa\x03\x12!\n\x1cTRADING_ERROR_INTERNAL_ERROR\x10\xf4\x03\x12\"\n\x1dTRADING_ERROR_NOT_IMPLEMENTED\x10\xf5\x03*\xdc\x01\n\x07\x43hannel\x12\x17\n\x13\x43HANNEL_UNSPECIFIED\x10\x00\x12\x12\n\x0e\x43HANNEL_ORDERS\x10\x01\x12\x17\n\x13\x43HANNEL_SERVER_INFO\x10\x02\x12\x13\n\x0f\x43HANNEL_TICKERS\x10\x03\x12\x0f\n\x0b\x43HANNEL_RFQ\x10\x04\x12\x1a\n\x16\x43HANNEL_ORDER_BOOK_TOP\x10\x05\x12\x16\n\x12\x43HANNEL_ORDER_BOOK\x10\x06\x12\x16\n\x12\x43HANNEL_DY_TICKERS\x10\x07\x12\x19\n\x15\x43HANNEL_NOTIFICATIONS\x10\x08*\x9b\x01\n\x10NotificationKind\x12!\n\x1dNOTIFICATION_KIND_UNSPECIFIED\x10\x00\x12\"\n\x1eNOTIFICATION_KIND_SYSTEM_ALERT\x10\x01\x12!\n\x1dNOTIFICATION_KIND_KILL_SWITCH\x10\x02\x12\x1d\n\x19NOTIFICATION_KIND_FV_MARK\x10\x03*f\n\x05Level\x12\x15\n\x11LEVEL_UNSPECIFIED\x10\x00\x12\x0e\n\nLEVEL_INFO\x10\x01\x12\x11\n\rLEVEL_WARNING\x10\x02\x12\x0f\n\x0bLEVEL_ERROR\x10\x03\x12\x12\n\x0eLEVEL_CRITICAL\x10\x04*\x97\x01\n\x12NotificationSource\x12#\n\x1fNOTIFICATION_SOURCE_UNSPECIFIED\x10\x00\x12\x1d\n\x19NOTIFICATION_SOURCE_ADMIN\x10\x01\x12\x1f\n\x1bNOTIFICATION_SOURCE_PRODUCT\x10\x02\x12\x1c\n\x18NOTIFICATION_SOURCE_USER\x10\x03*\xd4\x02\n\x14NotificationCategory\x12%\n!NOTIFICATION_CATEGORY_UNSPECIFIED\x10\x00\x12 \n\x1cNOTIFICATION_CATEGORY_SYSTEM\x10\x01\x12!\n\x1dNOTIFICATION_CATEGORY_TRADING\x10\x02\x12%\n!NOTIFICATION_CATEGORY_MARKET_DATA\x10\x03\x12\x1d\n\x19NOTIFICATION_CATEGORY_RFQ\x10\x04\x12 \n\x1cNOTIFICATION_CATEGORY_TICKER\x10\x05\x12(\n$NOTIFICATION_CATEGORY_ORDER_BOOK_TOP\x10\x06\x12\x1e\n\x1aNOTIFICATION_CATEGORY_USER\x10\x07\x12\x1e\n\x1aNOTIFICATION_CATEGORY_NEWS\x10\x08\x42\x0b\xaa\x02\x08Onyx.Otcb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'onyx_otc.v2.types_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\252\002\010Onyx.Otc'
+  _globals['_OTCERRORCODE']._serialized_start=41
+  _globals['_OTCERRORCODE']._serialized_end=340
+  _globals['_SIDE']._serialized_start=342
+  _globals['_SIDE']._serialized_end=399
+  _globals['_SUBSCRIPTIONSTATUS']._serialized_start=402
+  _globals['_SUBSCRIPTIONSTATUS']._serialized_end=533
+  _globals['_METHOD']._serialized_start=536
+  _globals['_METHOD']._serialized_end=703
+  _globals['_EXCHANGE']._serialized_start=705
+  _globals['_EXCHANGE']._serialized_end=795
+  _globals['_ORDERTYPE']._serialized_start=797
+  _globals['_ORDERTYPE']._serialized_end=887
+  _globals['_ORDERSTATE']._serialized_start=890
+  _globals['_ORDERSTATE']._serialized_end=1145
+  _globals['_TRADINGERROR']._serialized_start=1148
+  _globals['_TRADINGERROR']._serialized_end=1609
+  _globals['_CHANNEL']._serialized_start=1612
+  _globals['_CHANNEL']._serialized_end=1832
+  _globals['_NOTIFICATIONKIND']._serialized_start=1835
+  _globals['_NOTIFICATIONKIND']._serialized_end=1990
+  _globals['_LEVEL']._serialized_start=1992
+  _globals['_LEVEL']._serialized_end=2094
+  _globals['_NOTIFICATIONSOURCE']._serialized_start=2097
+  _globals['_NOTIFICATIONSOURCE']._serialized_end=2248
+  _globals['_NOTIFICATIONCATEGORY']._serialized_start=2251
+  _globals['_NOTIFICATIONCATEGORY']._serialized_end=2591
+# @@protoc_insertion_point(module_scope)
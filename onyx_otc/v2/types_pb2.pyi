@@ -0,0 +1,322 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from google.protobuf import descriptor as _descriptor
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 10):
+    from typing import TypeAlias as _TypeAlias
+else:
+    from typing_extensions import TypeAlias as _TypeAlias
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class _OtcErrorCode:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _OtcErrorCodeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_OtcErrorCode.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    OTC_ERROR_CODE_UNSPECIFIED: _OtcErrorCode.ValueType  # 0
+    OTC_ERROR_CODE_INVALID_REQUEST: _OtcErrorCode.ValueType  # 1
+    OTC_ERROR_CODE_NOT_IMPLEMENTED: _OtcErrorCode.ValueType  # 2
+    OTC_ERROR_CODE_UNAUTHENTICATED: _OtcErrorCode.ValueType  # 3
+    OTC_ERROR_CODE_TOO_MANY_REQUESTS: _OtcErrorCode.ValueType  # 4
+    OTC_ERROR_CODE_NOT_SUBSCRIBED: _OtcErrorCode.ValueType  # 5
+    OTC_ERROR_CODE_FORBIDDEN: _OtcErrorCode.ValueType  # 6
+    OTC_ERROR_CODE_INTERNAL_SERVER_ERROR: _OtcErrorCode.ValueType  # 30
+
+class OtcErrorCode(_OtcErrorCode, metaclass=_OtcErrorCodeEnumTypeWrapper): ...
+
+OTC_ERROR_CODE_UNSPECIFIED: OtcErrorCode.ValueType  # 0
+OTC_ERROR_CODE_INVALID_REQUEST: OtcErrorCode.ValueType  # 1
+OTC_ERROR_CODE_NOT_IMPLEMENTED: OtcErrorCode.ValueType  # 2
+OTC_ERROR_CODE_UNAUTHENTICATED: OtcErrorCode.ValueType  # 3
+OTC_ERROR_CODE_TOO_MANY_REQUESTS: OtcErrorCode.ValueType  # 4
+OTC_ERROR_CODE_NOT_SUBSCRIBED: OtcErrorCode.ValueType  # 5
+OTC_ERROR_CODE_FORBIDDEN: OtcErrorCode.ValueType  # 6
+OTC_ERROR_CODE_INTERNAL_SERVER_ERROR: OtcErrorCode.ValueType  # 30
+Global___OtcErrorCode: _TypeAlias = OtcErrorCode  # noqa: Y015
+
+class _Side:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _SideEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_Side.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    SIDE_UNSPECIFIED: _Side.ValueType  # 0
+    SIDE_BUY: _Side.ValueType  # 1
+    SIDE_SELL: _Side.ValueType  # 2
+
+class Side(_Side, metaclass=_SideEnumTypeWrapper): ...
+
+SIDE_UNSPECIFIED: Side.ValueType  # 0
+SIDE_BUY: Side.ValueType  # 1
+SIDE_SELL: Side.ValueType  # 2
+Global___Side: _TypeAlias = Side  # noqa: Y015
+
+class _SubscriptionStatus:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _SubscriptionStatusEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_SubscriptionStatus.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    SUBSCRIPTION_STATUS_UNSPECIFIED: _SubscriptionStatus.ValueType  # 0
+    SUBSCRIPTION_STATUS_SUBSCRIBED: _SubscriptionStatus.ValueType  # 1
+    SUBSCRIPTION_STATUS_UNSUBSCRIBED: _SubscriptionStatus.ValueType  # 2
+
+class SubscriptionStatus(_SubscriptionStatus, metaclass=_SubscriptionStatusEnumTypeWrapper): ...
+
+SUBSCRIPTION_STATUS_UNSPECIFIED: SubscriptionStatus.ValueType  # 0
+SUBSCRIPTION_STATUS_SUBSCRIBED: SubscriptionStatus.ValueType  # 1
+SUBSCRIPTION_STATUS_UNSUBSCRIBED: SubscriptionStatus.ValueType  # 2
+Global___SubscriptionStatus: _TypeAlias = SubscriptionStatus  # noqa: Y015
+
+class _Method:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _MethodEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_Method.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    METHOD_UNSPECIFIED: _Method.ValueType  # 0
+    METHOD_AUTH: _Method.ValueType  # 1
+    METHOD_ORDER: _Method.ValueType  # 2
+    METHOD_SUBSCRIBE: _Method.ValueType  # 3
+    METHOD_UNSUBSCRIBE: _Method.ValueType  # 4
+    METHOD_UPDATE_DASHBOARD: _Method.ValueType  # 5
+    METHOD_CANCEL_ORDER: _Method.ValueType  # 6
+
+class Method(_Method, metaclass=_MethodEnumTypeWrapper): ...
+
+METHOD_UNSPECIFIED: Method.ValueType  # 0
+METHOD_AUTH: Method.ValueType  # 1
+METHOD_ORDER: Method.ValueType  # 2
+METHOD_SUBSCRIBE: Method.ValueType  # 3
+METHOD_UNSUBSCRIBE: Method.ValueType  # 4
+METHOD_UPDATE_DASHBOARD: Method.ValueType  # 5
+METHOD_CANCEL_ORDER: Method.ValueType  # 6
+Global___Method: _TypeAlias = Method  # noqa: Y015
+
+class _Exchange:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _ExchangeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_Exchange.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    EXCHANGE_UNSPECIFIED: _Exchange.ValueType  # 0
+    EXCHANGE_ICE: _Exchange.ValueType  # 1
+    EXCHANGE_CME: _Exchange.ValueType  # 2
+    EXCHANGE_SGX: _Exchange.ValueType  # 3
+
+class Exchange(_Exchange, metaclass=_ExchangeEnumTypeWrapper): ...
+
+EXCHANGE_UNSPECIFIED: Exchange.ValueType  # 0
+EXCHANGE_ICE: Exchange.ValueType  # 1
+EXCHANGE_CME: Exchange.ValueType  # 2
+EXCHANGE_SGX: Exchange.ValueType  # 3
+Global___Exchange: _TypeAlias = Exchange  # noqa: Y015
+
+class _OrderType:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _OrderTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_OrderType.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    ORDER_TYPE_UNSPECIFIED: _OrderType.ValueType  # 0
+    ORDER_TYPE_FILL_OR_KILL: _OrderType.ValueType  # 1
+    ORDER_TYPE_LIMIT: _OrderType.ValueType  # 2
+
+class OrderType(_OrderType, metaclass=_OrderTypeEnumTypeWrapper): ...
+
+ORDER_TYPE_UNSPECIFIED: OrderType.ValueType  # 0
+ORDER_TYPE_FILL_OR_KILL: OrderType.ValueType  # 1
+ORDER_TYPE_LIMIT: OrderType.ValueType  # 2
+Global___OrderType: _TypeAlias = OrderType  # noqa: Y015
+
+class _OrderState:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _OrderStateEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_OrderState.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    ORDER_STATE_UNSPECIFIED: _OrderState.ValueType  # 0
+    ORDER_STATE_PENDING_CREATED: _OrderState.ValueType  # 1
+    ORDER_STATE_CREATED: _OrderState.ValueType  # 2
+    ORDER_STATE_NEW: _OrderState.ValueType  # 3
+    ORDER_STATE_PARTIALLY_FILLED: _OrderState.ValueType  # 4
+    ORDER_STATE_FILLED: _OrderState.ValueType  # 6
+    ORDER_STATE_CANCELLED: _OrderState.ValueType  # 8
+    ORDER_STATE_EXPIRED: _OrderState.ValueType  # 9
+    ORDER_STATE_ERRORED: _OrderState.ValueType  # 10
+
+class OrderState(_OrderState, metaclass=_OrderStateEnumTypeWrapper): ...
+
+ORDER_STATE_UNSPECIFIED: OrderState.ValueType  # 0
+ORDER_STATE_PENDING_CREATED: OrderState.ValueType  # 1
+ORDER_STATE_CREATED: OrderState.ValueType  # 2
+ORDER_STATE_NEW: OrderState.ValueType  # 3
+ORDER_STATE_PARTIALLY_FILLED: OrderState.ValueType  # 4
+ORDER_STATE_FILLED: OrderState.ValueType  # 6
+ORDER_STATE_CANCELLED: OrderState.ValueType  # 8
+ORDER_STATE_EXPIRED: OrderState.ValueType  # 9
+ORDER_STATE_ERRORED: OrderState.ValueType  # 10
+Global___OrderState: _TypeAlias = OrderState  # noqa: Y015
+
+class _TradingError:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _TradingErrorEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_TradingError.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    TRADING_ERROR_UNSPECIFIED: _TradingError.ValueType  # 0
+    TRADING_ERROR_FORBIDDEN: _TradingError.ValueType  # 403
+    TRADING_ERROR_NOT_FOUND: _TradingError.ValueType  # 404
+    TRADING_ERROR_TRADING_DISABLED: _TradingError.ValueType  # 405
+    TRADING_ERROR_TRADING_SUSPENDED: _TradingError.ValueType  # 406
+    TRADING_ERROR_NOT_SUBSCRIBED: _TradingError.ValueType  # 407
+    TRADING_ERROR_INVALID_SYMBOL: _TradingError.ValueType  # 413
+    TRADING_ERROR_INVALID_VALUE: _TradingError.ValueType  # 422
+    TRADING_ERROR_INVALID_STATE: _TradingError.ValueType  # 424
+    TRADING_ERROR_INVALID_PRICE: _TradingError.ValueType  # 425
+    TRADING_ERROR_CONTRACT_EXPIRING: _TradingError.ValueType  # 426
+    TRADING_ERROR_INTERNAL_ERROR: _TradingError.ValueType  # 500
+    TRADING_ERROR_NOT_IMPLEMENTED: _TradingError.ValueType  # 501
+
+class TradingError(_TradingError, metaclass=_TradingErrorEnumTypeWrapper): ...
+
+TRADING_ERROR_UNSPECIFIED: TradingError.ValueType  # 0
+TRADING_ERROR_FORBIDDEN: TradingError.ValueType  # 403
+TRADING_ERROR_NOT_FOUND: TradingError.ValueType  # 404
+TRADING_ERROR_TRADING_DISABLED: TradingError.ValueType  # 405
+TRADING_ERROR_TRADING_SUSPENDED: TradingError.ValueType  # 406
+TRADING_ERROR_NOT_SUBSCRIBED: TradingError.ValueType  # 407
+TRADING_ERROR_INVALID_SYMBOL: TradingError.ValueType  # 413
+TRADING_ERROR_INVALID_VALUE: TradingError.ValueType  # 422
+TRADING_ERROR_INVALID_STATE: TradingError.ValueType  # 424
+TRADING_ERROR_INVALID_PRICE: TradingError.ValueType  # 425
+TRADING_ERROR_CONTRACT_EXPIRING: TradingError.ValueType  # 426
+TRADING_ERROR_INTERNAL_ERROR: TradingError.ValueType  # 500
+TRADING_ERROR_NOT_IMPLEMENTED: TradingError.ValueType  # 501
+Global___TradingError: _TypeAlias = TradingError  # noqa: Y015
+
+class _Channel:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _ChannelEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_Channel.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    CHANNEL_UNSPECIFIED: _Channel.ValueType  # 0
+    CHANNEL_ORDERS: _Channel.ValueType  # 1
+    CHANNEL_SERVER_INFO: _Channel.ValueType  # 2
+    CHANNEL_TICKERS: _Channel.ValueType  # 3
+    CHANNEL_RFQ: _Channel.ValueType  # 4
+    CHANNEL_ORDER_BOOK_TOP: _Channel.ValueType  # 5
+    CHANNEL_ORDER_BOOK: _Channel.ValueType  # 6
+    CHANNEL_DY_TICKERS: _Channel.ValueType  # 7
+    CHANNEL_NOTIFICATIONS: _Channel.ValueType  # 8
+
+class Channel(_Channel, metaclass=_ChannelEnumTypeWrapper): ...
+
+CHANNEL_UNSPECIFIED: Channel.ValueType  # 0
+CHANNEL_ORDERS: Channel.ValueType  # 1
+CHANNEL_SERVER_INFO: Channel.ValueType  # 2
+CHANNEL_TICKERS: Channel.ValueType  # 3
+CHANNEL_RFQ: Channel.ValueType  # 4
+CHANNEL_ORDER_BOOK_TOP: Channel.ValueType  # 5
+CHANNEL_ORDER_BOOK: Channel.ValueType  # 6
+CHANNEL_DY_TICKERS: Channel.ValueType  # 7
+CHANNEL_NOTIFICATIONS: Channel.ValueType  # 8
+Global___Channel: _TypeAlias = Channel  # noqa: Y015
+
+class _NotificationKind:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _NotificationKindEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_NotificationKind.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    NOTIFICATION_KIND_UNSPECIFIED: _NotificationKind.ValueType  # 0
+    NOTIFICATION_KIND_SYSTEM_ALERT: _NotificationKind.ValueType  # 1
+    NOTIFICATION_KIND_KILL_SWITCH: _NotificationKind.ValueType  # 2
+    NOTIFICATION_KIND_FV_MARK: _NotificationKind.ValueType  # 3
+
+class NotificationKind(_NotificationKind, metaclass=_NotificationKindEnumTypeWrapper): ...
+
+NOTIFICATION_KIND_UNSPECIFIED: NotificationKind.ValueType  # 0
+NOTIFICATION_KIND_SYSTEM_ALERT: NotificationKind.ValueType  # 1
+NOTIFICATION_KIND_KILL_SWITCH: NotificationKind.ValueType  # 2
+NOTIFICATION_KIND_FV_MARK: NotificationKind.ValueType  # 3
+Global___NotificationKind: _TypeAlias = NotificationKind  # noqa: Y015
+
+class _Level:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _LevelEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_Level.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    LEVEL_UNSPECIFIED: _Level.ValueType  # 0
+    LEVEL_INFO: _Level.ValueType  # 1
+    LEVEL_WARNING: _Level.ValueType  # 2
+    LEVEL_ERROR: _Level.ValueType  # 3
+    LEVEL_CRITICAL: _Level.ValueType  # 4
+
+class Level(_Level, metaclass=_LevelEnumTypeWrapper): ...
+
+LEVEL_UNSPECIFIED: Level.ValueType  # 0
+LEVEL_INFO: Level.ValueType  # 1
+LEVEL_WARNING: Level.ValueType  # 2
+LEVEL_ERROR: Level.ValueType  # 3
+LEVEL_CRITICAL: Level.ValueType  # 4
+Global___Level: _TypeAlias = Level  # noqa: Y015
+
+class _NotificationSource:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _NotificationSourceEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_NotificationSource.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    NOTIFICATION_SOURCE_UNSPECIFIED: _NotificationSource.ValueType  # 0
+    NOTIFICATION_SOURCE_ADMIN: _NotificationSource.ValueType  # 1
+    NOTIFICATION_SOURCE_PRODUCT: _NotificationSource.ValueType  # 2
+    NOTIFICATION_SOURCE_USER: _NotificationSource.ValueType  # 3
+
+class NotificationSource(_NotificationSource, metaclass=_NotificationSourceEnumTypeWrapper): ...
+
+NOTIFICATION_SOURCE_UNSPECIFIED: NotificationSource.ValueType  # 0
+NOTIFICATION_SOURCE_ADMIN: NotificationSource.ValueType  # 1
+NOTIFICATION_SOURCE_PRODUCT: NotificationSource.ValueType  # 2
+NOTIFICATION_SOURCE_USER: NotificationSource.ValueType  # 3
+Global___NotificationSource: _TypeAlias = NotificationSource  # noqa: Y015
+
+class _NotificationCategory:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _NotificationCategoryEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_NotificationCategory.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    NOTIFICATION_CATEGORY_UNSPECIFIED: _NotificationCategory.ValueType  # 0
+    NOTIFICATION_CATEGORY_SYSTEM: _NotificationCategory.ValueType  # 1
+    NOTIFICATION_CATEGORY_TRADING: _NotificationCategory.ValueType  # 2
+    NOTIFICATION_CATEGORY_MARKET_DATA: _NotificationCategory.ValueType  # 3
+    NOTIFICATION_CATEGORY_RFQ: _NotificationCategory.ValueType  # 4
+    NOTIFICATION_CATEGORY_TICKER: _NotificationCategory.ValueType  # 5
+    NOTIFICATION_CATEGORY_ORDER_BOOK_TOP: _NotificationCategory.ValueType  # 6
+    NOTIFICATION_CATEGORY_USER: _NotificationCategory.ValueType  # 7
+    NOTIFICATION_CATEGORY_NEWS: _NotificationCategory.ValueType  # 8
+
+class NotificationCategory(_NotificationCategory, metaclass=_NotificationCategoryEnumTypeWrapper): ...
+
+NOTIFICATION_CATEGORY_UNSPECIFIED: NotificationCategory.ValueType  # 0
+NOTIFICATION_CATEGORY_SYSTEM: NotificationCategory.ValueType  # 1
+NOTIFICATION_CATEGORY_TRADING: NotificationCategory.ValueType  # 2
+NOTIFICATION_CATEGORY_MARKET_DATA: NotificationCategory.ValueType  # 3
+NOTIFICATION_CATEGORY_RFQ: NotificationCategory.ValueType  # 4
+NOTIFICATION_CATEGORY_TICKER: NotificationCategory.ValueType  # 5
+NOTIFICATION_CATEGORY_ORDER_BOOK_TOP: NotificationCategory.ValueType  # 6
+NOTIFICATION_CATEGORY_USER: NotificationCategory.ValueType  # 7
+NOTIFICATION_CATEGORY_NEWS: NotificationCategory.ValueType  # 8
+Global___NotificationCategory: _TypeAlias = NotificationCategory  # noqa: Y015
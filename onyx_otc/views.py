@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+from .common import PriceAmount
+from .responses import (
+    OrderBooks,
+    OrderBookTop,
+    OtcChannelMessage,
+    OtcOrder,
+    OtcQuote,
+    ServerInfo,
+    Ticker,
+)
+from .timestamp import Timestamp
+from .types import Channel
+from .v2 import responses_pb2
+
+
+@dataclass(slots=True)
+class PriceAmountView:
+    """Lazy view over a protobuf price/amount pair"""
+
+    proto: responses_pb2.PriceAmount
+
+    @property
+    def price(self) -> Decimal:
+        return Decimal(self.proto.price.value)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(self.proto.amount.value)
+
+    def to_model(self, trusted: bool = True) -> PriceAmount:
+        return PriceAmount.from_proto(self.proto, trusted)
+
+
+@dataclass(slots=True)
+class TickerView:
+    """Lazy view over a protobuf ticker"""
+
+    proto: responses_pb2.Ticker
+
+    @property
+    def symbol(self) -> str:
+        return self.proto.symbol
+
+    @property
+    def product_symbol(self) -> str:
+        return self.proto.product_symbol
+
+    @property
+    def timestamp(self) -> Timestamp:
+        return Timestamp.from_proto(self.proto.timestamp)
+
+    @property
+    def mid(self) -> Decimal:
+        return Decimal(self.proto.mid.value)
+
+    def to_model(self, trusted: bool = True) -> Ticker:
+        return Ticker.from_proto(self.proto, trusted)
+
+
+@dataclass(slots=True)
+class OrderBookTopView:
+    """Lazy view over a protobuf order book top"""
+
+    proto: responses_pb2.OrderBookTop
+
+    @property
+    def symbol(self) -> str:
+        return self.proto.symbol
+
+    @property
+    def product_symbol(self) -> str:
+        return self.proto.product_symbol
+
+    @property
+    def timestamp(self) -> Timestamp:
+        return Timestamp.from_proto(self.proto.timestamp)
+
+    @property
+    def buy(self) -> PriceAmountView:
+        return PriceAmountView(self.proto.buy)
+
+    @property
+    def sell(self) -> PriceAmountView:
+        return PriceAmountView(self.proto.sell)
+
+    def to_model(self, trusted: bool = True) -> OrderBookTop:
+        return OrderBookTop.from_proto(self.proto, trusted)
+
+
+@dataclass(slots=True)
+class ChannelMessageView:
+    """Lazy view over a protobuf channel message.
+
+    Nothing is decoded until accessed: market data rows are returned as
+    views over the underlying protobuf messages, while the less frequent
+    message types are materialised as models on request.
+    """
+
+    proto: responses_pb2.ChannelMessage
+
+    @property
+    def channel(self) -> Channel:
+        return Channel.from_proto(self.proto.channel)
+
+    @property
+    def timestamp(self) -> Timestamp:
+        return Timestamp.from_proto(self.proto.timestamp)
+
+    @property
+    def message_type(self) -> str | None:
+        """Name of the message field set in the protobuf oneof"""
+        return self.proto.WhichOneof("message")
+
+    def tickers(self) -> list[TickerView] | None:
+        if self.proto.HasField("tickers"):
+            return [TickerView(ticker) for ticker in self.proto.tickers.tickers]
+        return None
+
+    def order_book_tops(self) -> list[OrderBookTopView] | None:
+        if self.proto.HasField("order_book_tops"):
+            return [
+                OrderBookTopView(obt)
+                for obt in self.proto.order_book_tops.order_book_tops
+            ]
+        return None
+
+    def order_books(self) -> OrderBooks | None:
+        if self.proto.HasField("order_books"):
+            return OrderBooks.from_proto(self.proto.order_books, trusted=True)
+        return None
+
+    def server_info(self) -> ServerInfo | None:
+        if self.proto.HasField("server_info"):
+            return ServerInfo.from_proto(self.proto.server_info, trusted=True)
+        return None
+
+    def otc_quote(self) -> OtcQuote | None:
+        if self.proto.HasField("otc_quote"):
+            return OtcQuote.from_proto(self.proto.otc_quote, trusted=True)
+        return None
+
+    def order(self) -> OtcOrder | None:
+        if self.proto.HasField("order"):
+            return OtcOrder.from_proto(self.proto.order, trusted=True)
+        return None
+
+    def to_model(self, trusted: bool = True) -> OtcChannelMessage:
+        """Materialise the full pydantic model of the message"""
+        return OtcChannelMessage.from_proto(self.proto, trusted)
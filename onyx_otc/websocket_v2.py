@@ -1,16 +1,42 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import inspect
 import logging
 import os
+import time
+from collections import Counter
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Self, TypeAlias
+from decimal import Decimal
+from functools import partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Self, TypeAlias
 
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
 
+from .cache import MarketDataCache
+from .capture import CaptureWriter
+from .common import TradableSymbol
+from .compact import CompactChannelMessage
+from .conflation import ChannelMessage, ConflationStats
+from .decoding import (
+    DecodedMessage,
+    TimedMessage,
+    decode_binary,
+    decode_text,
+    timed_decode,
+)
+from .dispatch import Dispatcher, DispatchStats, OverflowPolicy
+from .fixed import Fixed
+from .histogram import FeedLatency
+from .metrics import ClientMetrics
+from .order_book import OrderBookEngine
+from .order_entry import OrderTemplate
+from .orders import OrderManager
+from .pending import PendingRequests, RequestStats
 from .requests import (
     AuthRequest,
+    OrderBookChannel,
     OrderBookTopChannel,
     OrdersChannel,
     OtcOrderRequest,
@@ -18,19 +44,82 @@ from .requests import (
     RfqChannel,
     ServerInfoChannel,
     SubscribeRequest,
+    SubscriptionChannel,
     TickersChannel,
     UnsubscribeRequest,
 )
-from .responses import OtcChannelMessage, OtcResponse, otc_response_from_proto_bytes
+from .responses import (
+    OrderBookTop,
+    OtcChannelMessage,
+    OtcResponse,
+    OtcResponseError,
+    Ticker,
+)
+from .subscriptions import SubscriptionRegistry
 from .timestamp import Timestamp
+from .types import Channel, Method, OrderType, Side
+from .v2 import responses_pb2
+from .views import ChannelMessageView
+from .writer import Frame, FrameWriter, WriterStats
+
+if TYPE_CHECKING:
+    from .columns import OrderBookTopColumns, SymbolIds, TickerColumns
 
 logger = logging.getLogger(__name__)
 
-ResponseHandler: TypeAlias = Callable[["OnyxWebsocketClientV2", OtcResponse], None]
-EventHandler: TypeAlias = Callable[["OnyxWebsocketClientV2", OtcChannelMessage], None]
+# handlers can be plain functions or coroutine functions
+HandlerResult: TypeAlias = Awaitable[None] | None
+ResponseHandler: TypeAlias = Callable[
+    ["OnyxWebsocketClientV2", OtcResponse], HandlerResult
+]
+EventHandler: TypeAlias = Callable[
+    ["OnyxWebsocketClientV2", OtcChannelMessage], HandlerResult
+]
+EventViewHandler: TypeAlias = Callable[
+    ["OnyxWebsocketClientV2", ChannelMessageView], HandlerResult
+]
+EventCompactHandler: TypeAlias = Callable[
+    ["OnyxWebsocketClientV2", CompactChannelMessage], HandlerResult
+]
+EventColumnsHandler: TypeAlias = Callable[
+    ["OnyxWebsocketClientV2", "TickerColumns | OrderBookTopColumns"], HandlerResult
+]
 ExitHandler: TypeAlias = Callable[["OnyxWebsocketClientV2"], None]
 
 
+async def _call(result: HandlerResult) -> None:
+    if inspect.isawaitable(result):
+        await result
+
+
+def _failed(exc: BaseException) -> asyncio.Future[OtcResponse]:
+    future: asyncio.Future[OtcResponse] = asyncio.get_running_loop().create_future()
+    future.set_exception(exc)
+    return future
+
+
+def _count_products(rates: Counter[str], message: ChannelMessage) -> None:
+    """Count the ticker and order book top rows of a message by product"""
+    rows: Any
+    if isinstance(message, OtcChannelMessage):
+        if tickers := message.tickers():
+            rows = tickers.tickers
+        elif obts := message.order_book_tops():
+            rows = obts.order_book_tops
+        else:
+            return
+    else:
+        match message.WhichOneof("message"):
+            case "tickers":
+                rows = message.tickers.tickers
+            case "order_book_tops":
+                rows = message.order_book_tops.order_book_tops
+            case _:
+                return
+    for row in rows:
+        rates[row.product_symbol] += 1
+
+
 # Default handlers
 def on_response(cli: OnyxWebsocketClientV2, response: OtcResponse) -> None:
     logger.info("Received response: %s", response)
@@ -57,6 +146,61 @@ class OnyxWebsocketClientV2:
         on_response: Callback for handling responses
         on_event: Callback for handling channel events
         on_exit: Callback for handling connection closure
+        on_event_view: Optional callback receiving lazy views of channel
+            messages, used instead of `on_event` on the binary endpoint
+        on_event_compact: Optional callback receiving channel messages as
+            compact slotted types, used instead of `on_event` and
+            `on_event_view` on the binary endpoint
+        fixed_point: Prices and amounts of compact messages are `Fixed`
+            scaled integers rather than `Decimal`
+        price_scales: Minimum number of decimal digits of the prices of
+            each product symbol in fixed point mode
+        on_event_columns: Optional callback receiving tickers and order book
+            tops as NumPy columns on the binary endpoint (requires numpy)
+        column_scale: When set, column prices are int64 scaled by 10**scale
+            rather than float64
+        trusted: Build response models without pydantic validation
+        order_books: Optional engine maintaining local full depth order books
+            from the ORDER_BOOK channel, updated before handlers are called
+        orders: Optional manager of the orders and executions of order
+            responses and of the ORDERS channel, updated before handlers are
+            called
+        cache: Optional latest value cache for tickers and order book tops,
+            updated before handlers are called
+        product_rates: Optional counter of the ticker and order book top
+            rows received by product symbol, whichever handler is used
+        change_only: Only dispatch tickers and order book tops which changed
+            since the last update, a cache is created if not provided
+        conflate: Shortcut for `overflow_policy=OverflowPolicy.CONFLATE`
+        dispatch_queue_size: When positive, channel messages are put in a
+            bounded queue and dispatched to the event handlers by separate
+            consumer tasks rather than inline by the socket reader
+        dispatch_consumers: Number of consumer tasks of the dispatch queue
+        overflow_policy: What to do when the dispatch queue is full; the
+            CONFLATE policy enables the dispatch queue on its own and only
+            keeps the newest pending ticker and order book top per symbol
+        decode_executor: Optional thread or process pool where incoming frames
+            are decoded, keeping the event loop free; decoded messages are
+            handed back to the loop in the order the frames were received
+        decode_queue_size: Maximum number of frames being decoded in the
+            executor before the socket reader waits
+        request_timeout: Seconds to wait for the response of a request sent
+            with `send_request` or `call`
+        subscriptions: Registry of active subscriptions, restored with merged
+            requests every time the client authenticates
+        subscription_window: Seconds during which `set_tickers` and `set_obt`
+            calls are coalesced before the subscription changes are sent
+        serialize_in_writer: Serialize outgoing requests in the write loop
+            rather than in `send`, keeping the caller's work to a minimum
+        recorder: Optional capture file where every received frame is
+            appended with its receive time, before being handled
+        latency: Optional feed and handler latency histograms; handler
+            latency is measured from the receive time of the frame, or from
+            when the message is taken from the dispatch queue when enabled
+        metrics: Optional counters of received frames, bytes, decode and
+            handler time, and reconnections
+
+    Handlers can be either functions or coroutine functions.
     """
 
     ws_url: str
@@ -64,17 +208,74 @@ class OnyxWebsocketClientV2:
     on_response: ResponseHandler = field(default=on_response)
     on_event: EventHandler = field(default=on_event)
     on_exit: ExitHandler = field(default=on_exit)
+    on_event_view: EventViewHandler | None = None
+    on_event_compact: EventCompactHandler | None = None
+    fixed_point: bool = False
+    price_scales: dict[str, int] = field(default_factory=dict)
+    on_event_columns: EventColumnsHandler | None = None
+    column_scale: int | None = None
+    trusted: bool = False
+    order_books: OrderBookEngine | None = None
+    orders: OrderManager | None = None
+    cache: MarketDataCache | None = None
+    product_rates: Counter[str] | None = None
+    change_only: bool = False
+    conflate: bool = False
+    dispatch_queue_size: int = 0
+    dispatch_consumers: int = 1
+    overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK
+    decode_executor: Executor | None = None
+    decode_queue_size: int = 1000
+    request_timeout: float = 10.0
+    subscriptions: SubscriptionRegistry = field(default_factory=SubscriptionRegistry)
+    subscription_window: float = 0.05
+    serialize_in_writer: bool = False
+    recorder: CaptureWriter | None = None
+    latency: FeedLatency | None = None
+    metrics: ClientMetrics | None = None
     min_reconnect_delay: float = field(default=1.0, init=False)
     max_reconnect_delay: float = field(default=60.0, init=False)
 
-    _queue: asyncio.Queue[bytes | str] = field(
-        default_factory=asyncio.Queue, repr=False
-    )
+    _writer: FrameWriter = field(init=False, repr=False)
     _ws: ClientWebSocketResponse | None = field(default=None, init=False)
     _write_task: asyncio.Task | None = field(default=None, init=False)
     _is_running: bool = field(default=False, init=False)
     _reconnect_delay: float = 0.0
     _id_counter: int = 0
+    _symbol_ids: SymbolIds | None = field(default=None, init=False, repr=False)
+    _dispatcher: Dispatcher | None = field(default=None, init=False, repr=False)
+    _decoded: asyncio.Queue[tuple[asyncio.Future[TimedMessage], int, int]] | None = (
+        field(default=None, init=False, repr=False)
+    )
+    _decode_task: asyncio.Task | None = field(default=None, init=False)
+    _pending: PendingRequests = field(init=False, repr=False)
+    _connected_ns: int = field(default=0, init=False, repr=False)
+    _time_to_first_data: float | None = field(default=None, init=False, repr=False)
+    _desired: dict[Channel, set[str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _flush_handle: asyncio.TimerHandle | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self._pending = PendingRequests(timeout=self.request_timeout)
+        self._writer = FrameWriter(binary=self.is_binary)
+        if self.change_only and self.cache is None:
+            self.cache = MarketDataCache()
+        if self.conflate:
+            self.overflow_policy = OverflowPolicy.CONFLATE
+        if self.dispatch_queue_size > 0 or (
+            self.overflow_policy is OverflowPolicy.CONFLATE
+        ):
+            self._dispatcher = Dispatcher(
+                self.dispatch_event,
+                maxsize=self.dispatch_queue_size or Dispatcher.maxsize,
+                consumers=self.dispatch_consumers,
+                policy=self.overflow_policy,
+            )
+        if self.decode_executor is not None:
+            self._decoded = asyncio.Queue(maxsize=self.decode_queue_size)
 
     @classmethod
     def create(
@@ -108,6 +309,60 @@ class OnyxWebsocketClientV2:
         """Check if the client is currently running."""
         return self._is_running
 
+    @property
+    def conflation_stats(self) -> ConflationStats | None:
+        """Conflation counters, when conflation is enabled"""
+        if self._dispatcher is not None and self._dispatcher.conflator is not None:
+            return self._dispatcher.conflator.stats
+        return None
+
+    @property
+    def dispatch_stats(self) -> DispatchStats | None:
+        """Dispatch queue counters, when the dispatch queue is enabled"""
+        return self._dispatcher.stats if self._dispatcher is not None else None
+
+    @property
+    def dispatch_queue_depth(self) -> int:
+        """Number of channel messages waiting to be dispatched"""
+        return self._dispatcher.depth if self._dispatcher is not None else 0
+
+    @property
+    def request_stats(self) -> dict[Method, RequestStats]:
+        """Round trip latency of requests sent with `send_request`, by method"""
+        return self._pending.stats
+
+    @property
+    def writer_stats(self) -> WriterStats:
+        """Counters of the outgoing frames"""
+        return self._writer.stats
+
+    @property
+    def write_queue_depth(self) -> int:
+        """Number of frames waiting to be written"""
+        return len(self._writer)
+
+    @property
+    def time_to_first_data(self) -> float | None:
+        """Seconds from the last connection to its first channel message"""
+        return self._time_to_first_data
+
+    @property
+    def symbol_ids(self) -> SymbolIds:
+        """Symbol id table used by the columnar decoding"""
+        if self._symbol_ids is None:
+            from .columns import SymbolIds
+
+            self._symbol_ids = SymbolIds()
+        return self._symbol_ids
+
+    def get_ticker(self, symbol: str) -> Ticker | None:
+        """Latest cached ticker for a symbol"""
+        return self.cache.get_ticker(symbol) if self.cache is not None else None
+
+    def get_obt(self, symbol: str) -> OrderBookTop | None:
+        """Latest cached order book top for a symbol"""
+        return self.cache.get_obt(symbol) if self.cache is not None else None
+
     def authenticate(self) -> None:
         """Authenticate the client."""
         if self.api_token:
@@ -117,81 +372,456 @@ class OnyxWebsocketClientV2:
 
     def subscribe_server_info(self) -> None:
         """Subscribe to server info channel."""
-        self.send(self.request(SubscribeRequest(data=ServerInfoChannel())))
+        self.subscribe(ServerInfoChannel())
 
     def unsubscribe_server_info(self) -> None:
         """Unsubscribe from server info channel."""
-        self.send(self.request(UnsubscribeRequest(data=ServerInfoChannel())))
+        self.unsubscribe(ServerInfoChannel())
 
     def subscribe_tickers(self, products: list[str]) -> None:
         """Subscribe to ticker updates for specific products."""
-        self.send(
-            self.request(SubscribeRequest(data=TickersChannel(products=products)))
-        )
+        self.subscribe(TickersChannel(products=products))
 
     def unsubscribe_tickers(self, products: list[str]) -> None:
         """Unsubscribe from ticker updates for specific products."""
-        self.send(
-            self.request(UnsubscribeRequest(data=TickersChannel(products=products)))
-        )
+        self.unsubscribe(TickersChannel(products=products))
 
     def subscribe_obt(self, products: list[str]) -> None:
         """Subscribe to order-book-top updates for specific products."""
-        self.send(
-            self.request(SubscribeRequest(data=OrderBookTopChannel(products=products)))
-        )
+        self.subscribe(OrderBookTopChannel(products=products))
 
     def unsubscribe_obt(self, products: list[str]) -> None:
         """Unsubscribe from order-book-top updates for specific products."""
-        self.send(
-            self.request(
-                UnsubscribeRequest(data=OrderBookTopChannel(products=products))
-            )
-        )
+        self.unsubscribe(OrderBookTopChannel(products=products))
 
     def subscribe_orders(self) -> None:
         """Subscribe to order updates."""
-        self.send(self.request(SubscribeRequest(data=OrdersChannel())))
+        self.subscribe(OrdersChannel())
 
     def unsubscribe_orders(self) -> None:
         """Unsubscribe from order updates."""
-        self.send(self.request(UnsubscribeRequest(data=OrdersChannel())))
+        self.unsubscribe(OrdersChannel())
 
     def subscribe_rfq(self, rfq: RfqChannel) -> None:
         """Subscribe to RFQ updates."""
-        self.send(self.request(SubscribeRequest(data=rfq)))
+        self.subscribe(rfq)
 
     def unsubscribe_rfq(self, rfq: RfqChannel) -> None:
         """Unsubscribe from RFQ updates."""
-        self.send(self.request(UnsubscribeRequest(data=rfq)))
-
-    async def handle_binary_message(self, data: bytes) -> None:
-        """Handle incoming binary messages."""
-        response = otc_response_from_proto_bytes(data)
-        if isinstance(response, OtcResponse):
-            self.on_response(self, response)
-        elif isinstance(response, OtcChannelMessage):
-            self.on_event(self, response)
-
-    async def handle_text_message(self, data: str) -> None:
-        """Handle incoming text messages."""
-        payload = json.loads(data)
-        if response := OtcResponse.from_json(payload):
-            self.on_response(self, response)
-        elif message := OtcChannelMessage.from_json(payload):
-            self.on_event(self, message)
+        self.unsubscribe(rfq)
+
+    def subscribe_order_book(self, book: OrderBookChannel) -> None:
+        """Subscribe to full depth order book updates."""
+        self.subscribe(book)
+
+    def unsubscribe_order_book(self, book: OrderBookChannel) -> None:
+        """Unsubscribe from full depth order book updates."""
+        self.unsubscribe(book)
+        if self.order_books is not None:
+            self.order_books.remove(book.symbol.as_string(), book.exchange)
+
+    def set_tickers(self, products: Iterable[str]) -> None:
+        """Set the products subscribed to the tickers channel.
+
+        Only the difference with the current subscriptions is sent, and calls
+        made within `subscription_window` seconds are coalesced.
+        """
+        self._set_products(Channel.TICKERS, products)
+
+    def set_obt(self, products: Iterable[str]) -> None:
+        """Set the products subscribed to the order-book-top channel.
+
+        Same as `set_tickers` for the order-book-top channel.
+        """
+        self._set_products(Channel.ORDER_BOOK_TOP, products)
+
+    def flush_subscriptions(self) -> None:
+        """Send the pending changes of `set_tickers` and `set_obt` now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        desired, self._desired = self._desired, {}
+        build: type[TickersChannel | OrderBookTopChannel]
+        for channel, products in desired.items():
+            if channel is Channel.TICKERS:
+                current, build = self.subscriptions.tickers, TickersChannel
+            else:
+                current, build = self.subscriptions.obt, OrderBookTopChannel
+            if removed := sorted(current - products):
+                self.unsubscribe(build(products=removed))
+            if added := sorted(products - current):
+                self.subscribe(build(products=added))
+
+    def _set_products(self, channel: Channel, products: Iterable[str]) -> None:
+        self._desired[channel] = set(products)
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or self.subscription_window <= 0:
+            self.flush_subscriptions()
+        else:
+            self._flush_handle = loop.call_later(
+                self.subscription_window, self.flush_subscriptions
+            )
+
+    def subscribe(self, data: SubscriptionChannel) -> None:
+        """Subscribe to a channel.
+
+        The subscription is registered and restored every time the client
+        authenticates, it is sent right away only when the client is running.
+        Subscriptions rejected by the server are removed from the registry.
+        """
+        self.subscriptions.add(data)
+        if self._is_running:
+            future = self.send_request(self.request(SubscribeRequest(data=data)))
+            future.add_done_callback(partial(self._subscription_done, data))
+
+    def unsubscribe(self, data: SubscriptionChannel) -> None:
+        """Unsubscribe from a channel."""
+        self.subscriptions.remove(data)
+        if self._is_running:
+            self.send(self.request(UnsubscribeRequest(data=data)))
+
+    def restore_subscriptions(self) -> None:
+        """Send the registered subscriptions as merged requests.
+
+        A rejected restore request leaves the registry unchanged, since a
+        single rejected product would otherwise drop every product merged
+        with it; the error is logged and passed to `on_response`.
+        """
+        for data in self.subscriptions.channels():
+            future = self.send_request(self.request(SubscribeRequest(data=data)))
+            future.add_done_callback(partial(self._restore_done, data))
+
+    def _restore_done(
+        self, data: SubscriptionChannel, future: asyncio.Future[OtcResponse]
+    ) -> None:
+        if not future.cancelled() and isinstance(
+            error := future.exception(), OtcResponseError
+        ):
+            logger.error("Failed to restore subscription %s: %s", data, error)
+
+    def _subscription_done(
+        self, data: SubscriptionChannel, future: asyncio.Future[OtcResponse]
+    ) -> None:
+        if not future.cancelled() and isinstance(future.exception(), OtcResponseError):
+            logger.warning("Subscription rejected, removed from registry: %s", data)
+            self.subscriptions.remove(data)
+
+    async def handle_binary_message(self, data: bytes, recv_ns: int = 0) -> None:
+        """Handle incoming binary messages, received at `recv_ns`."""
+        if self._decoded is None:
+            # channel messages are kept as protobuf so that handlers decide
+            # how to decode them
+            await self._handle_frame(
+                partial(decode_binary, data, self.trusted, True), len(data), recv_ns
+            )
+        else:
+            # views and columns need the protobuf, otherwise the models are
+            # built in the executor too
+            raw_events = (
+                self.on_event_view is not None
+                or self.on_event_compact is not None
+                or self.on_event_columns is not None
+            )
+            await self._decode_in_executor(
+                partial(decode_binary, data, self.trusted, raw_events),
+                len(data),
+                recv_ns,
+            )
+
+    async def handle_decoded(self, message: DecodedMessage, recv_ns: int = 0) -> None:
+        """Handle a decoded message."""
+        if isinstance(message, OtcResponse):
+            await self.handle_response(message)
+        elif isinstance(message, responses_pb2.ChannelMessage):
+            await self.handle_channel_proto(message, recv_ns)
+        elif isinstance(message, OtcChannelMessage):
+            await self.handle_channel_message(message, recv_ns)
+        else:
+            logger.warning("Unknown message type received")
+
+    async def handle_response(self, response: OtcResponse) -> None:
+        """Dispatch a response, responses are never queued."""
+        self._pending.resolve(response)
+        # JSON order responses carry the request id rather than the order id,
+        # their orders are known from the ORDERS channel only
+        if (
+            self.orders is not None
+            and (order := response.order())
+            and order.id != response.id
+        ):
+            self.orders.apply(order)
+        if response.auth() and self.subscriptions:
+            self.restore_subscriptions()
+        await _call(self.on_response(self, response))
+
+    async def handle_channel_proto(
+        self, proto: responses_pb2.ChannelMessage, recv_ns: int = 0
+    ) -> None:
+        """Update local state from a binary channel message and dispatch it."""
+        if self._connected_ns:
+            self._first_data()
+        if self.latency is not None and recv_ns:
+            self.latency.record_proto(proto, recv_ns)
+        if self.order_books is not None and proto.HasField("order_books"):
+            self.order_books.apply_proto(proto.order_books)
+        if self.orders is not None and proto.HasField("order"):
+            self.orders.apply_proto(proto.order)
+        if self.product_rates is not None:
+            _count_products(self.product_rates, proto)
+        if self.cache is not None:
+            changed = self.cache.update_proto(proto, prune=self.change_only)
+            if self.change_only and not changed:
+                return
+        await self._dispatch_or_queue(proto, recv_ns)
+
+    async def handle_channel_message(
+        self, message: OtcChannelMessage, recv_ns: int = 0
+    ) -> None:
+        """Update local state from a channel message model and dispatch it."""
+        if self._connected_ns:
+            self._first_data()
+        if self.latency is not None and recv_ns:
+            self.latency.record_message(message, recv_ns)
+        if self.order_books is not None and (books := message.order_books()):
+            self.order_books.apply(books)
+        if self.orders is not None and (order := message.order()):
+            self.orders.apply(order)
+        if self.product_rates is not None:
+            _count_products(self.product_rates, message)
+        if self.cache is not None:
+            changed = self.cache.update(message, prune=self.change_only)
+            if self.change_only and not changed:
+                return
+        await self._dispatch_or_queue(message, recv_ns)
+
+    async def dispatch_event(self, message: ChannelMessage, recv_ns: int = 0) -> None:
+        """Call the event handlers for a channel message, recording the
+        handler latency from `recv_ns`, or from now when not given."""
+        latency = self.latency
+        metrics = self.metrics
+        if latency is None and metrics is None:
+            await self._call_event_handlers(message)
+            return
+        start_ns = time.time_ns()
+        await self._call_event_handlers(message)
+        end_ns = time.time_ns()
+        if metrics is not None:
+            metrics.record_handler(end_ns - start_ns)
+        if latency is not None:
+            latency.record_handler(message, end_ns - (recv_ns or start_ns))
+
+    async def _call_event_handlers(self, message: ChannelMessage) -> None:
+        if isinstance(message, OtcChannelMessage):
+            await _call(self.on_event(self, message))
+            return
+        proto = message
+        if self.on_event_columns is not None:
+            from .columns import channel_message_to_columns
+
+            columns = channel_message_to_columns(
+                proto, self.symbol_ids, self.column_scale
+            )
+            if columns is not None:
+                await _call(self.on_event_columns(self, columns))
+                return
+        if self.on_event_compact is not None:
+            await _call(
+                self.on_event_compact(
+                    self,
+                    CompactChannelMessage.from_proto(
+                        proto, self.price_scales if self.fixed_point else None
+                    ),
+                )
+            )
+        elif self.on_event_view is not None:
+            await _call(self.on_event_view(self, ChannelMessageView(proto)))
+        else:
+            await _call(
+                self.on_event(self, OtcChannelMessage.from_proto(proto, self.trusted))
+            )
+
+    async def handle_text_message(self, data: str, recv_ns: int = 0) -> None:
+        """Handle incoming text messages, received at `recv_ns`."""
+        if self._decoded is None:
+            await self._handle_frame(
+                partial(decode_text, data, self.trusted), len(data), recv_ns
+            )
+        else:
+            await self._decode_in_executor(
+                partial(decode_text, data, self.trusted), len(data), recv_ns
+            )
+
+    async def _handle_frame(
+        self, decode: Callable[[], DecodedMessage], size: int, recv_ns: int
+    ) -> None:
+        metrics = self.metrics
+        if metrics is None:
+            await self.handle_decoded(decode(), recv_ns)
+        else:
+            message, decode_ns = timed_decode(decode)
+            metrics.record_frame(message, size, decode_ns)
+            await self.handle_decoded(message, recv_ns)
+
+    async def _decode_in_executor(
+        self, decode: Callable[[], DecodedMessage], size: int, recv_ns: int
+    ) -> None:
+        assert self._decoded is not None
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self.decode_executor, partial(timed_decode, decode)
+        )
+        await self._decoded.put((future, size, recv_ns))
+
+    async def _decode_loop(self) -> None:
+        """Handle messages decoded in the executor, in the order received."""
+        assert self._decoded is not None
+        while True:
+            future, size, recv_ns = await self._decoded.get()
+            try:
+                message, decode_ns = await future
+                if self.metrics is not None:
+                    self.metrics.record_frame(message, size, decode_ns)
+                await self.handle_decoded(message, recv_ns)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error handling message: %s", e, exc_info=True)
+            finally:
+                self._decoded.task_done()
+
+    def _first_data(self) -> None:
+        self._time_to_first_data = (time.monotonic_ns() - self._connected_ns) * 1e-9
+        self._connected_ns = 0
+        logger.info(
+            "First data %.3f seconds after connecting", self._time_to_first_data
+        )
+
+    async def _dispatch_or_queue(self, message: ChannelMessage, recv_ns: int) -> None:
+        if self._dispatcher is None:
+            await self.dispatch_event(message, recv_ns)
         else:
-            logger.warning("Unknown JSON message type received")
+            await self._dispatcher.put(message)
 
     def send(self, msg: OtcRequest) -> None:
         """Queue a message for sending."""
         if not self._is_running:
             logger.warning("Client not running, message dropped: %s", msg)
             return
-        if self.is_binary:
-            self._queue.put_nowait(msg.to_proto().SerializeToString())
+        if self.serialize_in_writer:
+            self._writer.put(msg)
         else:
-            self._queue.put_nowait(json.dumps(msg.to_json_dict()))
+            self._writer.put(self._writer.serialize(msg))
+
+    def send_request(
+        self, msg: OtcRequest, timeout: float | None = None
+    ) -> asyncio.Future[OtcResponse]:
+        """Queue a message for sending and return the future of its response.
+
+        The future fails with `OtcResponseError` on an error response, with
+        `TimeoutError` when no response arrives within `timeout` seconds
+        (`request_timeout` by default) and with `ConnectionError` when the
+        connection is lost. Responses are passed to `on_response` as well.
+        """
+        if not self._is_running:
+            return _failed(ConnectionError("Client not running"))
+        future = self._pending.add(msg, timeout)
+        self.send(msg)
+        return future
+
+    async def send_now(self, frame: Frame) -> None:
+        """Write a frame to the websocket right away, bypassing the write
+        queue and therefore ahead of any queued frame"""
+        ws = self._ws
+        if ws is None or ws.closed:
+            raise ConnectionError("WebSocket closed")
+        if isinstance(frame, str):
+            await ws.send_str(frame)
+        else:
+            await ws.send_bytes(frame)
+
+    def order_template(
+        self,
+        account_id: str,
+        symbol: TradableSymbol | str,
+        side: Side,
+        order_type: OrderType = OrderType.FILL_OR_KILL,
+    ) -> OrderTemplate:
+        """Prepare the order requests of an account, symbol, side and order
+        type for `send_order` and `send_order_now`"""
+        if isinstance(symbol, str):
+            symbol = TradableSymbol.from_string(symbol)
+        return OrderTemplate(
+            account_id, symbol, side, order_type, binary=self.is_binary
+        )
+
+    def send_order(
+        self,
+        template: OrderTemplate,
+        price: Decimal | Fixed | str,
+        quantity: Decimal | Fixed | str,
+        client_order_id: str = "",
+        timeout: float | None = None,
+    ) -> asyncio.Future[OtcResponse]:
+        """Queue an order encoded from a template and return the future of
+        its response, which fails as documented in `send_request`"""
+        if not self._is_running:
+            return _failed(ConnectionError("Client not running"))
+        request_id = self.new_id()
+        self._writer.put(
+            self._encode_order(template, request_id, price, quantity, client_order_id)
+        )
+        return self._pending.track(request_id, Method.ORDER, timeout)
+
+    async def send_order_now(
+        self,
+        template: OrderTemplate,
+        price: Decimal | Fixed | str,
+        quantity: Decimal | Fixed | str,
+        client_order_id: str = "",
+        timeout: float | None = None,
+    ) -> asyncio.Future[OtcResponse]:
+        """Write an order encoded from a template with `send_now` and return
+        the future of its response, which fails as documented in
+        `send_request`. Errors writing the frame are raised, and the order
+        is no longer tracked."""
+        if self._ws is None or self._ws.closed:
+            return _failed(ConnectionError("WebSocket closed"))
+        request_id = self.new_id()
+        frame = self._encode_order(
+            template, request_id, price, quantity, client_order_id
+        )
+        future = self._pending.track(request_id, Method.ORDER, timeout)
+        try:
+            await self.send_now(frame)
+        except BaseException:
+            self._pending.discard(request_id)
+            raise
+        return future
+
+    def _encode_order(
+        self,
+        template: OrderTemplate,
+        request_id: str,
+        price: Decimal | Fixed | str,
+        quantity: Decimal | Fixed | str,
+        client_order_id: str,
+    ) -> Frame:
+        if template.binary is not self.is_binary:
+            raise ValueError("Order template and client encodings differ")
+        return template.encode(request_id, price, quantity, client_order_id)
+
+    async def call(
+        self,
+        request: AuthRequest | OtcOrderRequest | SubscribeRequest | UnsubscribeRequest,
+        timeout: float | None = None,
+    ) -> OtcResponse:
+        """Send a request and wait for its response."""
+        return await self.send_request(self.request(request), timeout)
 
     def new_id(self) -> str:
         """Generate a new unique ID for requests."""
@@ -225,9 +855,7 @@ class OnyxWebsocketClientV2:
                 )
             finally:
                 self._ws = None
-                if self._write_task:
-                    self._write_task.cancel()
-                    self._write_task = None
+                await self._connection_lost()
 
     async def _connect_and_run(self) -> None:
         """Establish connection and start message loops."""
@@ -238,17 +866,27 @@ class OnyxWebsocketClientV2:
                 self._is_running = True
                 logger.info("Connected to %s", self.ws_url)
                 self._reconnect_delay = self.min_reconnect_delay
-                # Start write loop
-                self._write_task = asyncio.create_task(self._write_loop())
+                self._connected_ns = time.monotonic_ns()
+                if self.metrics is not None:
+                    self.metrics.connected()
+                # Start write loop and message processing tasks
+                self.start_tasks()
                 # Authenticate
                 self.authenticate()
                 # Handle incoming messages
+                recorder = self.recorder
                 try:
                     async for msg in ws:
                         if msg.type == WSMsgType.BINARY:
-                            await self.handle_binary_message(msg.data)
+                            recv_ns = time.time_ns()
+                            if recorder is not None:
+                                recorder.write(msg.data, recv_ns)
+                            await self.handle_binary_message(msg.data, recv_ns)
                         elif msg.type == WSMsgType.TEXT:
-                            await self.handle_text_message(msg.data)
+                            recv_ns = time.time_ns()
+                            if recorder is not None:
+                                recorder.write(msg.data, recv_ns)
+                            await self.handle_text_message(msg.data, recv_ns)
                         elif msg.type in (
                             WSMsgType.CLOSED,
                             WSMsgType.CLOSE,
@@ -260,32 +898,83 @@ class OnyxWebsocketClientV2:
                     self._is_running = False
                     self.on_exit(self)
 
+    def start_tasks(self) -> None:
+        """Start the write loop, decode and dispatch tasks.
+
+        Called when connecting, or to handle messages without a connection.
+        """
+        self._write_task = asyncio.create_task(self._write_loop())
+        if self._decoded is not None:
+            self._decode_task = asyncio.create_task(self._decode_loop())
+        if self._dispatcher:
+            self._dispatcher.start()
+
+    async def stop_tasks(self) -> None:
+        """Stop the tasks started by `start_tasks`.
+
+        Frames being decoded and queued channel messages, other than order
+        updates, are dropped: they belong to the connection being stopped and
+        the snapshots sent when subscriptions are restored supersede them.
+        """
+        for task in (self._write_task, self._decode_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    logger.error("Task failed: %s", e, exc_info=True)
+        self._write_task = self._decode_task = None
+        if self._decoded is not None:
+            while not self._decoded.empty():
+                self._decoded.get_nowait()[0].cancel()
+            self._decoded = asyncio.Queue(maxsize=self.decode_queue_size)
+        if self._dispatcher:
+            await self._dispatcher.stop()
+
+    async def drain(self) -> None:
+        """Wait until received messages have been decoded and dispatched."""
+        if self._decoded is not None:
+            await self._decoded.join()
+        if self._dispatcher is not None:
+            await self._dispatcher.join()
+
     async def _write_loop(self) -> None:
-        """Handle outgoing messages."""
+        """Handle outgoing messages, writing all queued frames per wakeup."""
+        writer = self._writer
         while True:
             try:
-                msg = await self._queue.get()
-                if self._ws and not self._ws.closed:
-                    if isinstance(msg, str):
-                        logger.debug("Sending message string: %s", msg)
-                        await self._ws.send_str(msg)
-                    elif isinstance(msg, bytes):
-                        await self._ws.send_bytes(msg)
-                else:
-                    logger.warning("WebSocket closed, message dropped: %s", msg)
+                await writer.wait()
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                logger.error("Error sending message: %s", e, exc_info=True)
+            for queued in writer.drain():
+                try:
+                    msg = writer.frame(queued)
+                    if self._ws and not self._ws.closed:
+                        if isinstance(msg, str):
+                            logger.debug("Sending message string: %s", msg)
+                            await self._ws.send_str(msg)
+                        else:
+                            await self._ws.send_bytes(msg)
+                    else:
+                        logger.warning("WebSocket closed, message dropped: %s", msg)
+                except Exception as e:
+                    logger.error("Error sending message: %s", e, exc_info=True)
 
     async def close(self) -> None:
         """Gracefully close the connection."""
         self._is_running = False
         if self._ws:
             await self._ws.close()
-        if self._write_task:
-            self._write_task.cancel()
-            try:
-                await self._write_task
-            except asyncio.CancelledError:
-                pass
+        await self._connection_lost()
+
+    async def _connection_lost(self) -> None:
+        self._pending.fail_all(ConnectionError("Connection closed"))
+        await self.stop_tasks()
+        # books and cached values are rebuilt from the snapshot sent when
+        # subscriptions are restored
+        if self.order_books is not None:
+            self.order_books.clear()
+        if self.cache is not None:
+            self.cache.clear()
@@ -0,0 +1,96 @@
+"""Batched writing of outgoing websocket frames"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TypeAlias
+
+from .requests import OtcRequest
+
+Frame: TypeAlias = bytes | str
+
+
+@dataclass
+class WriterStats:
+    """Counters of a frame writer
+
+    Attributes:
+        sent: Frames taken from the queue to be written
+        batches: Writer wakeups which found frames to write
+        max_batch: Maximum number of frames written in a single wakeup
+        max_depth: Maximum number of queued frames
+        total_wait_ns: Sum of the time frames spent in the queue
+        max_wait_ns: Maximum time a frame spent in the queue
+    """
+
+    sent: int = 0
+    batches: int = 0
+    max_batch: int = 0
+    max_depth: int = 0
+    total_wait_ns: int = 0
+    max_wait_ns: int = 0
+
+    @property
+    def mean_wait_ns(self) -> float:
+        return self.total_wait_ns / self.sent if self.sent else 0.0
+
+
+@dataclass
+class FrameWriter:
+    """Queue of outgoing frames drained in batches.
+
+    Requests can be queued already serialized or as models, in which case
+    they are serialized by the writer when drained rather than by the caller.
+    """
+
+    binary: bool = True
+    stats: WriterStats = field(default_factory=WriterStats)
+    _queue: deque[tuple[int, OtcRequest | Frame]] = field(default_factory=deque)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def serialize(self, msg: OtcRequest) -> Frame:
+        if self.binary:
+            return msg.to_proto().SerializeToString()
+        return json.dumps(msg.to_json_dict())
+
+    def frame(self, msg: OtcRequest | Frame) -> Frame:
+        """The frame to write for a queued message"""
+        return self.serialize(msg) if isinstance(msg, OtcRequest) else msg
+
+    def put(self, msg: OtcRequest | Frame) -> None:
+        """Queue a request or a serialized frame"""
+        self._queue.append((time.monotonic_ns(), msg))
+        self.stats.max_depth = max(self.stats.max_depth, len(self._queue))
+        self._ready.set()
+
+    async def wait(self) -> None:
+        """Wait until there are frames to write"""
+        while not self._queue:
+            self._ready.clear()
+            await self._ready.wait()
+
+    def drain(self) -> list[OtcRequest | Frame]:
+        """Take all queued messages, requests are serialized with `frame`"""
+        queue = self._queue
+        stats = self.stats
+        now = time.monotonic_ns()
+        messages: list[OtcRequest | Frame] = []
+        while queue:
+            enqueued_ns, msg = queue.popleft()
+            wait_ns = now - enqueued_ns
+            stats.total_wait_ns += wait_ns
+            if wait_ns > stats.max_wait_ns:
+                stats.max_wait_ns = wait_ns
+            messages.append(msg)
+        if messages:
+            stats.sent += len(messages)
+            stats.batches += 1
+            stats.max_batch = max(stats.max_batch, len(messages))
+        return messages
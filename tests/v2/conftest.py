@@ -2,9 +2,10 @@ import asyncio
 
 import pytest
 
+from onyx_otc.fake_server import FakeServer
 from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
 
-from .utils import OnResponseV2
+from .utils import OnResponseV2, connected
 
 
 @pytest.fixture
@@ -32,3 +33,25 @@ async def cliv2(request, responsesv2: OnResponseV2):
         except asyncio.CancelledError:
             pass
     await asyncio.sleep(1)
+
+
+@pytest.fixture
+async def fake_server():
+    async with FakeServer(rate=50, seed=42) as server:
+        yield server
+
+
+@pytest.fixture(params=[True, False])
+async def fake_cli(request, fake_server: FakeServer, responsesv2: OnResponseV2):
+    """A client connected and authenticated to the fake server"""
+    cli = OnyxWebsocketClientV2.create(
+        on_response=responsesv2.on_response,
+        on_event=responsesv2.on_event,
+        binary=request.param,
+        ws_url=fake_server.url,
+        api_token="test",
+    )
+    async with connected(cli):
+        auth = await responsesv2.get_otc_response()
+        assert auth.auth()
+        yield cli
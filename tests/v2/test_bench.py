@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from onyx_otc import bench
+
+
+def test_cases_run() -> None:
+    for case in bench.cases():
+        assert case.run()
+
+
+def test_run_case() -> None:
+    (case,) = [c for c in bench.cases() if c.name == "decode.binary.tickers_10"]
+    result = bench.run_case(case, number=10, repeat=1)
+    assert result.ns_per_msg > 0
+    assert result.msgs_per_second > 0
+    # ten tickers are retained by the decoded message
+    assert result.allocs_per_msg > 10
+
+
+def test_baseline(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    fast = bench.BenchResult("a", ns_per_msg=100, allocs_per_msg=10, bytes_per_msg=1)
+    other = bench.BenchResult("b", ns_per_msg=50, allocs_per_msg=1, bytes_per_msg=1)
+    bench.save_baseline([fast], path)
+    bench.save_baseline([other], path)
+    baseline = bench.load_baseline(path)
+    assert baseline == {"a": fast, "b": other}
+    slow = bench.BenchResult("a", ns_per_msg=130, allocs_per_msg=11, bytes_per_msg=1)
+    (regression,) = bench.compare([slow], baseline, threshold=0.25)
+    assert regression.metric == "ns_per_msg"
+    assert round(regression.change, 2) == 0.3
+    assert not bench.compare([slow], baseline, threshold=0.5)
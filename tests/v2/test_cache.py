@@ -0,0 +1,76 @@
+import json
+from decimal import Decimal
+
+from onyx_otc.cache import MarketDataCache
+from onyx_otc.responses import OtcChannelMessage
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, obt_message, obt_proto, ticker_proto, tickers_message
+
+
+def test_cache_update_proto() -> None:
+    cache = MarketDataCache()
+    message = tickers_message(ticker_proto("brtm25", "70"))
+    assert cache.update_proto(message)
+    # the cache does not share the rows of the message
+    message.tickers.tickers[0].mid.value = "80"
+    ticker = cache.get_ticker("brtm25")
+    assert ticker is not None
+    assert ticker.mid == Decimal(70)
+    assert cache.get_ticker("brtm25") is ticker
+    assert cache.symbols("brt") == ["brtm25"]
+    message = tickers_message(
+        ticker_proto("brtm25", "70"), ticker_proto("brtn25", "71")
+    )
+    assert cache.update_proto(message, prune=True)
+    assert [t.symbol for t in message.tickers.tickers] == ["brtn25"]
+    assert not cache.update_proto(tickers_message(ticker_proto("brtn25", "71")))
+    assert cache.symbols("brt") == ["brtm25", "brtn25"]
+
+
+def test_cache_obt() -> None:
+    cache = MarketDataCache()
+    assert cache.update_proto(obt_message(obt_proto("brtm25", ("1", "2"), ("3", "4"))))
+    assert not cache.update_proto(
+        obt_message(obt_proto("brtm25", ("1", "2"), ("3", "4")))
+    )
+    assert cache.update_proto(obt_message(obt_proto("brtm25", ("1", "2"), ("3", "5"))))
+    obt = cache.get_obt("brtm25")
+    assert obt is not None
+    assert obt.sell.amount == Decimal(5)
+    assert cache.get_obt("foo") is None
+
+
+async def test_client_change_only() -> None:
+    events: list[OtcChannelMessage] = []
+    cli = OnyxWebsocketClientV2.create(
+        change_only=True, on_event=lambda cli, e: events.append(e)
+    )
+    assert cli.cache is not None
+    data = frame(tickers_message(ticker_proto("brtm25", "70")))
+    await cli.handle_binary_message(data)
+    await cli.handle_binary_message(data)
+    assert len(events) == 1
+    ticker = cli.get_ticker("brtm25")
+    assert ticker is not None
+    assert ticker.mid == Decimal(70)
+    # JSON protocol
+    payload = dict(
+        channel="tickers",
+        timestamp=1,
+        message=[
+            dict(symbol="brtm25", product_symbol="brt", timestamp=1, mid="70"),
+            dict(symbol="brtn25", product_symbol="brt", timestamp=1, mid="71"),
+        ],
+    )
+    await cli.handle_text_message(json.dumps(payload))
+    await cli.handle_text_message(json.dumps(payload))
+    assert len(events) == 2
+    tickers = events[1].tickers()
+    assert tickers is not None
+    assert len(tickers.tickers) == 2
+    # the snapshot sent after a reconnection is dispatched in full
+    await cli.close()
+    assert cli.get_ticker("brtm25") is None
+    await cli.handle_binary_message(data)
+    assert len(events) == 3
@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from onyx_otc.capture import (
+    HEADER,
+    RECORD,
+    CaptureError,
+    CaptureReader,
+    CaptureWriter,
+    RecordKind,
+)
+
+from .utils import frame, ticker_proto, tickers_message
+
+
+def test_capture_roundtrip(tmp_path: Path) -> None:
+    path = tmp_path / "capture.onyx"
+    data = frame(tickers_message(ticker_proto("a", "1")))
+    with CaptureWriter(path, index_interval=3) as writer:
+        for i in range(1, 8):
+            writer.write(data if i % 2 else '{"id": 1}', recv_ns=i * 100)
+    # appending to an existing capture
+    with CaptureWriter(path) as writer:
+        writer.write(data, recv_ns=800)
+    with CaptureReader(path) as reader:
+        frames = list(reader)
+        assert [f.recv_ns for f in frames] == [i * 100 for i in range(1, 9)]
+        assert frames[0].kind is RecordKind.BINARY
+        assert frames[0].data() == data
+        assert frames[1].data() == '{"id": 1}'
+        assert [(e.offset > 0, e.frames) for e in reader.index()] == [
+            (True, 3),
+            (True, 3),
+            (True, 1),
+            (True, 1),
+        ]
+        # seek by time through the index
+        assert [f.recv_ns for f in reader.frames(start_ns=450)] == [500, 600, 700, 800]
+        assert list(reader.frames(start_ns=900)) == []
+        for f in frames:
+            f.payload.release()
+
+
+def test_capture_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "capture.onyx"
+    with CaptureWriter(path) as writer:
+        # the header is on disk as soon as the writer is created
+        assert path.stat().st_size == HEADER.size
+        writer.write(b"abc", recv_ns=100)
+        writer.write(b"defg", recv_ns=200)
+        writer.flush()
+        # a writer which did not close the file, with a partial last record
+        crashed = path.read_bytes()[:-2]
+    path.write_bytes(crashed)
+    with CaptureReader(path) as reader:
+        assert [f.data() for f in reader] == [b"abc"]
+        assert reader.index() == []
+    # appending drops the partial record and indexes the earlier frame
+    with CaptureWriter(path) as writer:
+        writer.write(b"hij", recv_ns=300)
+    with CaptureReader(path) as reader:
+        assert [f.data() for f in reader] == [b"abc", b"hij"]
+        assert [(e.first_ns, e.last_ns, e.frames) for e in reader.index()] == [
+            (100, 300, 2)
+        ]
+
+
+def test_capture_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "capture.onyx"
+    path.write_bytes(b"")
+    with pytest.raises(CaptureError):
+        CaptureReader(path)
+    path.write_bytes(b"not a capture file")
+    with pytest.raises(CaptureError):
+        CaptureReader(path)
+    with pytest.raises(CaptureError):
+        CaptureWriter(path)
+    assert path.read_bytes() == b"not a capture file"
+
+
+def test_capture_corrupt_record(tmp_path: Path) -> None:
+    path = tmp_path / "capture.onyx"
+    with CaptureWriter(path, index_interval=2) as writer:
+        for i in range(1, 6):
+            writer.write(b"frame%d" % i, recv_ns=i * 100)
+    data = bytearray(path.read_bytes())
+    # corrupt the kind of the first record, in the first indexed block
+    data[HEADER.size] = 0xFF
+    path.write_bytes(data)
+    with CaptureReader(path) as reader:
+        # frames are read again from the next indexed block
+        assert [f.data() for f in reader] == [b"frame3", b"frame4", b"frame5"]
+    # a corrupt record after the last index record is never truncated
+    with CaptureWriter(path, index_interval=10) as writer:
+        writer.write(b"frame6", recv_ns=600)
+        writer.write(b"frame7", recv_ns=700)
+        writer.flush()
+        size = path.stat().st_size
+        data = bytearray(path.read_bytes())
+    data[size - 2 * (RECORD.size + 6)] = 0xFF
+    path.write_bytes(data)
+    with pytest.raises(CaptureError):
+        CaptureWriter(path)
+    assert path.read_bytes() == data
+    with CaptureReader(path) as reader:
+        with pytest.raises(CaptureError):
+            list(reader)
@@ -0,0 +1,66 @@
+import pytest
+
+from onyx_otc.timestamp import Timestamp
+from onyx_otc.v2 import common_pb2
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, obt_message, obt_proto, ticker_proto, tickers_message
+
+np = pytest.importorskip("numpy")
+columns = pytest.importorskip("onyx_otc.columns")
+
+
+def test_ticker_columns() -> None:
+    ts = Timestamp.from_seconds(1700000000, 123)
+    proto = tickers_message(
+        ticker_proto("brtm25", "70.5", timestamp=ts),
+        ticker_proto("brtn25", "70.25", timestamp=ts),
+        ticker_proto("brtm25", "71", timestamp=ts),
+    )
+    symbols = columns.SymbolIds()
+    cols = columns.channel_message_to_columns(proto, symbols)
+    assert isinstance(cols, columns.TickerColumns)
+    assert len(cols) == 3
+    assert cols.symbol_id.tolist() == [0, 1, 0]
+    assert [symbols.symbol(i) for i in cols.product_id] == ["brt", "brt", "brt"]
+    assert cols.timestamp.dtype == np.int64
+    assert cols.timestamp.tolist() == [ts, ts, ts]
+    assert cols.mid.tolist() == [70.5, 70.25, 71.0]
+
+
+def test_obt_columns_scaled() -> None:
+    proto = obt_message(obt_proto("brtm25", ("70.12", "5"), ("70.13", "")))
+    cols = columns.channel_message_to_columns(proto, columns.SymbolIds(), scale=2)
+    assert isinstance(cols, columns.OrderBookTopColumns)
+    assert cols.bid_price.dtype == np.int64
+    assert cols.bid_price.tolist() == [7012]
+    assert cols.bid_amount.tolist() == [500]
+    assert cols.ask_price.tolist() == [7013]
+    assert cols.ask_amount.tolist() == [columns.MISSING]
+
+
+def test_scaled_decimals() -> None:
+    values = [
+        common_pb2.Decimal(value=value)
+        for value in ("92233720368.54775807", "0.125", "-0.135", "7", "")
+    ]
+    array = columns.decimals_array(values, len(values), scale=2)
+    # large values keep every digit, no float rounding
+    assert array.tolist() == [9223372036855, 12, -14, 700, columns.MISSING]
+    assert columns.decimals_array(values[:1], 1, scale=8).tolist() == [
+        9223372036854775807
+    ]
+    with pytest.raises(ValueError):
+        columns.decimals_array(values, len(values), scale=19)
+
+
+async def test_client_columns_handler() -> None:
+    received: list = []
+    cli = OnyxWebsocketClientV2.create(
+        on_event_columns=lambda cli, cols: received.append(cols)
+    )
+    await cli.handle_binary_message(
+        frame(tickers_message(ticker_proto("ebobm25", "1")))
+    )
+    assert len(received) == 1
+    assert cli.symbol_ids.symbol(received[0].symbol_id[0]) == "ebobm25"
@@ -0,0 +1,87 @@
+import sys
+from decimal import Decimal
+
+import pytest
+
+from onyx_otc import bench
+from onyx_otc.compact import CompactChannelMessage, CompactTicker
+from onyx_otc.responses import OtcChannelMessage, Ticker
+from onyx_otc.types import Channel, Side
+from onyx_otc.v2 import responses_pb2
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import (
+    frame,
+    obt_message,
+    obt_proto,
+    order_book_proto,
+    order_books_message,
+    ticker_proto,
+    tickers_message,
+)
+
+
+@pytest.mark.parametrize(
+    "proto",
+    [
+        tickers_message(ticker_proto("brtm25", "70.5"), ticker_proto("brtn25", "70")),
+        tickers_message(),
+        obt_message(obt_proto("brtm25", ("70.1", "5"), ("70.2", "3"))),
+        bench.quote_message(),
+        bench.server_info_message(),
+        responses_pb2.ChannelMessage(
+            channel=Channel.ORDERS.to_proto(), order=bench.order_proto()
+        ),
+        order_books_message(order_book_proto("brtm25", [("70", "1")], [("71", "2")])),
+    ],
+)
+def test_to_model(proto: responses_pb2.ChannelMessage) -> None:
+    compact = CompactChannelMessage.from_proto(proto)
+    assert compact.to_model().model_dump() == (
+        OtcChannelMessage.from_proto(proto).model_dump()
+    )
+
+
+def test_compact_accessors() -> None:
+    compact = CompactChannelMessage.from_proto(
+        tickers_message(ticker_proto("brtm25", "70.5"))
+    )
+    assert compact.channel is Channel.TICKERS
+    assert compact.order_book_tops() is None
+    assert compact.otc_quote() is None
+    tickers = compact.tickers()
+    assert tickers is not None
+    assert tickers[0].mid == Decimal("70.5")
+    assert tickers[0].product_symbol == "brt"
+    order = CompactChannelMessage.from_proto(
+        responses_pb2.ChannelMessage(
+            channel=Channel.ORDERS.to_proto(), order=bench.order_proto()
+        )
+    ).order()
+    assert order is not None
+    assert order.side is Side.BUY
+    assert order.symbol.as_string() == "brtf25"
+    quote = CompactChannelMessage.from_proto(bench.quote_message()).otc_quote()
+    assert quote is not None
+    assert quote.symbol.as_string() == "brtf25-brtg25"
+
+
+def test_compact_size() -> None:
+    proto = ticker_proto("brtm25", "70.5")
+    compact = CompactTicker.from_proto(proto)
+    model = Ticker.from_proto(proto)
+    assert not hasattr(compact, "__dict__")
+    assert sys.getsizeof(compact) < sys.getsizeof(model) + sys.getsizeof(model.__dict__)
+
+
+async def test_client_compact_handler() -> None:
+    messages: list[CompactChannelMessage] = []
+    cli = OnyxWebsocketClientV2.create(
+        on_event_compact=lambda cli, message: messages.append(message)
+    )
+    await cli.handle_binary_message(
+        frame(tickers_message(ticker_proto("ebobm25", "1")))
+    )
+    assert len(messages) == 1
+    tickers = messages[0].tickers()
+    assert tickers and tickers[0].symbol == "ebobm25"
@@ -0,0 +1,68 @@
+from onyx_otc.conflation import Conflator
+from onyx_otc.responses import OtcChannelMessage
+from onyx_otc.types import Channel
+from onyx_otc.v2 import responses_pb2, types_pb2
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, obt_message, obt_proto, ticker_proto, tickers_message
+
+
+def test_conflator_proto() -> None:
+    conflator = Conflator()
+    conflator.add(tickers_message(ticker_proto("a", "1"), ticker_proto("b", "1")))
+    conflator.add(obt_message(obt_proto("a", ("1", "1"), ("2", "1"))))
+    conflator.add(tickers_message(ticker_proto("a", "2")))
+    order = responses_pb2.ChannelMessage(
+        channel=types_pb2.CHANNEL_ORDERS, order=responses_pb2.Order(id="1")
+    )
+    conflator.add(order)
+    assert len(conflator) == 3
+    assert conflator.pending_rows == 3
+    # orders first
+    assert conflator.pop() is order
+    tickers = conflator.pop()
+    assert isinstance(tickers, responses_pb2.ChannelMessage)
+    assert [(t.symbol, t.mid.value) for t in tickers.tickers.tickers] == [
+        ("a", "2"),
+        ("b", "1"),
+    ]
+    obts = conflator.pop()
+    assert isinstance(obts, responses_pb2.ChannelMessage)
+    assert obts.channel == types_pb2.CHANNEL_ORDER_BOOK_TOP
+    assert conflator.pop() is None
+    assert conflator.stats.updates == 4
+    assert conflator.stats.conflated == 1
+    assert conflator.stats.passthrough == 1
+    assert conflator.stats.delivered == 3
+
+
+def test_conflator_models() -> None:
+    conflator = Conflator()
+    for mid in ("1", "2", "3"):
+        conflator.add(
+            OtcChannelMessage.from_proto(tickers_message(ticker_proto("a", mid)))
+        )
+    message = conflator.pop()
+    assert isinstance(message, OtcChannelMessage)
+    assert message.channel == Channel.TICKERS
+    tickers = message.tickers()
+    assert tickers is not None
+    assert [str(t.mid) for t in tickers.tickers] == ["3"]
+    assert conflator.stats.conflated == 2
+
+
+async def test_client_conflation() -> None:
+    events: list[OtcChannelMessage] = []
+    cli = OnyxWebsocketClientV2.create(
+        conflate=True, on_event=lambda cli, e: events.append(e)
+    )
+    for mid in ("1", "2", "3"):
+        await cli.handle_binary_message(frame(tickers_message(ticker_proto("a", mid))))
+    assert cli.dispatch_queue_depth == 1
+    cli.start_tasks()
+    await cli.drain()
+    await cli.stop_tasks()
+    assert len(events) == 1
+    stats = cli.conflation_stats
+    assert stats is not None
+    assert stats.conflated == 2
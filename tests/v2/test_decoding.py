@@ -0,0 +1,169 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from onyx_otc import bench
+from onyx_otc.common import PriceAmount
+from onyx_otc.decoding import construct, decode_binary, decode_text
+from onyx_otc.fake_server import channel_json
+from onyx_otc.responses import OtcChannelMessage, otc_response_from_proto_bytes
+from onyx_otc.timestamp import Timestamp
+from onyx_otc.types import Channel
+from onyx_otc.v2 import responses_pb2
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, obt_message, obt_proto, ticker_proto, tickers_message
+
+
+def test_decode_binary() -> None:
+    data = frame(tickers_message(ticker_proto("a", "1")))
+    message = decode_binary(data)
+    assert isinstance(message, OtcChannelMessage)
+    tickers = message.tickers()
+    assert tickers is not None
+    assert tickers.tickers[0].symbol == "a"
+    assert isinstance(
+        decode_binary(data, raw_events=True), responses_pb2.ChannelMessage
+    )
+
+
+def test_decode_unknown_frame() -> None:
+    data = responses_pb2.OtcResponseMessage().SerializeToString()
+    assert decode_binary(data) is None
+    with pytest.raises(ValueError):
+        otc_response_from_proto_bytes(data)
+
+
+async def test_client_decode_executor() -> None:
+    events: list[OtcChannelMessage] = []
+
+    def on_event(cli: OnyxWebsocketClientV2, event: OtcChannelMessage) -> None:
+        events.append(event)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        cli = OnyxWebsocketClientV2.create(
+            on_event=on_event, decode_executor=executor, decode_queue_size=5
+        )
+        cli.start_tasks()
+        for i in range(20):
+            await cli.handle_binary_message(
+                frame(tickers_message(ticker_proto("a", str(i))))
+            )
+        await cli.drain()
+        await cli.stop_tasks()
+    # messages are delivered in the order they were received
+    mids = [str(e.tickers().tickers[0].mid) for e in events]  # type: ignore
+    assert mids == [str(i) for i in range(20)]
+
+
+async def test_client_decode_executor_stopped() -> None:
+    events: list[OtcChannelMessage] = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cli = OnyxWebsocketClientV2.create(
+            on_event=lambda cli, event: events.append(event),
+            decode_executor=executor,
+        )
+        # frames queued for a connection which is lost are dropped
+        await cli.handle_binary_message(frame(tickers_message(ticker_proto("a", "1"))))
+        await cli.stop_tasks()
+        await asyncio.wait_for(cli.drain(), 1)
+        cli.start_tasks()
+        await cli.handle_binary_message(frame(tickers_message(ticker_proto("a", "2"))))
+        await cli.drain()
+        await cli.stop_tasks()
+    assert [str(e.tickers().tickers[0].mid) for e in events] == ["2"]  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        tickers_message(ticker_proto("brtf25", "70.1"), ticker_proto("brtg25", "70")),
+        obt_message(obt_proto("brtf25", ("70", "5"), ("70.1", "3"))),
+        bench.quote_message(),
+    ],
+)
+def test_decode_text_trusted(message: responses_pb2.ChannelMessage) -> None:
+    text = json.dumps(channel_json(message))
+    trusted = decode_text(text, trusted=True)
+    assert isinstance(trusted, OtcChannelMessage)
+    assert trusted == decode_text(text)
+    assert trusted.model_dump() == OtcChannelMessage.from_proto(message).model_dump()
+
+
+def test_decode_one_sided_quote() -> None:
+    message = bench.quote_message()
+    message.otc_quote.ClearField("sell")
+    quote = OtcChannelMessage.from_proto(message).otc_quote()
+    assert quote and quote.buy and quote.sell is None
+    assert OtcChannelMessage.from_proto(message, trusted=True).otc_quote() == quote
+    text = json.dumps(channel_json(message))
+    for trusted in (True, False):
+        decoded = decode_text(text, trusted=trusted)
+        assert isinstance(decoded, OtcChannelMessage)
+        assert (
+            decoded.model_dump() == OtcChannelMessage.from_proto(message).model_dump()
+        )
+
+
+def test_construct() -> None:
+    price, amount = Decimal("70.1"), Decimal(5)
+    model = construct(PriceAmount, price=price, amount=amount)
+    expected = PriceAmount.model_construct(price=price, amount=amount)
+    assert model == expected
+    assert model.model_fields_set == expected.model_fields_set
+    assert model.model_copy(update=dict(amount=Decimal(1))).amount == 1
+
+
+def test_decode_text_trusted_order_books() -> None:
+    timestamp = "2025-01-02T10:00:00+00:00"
+    text = json.dumps(
+        {
+            "channel": "order_book",
+            "timestamp": timestamp,
+            "message": [
+                {
+                    "symbol": "brtf25",
+                    "product_symbol": "brt",
+                    "exchange": "ice",
+                    "timestamp": timestamp,
+                    "bids": [{"price": "70", "amount": "5"}],
+                    "asks": [{"price": "70.1", "amount": "2"}],
+                }
+            ],
+        }
+    )
+    trusted = decode_text(text, trusted=True)
+    assert trusted == decode_text(text)
+    assert isinstance(trusted, OtcChannelMessage)
+    books = trusted.order_books()
+    assert books and books.order_books[0].asks[0].price == Decimal("70.1")
+
+
+@pytest.mark.parametrize("handler", ["on_event", "on_event_view", "on_event_compact"])
+async def test_channel_without_decoder_dropped(handler: str) -> None:
+    events: list = []
+    cli = OnyxWebsocketClientV2.create(
+        **{handler: lambda cli, event: events.append(event)}  # type: ignore[arg-type]
+    )
+    cli.start_tasks()
+    dy_tickers = responses_pb2.ChannelMessage(
+        channel=Channel.DY_TICKERS.to_proto(), timestamp=Timestamp.utcnow().to_proto()
+    )
+    dy_tickers.dy_tickers.SetInParent()
+    await cli.handle_binary_message(frame(dy_tickers))
+    await cli.handle_text_message(
+        json.dumps(
+            {
+                "channel": "dy_tickers",
+                "timestamp": "2025-01-02T10:00:00+00:00",
+                "message": [],
+            }
+        )
+    )
+    await cli.handle_binary_message(frame(tickers_message(ticker_proto("a", "1"))))
+    await cli.drain()
+    await cli.stop_tasks()
+    assert len(events) == 1
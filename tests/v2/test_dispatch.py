@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from onyx_otc.dispatch import Dispatcher, OverflowPolicy
+from onyx_otc.responses import OtcChannelMessage
+from onyx_otc.v2 import responses_pb2, types_pb2
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, ticker_proto, tickers_message
+
+
+async def test_dispatcher_drop_oldest() -> None:
+    handled: list = []
+
+    async def handler(message) -> None:
+        handled.append(message)
+
+    dispatcher = Dispatcher(handler, maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+    order = responses_pb2.ChannelMessage(channel=types_pb2.CHANNEL_ORDERS)
+    messages = [tickers_message(ticker_proto("a", str(i))) for i in range(3)]
+    await dispatcher.put(order)
+    for message in messages:
+        await dispatcher.put(message)
+    assert dispatcher.depth == 2
+    assert dispatcher.stats.dropped == 2
+    dispatcher.start()
+    await dispatcher.join()
+    await dispatcher.stop()
+    # orders are never dropped
+    assert handled == [order, messages[2]]
+    assert dispatcher.stats.dispatched == 2
+    assert dispatcher.stats.max_depth == 2
+
+
+async def test_dispatcher_block() -> None:
+    handled: list = []
+
+    async def handler(message) -> None:
+        handled.append(message)
+
+    dispatcher = Dispatcher(handler, maxsize=1)
+    await dispatcher.put(tickers_message())
+    put = asyncio.create_task(dispatcher.put(tickers_message()))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert not put.done()
+    dispatcher.start()
+    await put
+    await dispatcher.join()
+    await dispatcher.stop()
+    assert len(handled) == 2
+
+
+async def test_client_async_handlers() -> None:
+    events: list[OtcChannelMessage] = []
+
+    async def on_event(cli: OnyxWebsocketClientV2, event: OtcChannelMessage) -> None:
+        await asyncio.sleep(0)
+        events.append(event)
+
+    cli = OnyxWebsocketClientV2.create(
+        on_event=on_event, dispatch_queue_size=10, dispatch_consumers=2
+    )
+    for mid in ("1", "2", "3"):
+        await cli.handle_binary_message(frame(tickers_message(ticker_proto("a", mid))))
+    assert cli.dispatch_queue_depth == 3
+    cli.start_tasks()
+    await cli.drain()
+    await cli.stop_tasks()
+    assert len(events) == 3
+    stats = cli.dispatch_stats
+    assert stats is not None
+    assert stats.dispatched == 3
+    # inline dispatch awaits async handlers too
+    cli = OnyxWebsocketClientV2.create(on_event=on_event)
+    await cli.handle_binary_message(frame(tickers_message(ticker_proto("a", "1"))))
+    assert len(events) == 4
+
+
+@pytest.mark.parametrize("policy", [OverflowPolicy.BLOCK, OverflowPolicy.CONFLATE])
+async def test_dispatcher_stop_drops_queued(policy: OverflowPolicy) -> None:
+    handled: list = []
+
+    async def handler(message) -> None:
+        handled.append(message)
+
+    dispatcher = Dispatcher(handler, policy=policy)
+    order = responses_pb2.ChannelMessage(channel=types_pb2.CHANNEL_ORDERS)
+    await dispatcher.put(tickers_message(ticker_proto("a", "1")))
+    await dispatcher.put(order)
+    await dispatcher.put(tickers_message(ticker_proto("b", "1")))
+    await dispatcher.stop()
+    # market data of the stopped connection is dropped, orders are kept
+    assert dispatcher.depth == 1
+    assert dispatcher.stats.dropped == (2 if policy is OverflowPolicy.BLOCK else 1)
+    dispatcher.start()
+    await dispatcher.join()
+    await dispatcher.stop()
+    assert handled == [order]
@@ -0,0 +1,121 @@
+import asyncio
+import contextlib
+
+import pytest
+from aiohttp import ClientSession
+
+from onyx_otc.fake_server import FakeServer, contracts
+from onyx_otc.requests import (
+    OtcOrderRequest,
+    RfqChannel,
+    SubscribeRequest,
+    TickersChannel,
+)
+from onyx_otc.responses import OtcChannelMessage, OtcResponseError
+from onyx_otc.types import Channel, OtcErrorCode, Side
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import OnResponseV2
+
+
+async def next_event(responses: OnResponseV2, channel: Channel) -> OtcChannelMessage:
+    while True:
+        event = await responses.get_otc_event()
+        if event.channel is channel:
+            return event
+
+
+def test_contracts() -> None:
+    assert contracts("brt", 14)[:2] == ["brtf25", "brtg25"]
+    assert contracts("brt", 14)[12:] == ["brtf26", "brtg26"]
+
+
+async def test_market_data(
+    fake_server: FakeServer,
+    fake_cli: OnyxWebsocketClientV2,
+    responsesv2: OnResponseV2,
+) -> None:
+    response = await fake_cli.call(
+        SubscribeRequest(data=TickersChannel(products=["brt", "wti"]))
+    )
+    subscription = response.subscription()
+    assert subscription and subscription.channel is Channel.TICKERS
+    fake_cli.subscribe_obt(["brt"])
+    tickers = (await next_event(responsesv2, Channel.TICKERS)).tickers()
+    assert tickers
+    assert {t.product_symbol for t in tickers.tickers} <= {"brt", "wti"}
+    obts = (await next_event(responsesv2, Channel.ORDER_BOOK_TOP)).order_book_tops()
+    assert obts
+    assert obts.order_book_tops[0].buy.price < obts.order_book_tops[0].sell.price
+    (conn,) = fake_server.connections
+    assert conn.binary is fake_cli.is_binary
+    assert conn.subscriptions.tickers == {"brt", "wti"}
+    assert conn.subscriptions.obt == {"brt"}
+    assert fake_server.stats.messages[Channel.TICKERS] > 0
+
+
+async def test_orders_and_rfq(
+    fake_cli: OnyxWebsocketClientV2, responsesv2: OnResponseV2
+) -> None:
+    fake_cli.subscribe_orders()
+    fake_cli.subscribe_rfq(RfqChannel.from_string("brtf25@ice@5"))
+    response = await fake_cli.call(
+        OtcOrderRequest.model_validate(
+            dict(
+                account_id="acc",
+                symbol={"symbol": "brtf25"},
+                quantity=2,
+                side=Side.BUY,
+                price="71.5",
+                client_order_id="c1",
+            )
+        )
+    )
+    order = response.order()
+    assert order and order.price == 71.5
+    quote = (await next_event(responsesv2, Channel.RFQ)).otc_quote()
+    assert quote and quote.symbol.as_string() == "brtf25"
+    assert quote.buy and quote.buy.amount == 5
+    assert (await next_event(responsesv2, Channel.ORDERS)).order()
+
+
+async def test_rejected(
+    fake_server: FakeServer, fake_cli: OnyxWebsocketClientV2
+) -> None:
+    fake_server.reject.add("bad")
+    with pytest.raises(OtcResponseError) as exc_info:
+        await fake_cli.call(
+            SubscribeRequest(data=TickersChannel(products=["brt", "bad"]))
+        )
+    assert exc_info.value.code is OtcErrorCode.INVALID_REQUEST
+    assert fake_server.connections[0].subscriptions.tickers == set()
+
+
+async def test_unauthenticated(
+    fake_server: FakeServer, responsesv2: OnResponseV2
+) -> None:
+    fake_server.token = "secret"
+    cli = OnyxWebsocketClientV2.create(
+        on_response=responsesv2.on_response,
+        ws_url=fake_server.url,
+        api_token="wrong",
+    )
+    task = asyncio.create_task(cli.connect())
+    try:
+        error = (await responsesv2.get_otc_response()).error()
+        assert error and error.code is OtcErrorCode.UNAUTHENTICATED
+        with pytest.raises(OtcResponseError):
+            await cli.call(SubscribeRequest(data=TickersChannel(products=["brt"])))
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def test_malformed_request(fake_server: FakeServer) -> None:
+    async with ClientSession() as session:
+        async with session.ws_connect(fake_server.url) as ws:
+            await ws.send_str("not json")
+            payload = await ws.receive_json(timeout=1)
+    assert payload["method"] == "otcerror"
+    assert payload["code"] == OtcErrorCode.INVALID_REQUEST.value
@@ -0,0 +1,115 @@
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from onyx_otc.common import TradableSymbol
+from onyx_otc.compact import CompactChannelMessage
+from onyx_otc.fixed import Fixed
+from onyx_otc.requests import OtcOrderRequest, OtcRequest
+from onyx_otc.timestamp import Timestamp
+from onyx_otc.types import Side
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, obt_message, obt_proto, ticker_proto, tickers_message
+
+
+@pytest.mark.parametrize(
+    "value, scale, mantissa, expected",
+    [
+        ("70.125", 0, 70125, "70.125"),
+        ("70.1", 3, 70100, "70.100"),
+        ("-0.05", 2, -5, "-0.05"),
+        ("12", 0, 12, "12"),
+        ("1.5e2", 0, 150, "150"),
+        ("1E-3", 0, 1, "0.001"),
+    ],
+)
+def test_parse(value: str, scale: int, mantissa: int, expected: str) -> None:
+    fixed = Fixed.parse(value, scale)
+    assert fixed.mantissa == mantissa
+    assert str(fixed) == expected
+    assert fixed == Decimal(value)
+    assert hash(fixed) == hash(Decimal(value))
+
+
+def test_parse_invalid() -> None:
+    with pytest.raises(ValueError):
+        Fixed.parse("70.1x")
+
+
+def test_arithmetic() -> None:
+    a = Fixed.parse("70.125")
+    b = Fixed.parse("0.5")
+    assert a + b == Fixed.parse("70.625")
+    assert a - b == Decimal("69.625")
+    assert b - a == Decimal("-69.625")
+    assert a * 2 == Decimal("140.25")
+    assert 1 + b == Decimal("1.5")
+    assert a * b == Decimal("35.0625")
+    assert -b < 0 < b < a
+    assert max(a, b) is a
+    assert Fixed.parse("70.10") == Fixed.parse("70.1")
+    assert float(a) == 70.125
+    assert repr(b) == "Fixed('0.5')"
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+def test_rescale() -> None:
+    fixed = Fixed.parse("70.10")
+    assert fixed.rescale(1).mantissa == 701
+    assert fixed.rescale(4).mantissa == 701000
+    with pytest.raises(ValueError):
+        Fixed.parse("70.15").rescale(1)
+
+
+def test_order_request() -> None:
+    order = OtcOrderRequest(
+        account_id="acc",
+        symbol=TradableSymbol.from_string("brtf25"),
+        quantity=Fixed(5),
+        side=Side.BUY,
+        price=Fixed.parse("71.5", 2),
+    )
+    assert isinstance(order.price, Fixed)
+    proto = order.to_proto()
+    assert proto.price.value == "71.50"
+    assert proto.quantity.value == "5"
+    request = OtcRequest(id="1", timestamp=Timestamp.utcnow(), request=order)
+    assert request.to_json_dict()["price"] == "71.50"
+    validated = OtcOrderRequest.model_validate(
+        dict(order.model_dump(), price="71.5", quantity=2)
+    )
+    assert isinstance(validated.price, Decimal)
+    assert isinstance(validated.quantity, Decimal)
+
+
+def test_compact_scales() -> None:
+    proto = obt_message(obt_proto("brtm25", ("70.1", "5"), ("70.25", "3")))
+    compact = CompactChannelMessage.from_proto(proto, scales={"brt": 3})
+    tops = compact.order_book_tops()
+    assert tops is not None
+    buy, sell = tops[0].buy.price, tops[0].sell.price
+    assert isinstance(buy, Fixed) and isinstance(sell, Fixed)
+    assert buy.scale == sell.scale == 3
+    assert tops[0].sell.price - tops[0].buy.price == Decimal("0.15")
+    assert tops[0].buy.amount == 5
+    assert compact.to_model().model_dump() == (
+        CompactChannelMessage.from_proto(proto).to_model().model_dump()
+    )
+
+
+async def test_client_fixed_point() -> None:
+    messages: list[CompactChannelMessage] = []
+    cli = OnyxWebsocketClientV2.create(
+        on_event_compact=lambda cli, message: messages.append(message),
+        fixed_point=True,
+        price_scales={"brt": 2},
+    )
+    await cli.handle_binary_message(
+        frame(tickers_message(ticker_proto("brtm25", "70.5")))
+    )
+    tickers = messages[0].tickers()
+    assert tickers is not None
+    assert isinstance(tickers[0].mid, Fixed)
+    assert str(tickers[0].mid) == "70.50"
@@ -0,0 +1,90 @@
+import random
+
+from onyx_otc.histogram import (
+    FeedLatency,
+    LatencyHistogram,
+    bucket_index,
+    bucket_upper,
+)
+from onyx_otc.responses import OtcChannelMessage
+from onyx_otc.timestamp import Timestamp
+from onyx_otc.types import Channel
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, ticker_proto, tickers_message
+
+
+def test_buckets() -> None:
+    for value in [0, 1, 31, 32, 63, 64, 65, 1000, 123_456_789, 2**40 + 7]:
+        index = bucket_index(value)
+        assert bucket_upper(index) >= value
+        if index:
+            assert bucket_upper(index - 1) < value
+        # relative error is bounded by the sub buckets
+        assert bucket_upper(index) - value <= max(value // 32, 0)
+
+
+def test_percentiles() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.p99 == 0
+    values = list(range(1, 100_001))
+    random.Random(42).shuffle(values)
+    for value in values:
+        histogram.record(value)
+    assert histogram.count == 100_000
+    assert histogram.min == 1
+    assert histogram.max == 100_000
+    assert abs(histogram.p50 - 50_000) <= 50_000 / 32
+    assert abs(histogram.p99 - 99_000) <= 99_000 / 32
+    assert abs(histogram.p999 - 99_900) <= 99_900 / 32
+    assert histogram.percentile(100) == 100_000
+
+
+def test_negative_and_merge() -> None:
+    a = LatencyHistogram()
+    a.record(-5)
+    a.record(10)
+    b = LatencyHistogram()
+    b.record(1000)
+    a.merge(b)
+    assert a.count == 3
+    assert a.negative == 1
+    assert a.min == 0
+    assert a.max == 1000
+    a.reset()
+    assert a.count == 0
+    assert a.p50 == 0
+
+
+async def test_client_latency() -> None:
+    events: list[OtcChannelMessage] = []
+    latency = FeedLatency(per_product=True)
+    cli = OnyxWebsocketClientV2.create(
+        on_event=lambda cli, event: events.append(event), latency=latency
+    )
+    sent = Timestamp.utcnow()
+    message = tickers_message(
+        ticker_proto("brtf25", "70", timestamp=sent),
+        ticker_proto("wtif25", "65", timestamp=sent),
+    )
+    message.timestamp.CopyFrom(sent.to_proto())
+    recv_ns = sent + 2_000_000
+    await cli.handle_binary_message(frame(message), recv_ns)
+    assert len(events) == 1
+    feed = latency.feed[Channel.TICKERS]
+    assert feed.count == 1
+    assert feed.max == 2_000_000
+    assert latency.products["brt"].max == 2_000_000
+    assert latency.products["wti"].count == 1
+    assert latency.handler[Channel.TICKERS].count == 1
+    assert latency.handler[Channel.TICKERS].min >= 0
+    # frames without a receive time are not recorded as feed latency
+    await cli.handle_binary_message(frame(message))
+    assert feed.count == 1
+    assert latency.handler[Channel.TICKERS].count == 2
+    # channel message models from the JSON endpoint
+    model = OtcChannelMessage.from_proto(message)
+    await cli.handle_channel_message(model, recv_ns + 1_000_000)
+    assert feed.count == 2
+    assert feed.max == 3_000_000
+    assert latency.products["wti"].max == 3_000_000
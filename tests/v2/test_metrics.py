@@ -0,0 +1,64 @@
+from aiohttp import ClientSession
+
+from onyx_otc.fake_server import FakeServer
+from onyx_otc.metrics import (
+    CONTENT_TYPE,
+    ClientMetrics,
+    MetricsExporter,
+    prometheus_text,
+    stats_line,
+)
+from onyx_otc.types import Channel
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import OnResponseV2, connected, frame, ticker_proto, tickers_message
+
+
+async def test_frame_metrics() -> None:
+    metrics = ClientMetrics()
+    cli = OnyxWebsocketClientV2.create(
+        on_event=lambda cli, event: None, metrics=metrics
+    )
+    data = frame(
+        tickers_message(ticker_proto("brtf25", "70"), ticker_proto("brtg25", "71"))
+    )
+    await cli.handle_binary_message(data)
+    await cli.handle_binary_message(data)
+    assert metrics.frames == 2
+    assert metrics.bytes == 2 * len(data)
+    assert metrics.messages[Channel.TICKERS] == 2
+    assert metrics.channel_bytes[Channel.TICKERS] == 2 * len(data)
+    assert metrics.rows[(Channel.TICKERS, "brt")] == 4
+    assert metrics.handler_calls == 2
+    assert metrics.decode_ns > 0
+    snapshot = metrics.snapshot()
+    await cli.handle_binary_message(data)
+    assert metrics.rates(snapshot)[(Channel.TICKERS, "brt")] > 0
+    assert "frames/s" in stats_line(cli, snapshot)
+    text = prometheus_text(cli)
+    assert 'onyx_channel_messages_total{channel="tickers"} 3' in text
+    assert 'onyx_subscription_rows_total{channel="tickers",product="brt"} 6' in text
+    assert "onyx_write_queue_depth 0" in text
+
+
+async def test_exporter(fake_server: FakeServer, responsesv2: OnResponseV2) -> None:
+    cli = OnyxWebsocketClientV2.create(
+        on_response=responsesv2.on_response,
+        on_event=responsesv2.on_event,
+        ws_url=fake_server.url,
+        api_token="test",
+    )
+    async with MetricsExporter(cli, port=0) as exporter, connected(cli):
+        assert (await responsesv2.get_otc_response()).auth()
+        cli.subscribe_tickers(["brt"])
+        await responsesv2.get_otc_event()
+        async with ClientSession() as session:
+            async with session.get(exporter.url) as response:
+                assert response.status == 200
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                text = await response.text()
+    assert cli.metrics is not None
+    assert cli.metrics.connections == 1
+    assert cli.metrics.responses >= 2
+    assert "onyx_frames_total" in text
+    assert 'onyx_channel_messages_total{channel="tickers"}' in text
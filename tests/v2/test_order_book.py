@@ -0,0 +1,97 @@
+from onyx_otc.order_book import OrderBookEngine
+from onyx_otc.requests import OrderBookChannel, OtcRequest, SubscribeRequest
+from onyx_otc.responses import OtcChannelMessage
+from onyx_otc.timestamp import Timestamp
+from onyx_otc.types import Channel, Exchange
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, order_book_proto, order_books_message
+
+
+def test_subscribe_request() -> None:
+    request = OtcRequest(
+        id="1",
+        timestamp=Timestamp.utcnow(),
+        request=SubscribeRequest(data=OrderBookChannel.from_string("brtm25@ice")),
+    )
+    proto = request.to_proto()
+    assert proto.subscribe.order_book.symbol.flat == "brtm25"
+    assert request.to_json_dict()["channel"] == {
+        "order_book": {"symbol": "brtm25", "exchange": "ice"}
+    }
+
+
+def test_incremental_updates() -> None:
+    engine = OrderBookEngine()
+    engine.apply_proto(
+        order_books_message(
+            order_book_proto(
+                "brtm25",
+                bids=[("70.1", "5"), ("70.0", "3"), ("69.9", "1")],
+                asks=[("70.3", "2"), ("70.2", "4")],
+            )
+        ).order_books
+    )
+    book = engine.get("brtm25", Exchange.ICE)
+    assert book is not None
+    assert book.best_bid() == (70.1, 5)
+    assert book.best_ask() == (70.2, 4)
+    assert book.spread() is not None
+    assert book.bids.levels(2) == [(70.1, 5), (70.0, 3)]
+    assert book.asks.level(1) == (70.3, 2)
+    assert book.bids.depth_of(70.0) == 1
+    assert book.asks.amount_to_depth(5) == 6
+    # remove best bid, change an ask, add a new ask level
+    engine.apply_proto(
+        order_books_message(
+            order_book_proto(
+                "brtm25", bids=[("70.1", "0")], asks=[("70.2", "1"), ("70.25", "7")]
+            )
+        ).order_books
+    )
+    assert book.best_bid() == (70.0, 3)
+    assert list(book.asks) == [(70.2, 1), (70.25, 7), (70.3, 2)]
+    assert book.asks.amount_at(70.25) == 7
+    assert book.asks.amount_at(70.26) == 0
+
+
+def test_snapshot_updates() -> None:
+    engine = OrderBookEngine(snapshot=True)
+    engine.apply_proto(
+        order_books_message(
+            order_book_proto("brtm25", bids=[("70.1", "5")], asks=[("70.2", "4")])
+        ).order_books
+    )
+    engine.apply_proto(
+        order_books_message(
+            order_book_proto("brtm25", bids=[("70", "1")], asks=[])
+        ).order_books
+    )
+    book = engine.get("brtm25", Exchange.ICE)
+    assert book is not None
+    assert list(book.bids) == [(70.0, 1)]
+    assert book.best_ask() is None
+
+
+async def test_client_order_book() -> None:
+    events: list[OtcChannelMessage] = []
+    cli = OnyxWebsocketClientV2.create(
+        order_books=OrderBookEngine(), on_event=lambda cli, e: events.append(e)
+    )
+    await cli.handle_binary_message(
+        frame(order_books_message(order_book_proto("brtm25", [("1", "2")], [])))
+    )
+    assert cli.order_books is not None
+    book = cli.order_books.get("brtm25", Exchange.ICE)
+    assert book is not None
+    assert book.best_bid() == (1, 2)
+    assert events[0].channel == Channel.ORDER_BOOK
+    assert events[0].order_books() is not None
+    # books are removed when unsubscribed and when the connection is lost
+    cli.unsubscribe_order_book(OrderBookChannel.from_string("brtm25@ice"))
+    assert cli.order_books.get("brtm25", Exchange.ICE) is None
+    await cli.handle_binary_message(
+        frame(order_books_message(order_book_proto("brtm25", [("1", "2")], [])))
+    )
+    await cli.close()
+    assert not cli.order_books.books
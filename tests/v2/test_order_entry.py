@@ -0,0 +1,97 @@
+from decimal import Decimal
+
+import pytest
+
+from onyx_otc.common import TradableSymbol
+from onyx_otc.fixed import Fixed
+from onyx_otc.order_entry import OrderTemplate
+from onyx_otc.requests import OtcOrderRequest, OtcRequest
+from onyx_otc.timestamp import Timestamp
+from onyx_otc.types import Method, OrderType, Side
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+from onyx_otc.writer import FrameWriter
+
+
+@pytest.mark.parametrize("binary", [True, False])
+@pytest.mark.parametrize("symbol", ["brtf25", "brtf25-brtg25"])
+def test_template_matches_request(binary: bool, symbol: str) -> None:
+    template = OrderTemplate(
+        "acc",
+        TradableSymbol.from_string(symbol),
+        Side.SELL,
+        OrderType.LIMIT,
+        binary=binary,
+    )
+    timestamp = Timestamp.utcnow()
+    writer = FrameWriter(binary=binary)
+    for request_id, price, quantity, client_order_id in [
+        ("wscli:1", "70.125", "5", "c1"),
+        ("wscli:2", "70.5", "10", ""),
+    ]:
+        request = OtcRequest(
+            id=request_id,
+            timestamp=timestamp,
+            request=OtcOrderRequest(
+                account_id="acc",
+                symbol=TradableSymbol.from_string(symbol),
+                quantity=Decimal(quantity),
+                side=Side.SELL,
+                price=Decimal(price),
+                order_type=OrderType.LIMIT,
+                client_order_id=client_order_id,
+            ),
+        )
+        frame = template.encode(
+            request_id, Decimal(price), Decimal(quantity), client_order_id, timestamp
+        )
+        assert frame == writer.serialize(request)
+
+
+def test_template_fixed_price() -> None:
+    template = OrderTemplate("acc", TradableSymbol.from_string("brtf25"), Side.BUY)
+    frame = template.encode("wscli:1", Fixed.parse("70.1", 2), Fixed(3))
+    assert b"70.10" in frame  # type: ignore[operator]
+
+
+async def test_send_order(fake_cli: OnyxWebsocketClientV2) -> None:
+    template = fake_cli.order_template("acc", "brtf25", Side.BUY)
+    assert template.binary is fake_cli.is_binary
+    response = await fake_cli.send_order(template, "71.5", "2", "c1")
+    order = response.order()
+    assert order and order.price == Decimal("71.5")
+    assert order.client_order_id == "c1"
+    response = await (await fake_cli.send_order_now(template, "71.25", "1"))
+    order = response.order()
+    assert order and order.price == Decimal("71.25")
+    assert fake_cli.request_stats[Method.ORDER].count == 2
+    other = OrderTemplate(
+        "acc", template.symbol, Side.BUY, binary=not fake_cli.is_binary
+    )
+    with pytest.raises(ValueError):
+        fake_cli.send_order(other, "71.5", "1")
+
+
+async def test_send_order_not_running() -> None:
+    cli = OnyxWebsocketClientV2.create()
+    template = cli.order_template("acc", "brtf25", Side.BUY)
+    with pytest.raises(ConnectionError):
+        await cli.send_order(template, "70", "1")
+    with pytest.raises(ConnectionError):
+        await (await cli.send_order_now(template, "70", "1"))
+
+
+class ResetWebSocket:
+    closed = False
+
+    async def send_bytes(self, data: bytes) -> None:
+        raise ConnectionResetError("Cannot write to closing transport")
+
+
+async def test_send_order_now_write_error() -> None:
+    cli = OnyxWebsocketClientV2.create()
+    template = cli.order_template("acc", "brtf25", Side.BUY)
+    cli._ws = ResetWebSocket()  # type: ignore[assignment]
+    with pytest.raises(ConnectionResetError):
+        await cli.send_order_now(template, "70", "1", timeout=0.01)
+    # the order is not left pending until its timeout
+    assert len(cli._pending) == 0
@@ -0,0 +1,182 @@
+from dataclasses import replace
+from decimal import Decimal
+
+from onyx_otc.common import TradableSymbol
+from onyx_otc.fake_server import channel_json
+from onyx_otc.orders import OrderManager
+from onyx_otc.requests import OtcOrderRequest
+from onyx_otc.responses import OtcChannelMessage, OtcOrder
+from onyx_otc.timestamp import Timestamp
+from onyx_otc.types import Channel, OrderState, Side
+from onyx_otc.v2 import common_pb2, responses_pb2
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import OnResponseV2, connected
+
+
+def _decimal(value: str) -> common_pb2.Decimal:
+    return common_pb2.Decimal(value=value)
+
+
+def execution_proto(
+    id_: str, amount: str, price: str, side: Side = Side.BUY
+) -> responses_pb2.Execution:
+    return responses_pb2.Execution(
+        id=id_,
+        order_id="o1",
+        client_order_id="c1",
+        account_id="acc",
+        symbol="brtf25",
+        amount=_decimal(amount),
+        price=_decimal(price),
+        side=side.to_proto(),
+        created_timestamp=Timestamp.utcnow().to_proto(),
+        fee=responses_pb2.Fee(
+            currency="USD", signed_amount=_decimal("-0.5"), rate=_decimal("0.001")
+        ),
+    )
+
+
+def order_proto(
+    state: OrderState,
+    executed: str | None,
+    *executions: responses_pb2.Execution,
+    id_: str = "o1",
+    side: Side = Side.BUY,
+) -> responses_pb2.Order:
+    proto = responses_pb2.Order(
+        id=id_,
+        client_order_id=f"c{id_[1:]}",
+        account_id="acc",
+        product_symbol="brt",
+        symbol=TradableSymbol.from_string("brtf25").to_proto(),
+        order_state=state.to_proto(),
+        amount=_decimal("10"),
+        price=_decimal("70"),
+        side=side.to_proto(),
+        created_timestamp=Timestamp.utcnow().to_proto(),
+        executions=executions,
+    )
+    if executed is not None:
+        proto.executed_amount.value = executed
+        proto.executed_avg_price.value = "70"
+    return proto
+
+
+def test_decode_order() -> None:
+    proto = order_proto(
+        OrderState.PARTIALLY_FILLED, "4", execution_proto("e1", "4", "70")
+    )
+    order = OtcOrder.from_proto(proto)
+    assert order.order_state is OrderState.PARTIALLY_FILLED
+    assert order.executed_amount == 4
+    assert order.remaining_amount == 6
+    assert order.executions[0].fee and order.executions[0].fee.signed_amount == -0.5
+    assert OtcOrder.from_proto(proto, trusted=True) == order
+    assert (
+        OtcOrder.from_proto(order_proto(OrderState.NEW, None)).executed_amount is None
+    )
+    message = responses_pb2.ChannelMessage(
+        channel=Channel.ORDERS.to_proto(),
+        timestamp=Timestamp.utcnow().to_proto(),
+        order=proto,
+    )
+    from_json = OtcChannelMessage.from_json(channel_json(message))
+    assert (
+        from_json
+        and from_json.model_dump() == OtcChannelMessage.from_proto(message).model_dump()
+    )
+
+
+def test_order_manager() -> None:
+    orders = OrderManager()
+    assert orders.apply_proto(order_proto(OrderState.NEW, None)) == []
+    totals = orders.totals_for("acc", "brtf25")
+    assert totals.open_orders == 1
+    assert totals.open_amount == 10
+    e1 = execution_proto("e1", "4", "70")
+    assert len(orders.apply_proto(order_proto(OrderState.PARTIALLY_FILLED, "4", e1)))
+    assert totals.open_orders == 1
+    assert totals.open_amount == 6
+    assert totals.bought == 4
+    # repeated executions are counted once
+    e2 = execution_proto("e2", "6", "71")
+    new = orders.apply_proto(order_proto(OrderState.FILLED, "10", e1, e2))
+    assert [execution.id for execution in new] == ["e2"]
+    assert totals.open_orders == 0
+    assert totals.open_amount == 0
+    assert totals.bought == 10
+    assert totals.avg_buy_price == Decimal("70.6")
+    assert totals.fees == {"USD": Decimal("-1.0")}
+    assert totals.executions == 2
+    # stale updates of a terminal order are ignored
+    orders.apply_proto(order_proto(OrderState.PARTIALLY_FILLED, "4", e1))
+    order = orders.get_by_client_order_id("c1")
+    assert order and order.order_state is OrderState.FILLED
+    assert orders.get("o1") is order
+    # other orders of the account
+    e3 = execution_proto("e3", "2", "72", Side.SELL)
+    orders.apply_proto(
+        order_proto(OrderState.PARTIALLY_FILLED, "2", e3, id_="o2", side=Side.SELL)
+    )
+    account = orders.totals_for("acc")
+    assert account.position == totals.position == 8
+    assert account.open_orders == 1
+    assert [order.id for order in orders.open_orders()] == ["o2"]
+    assert orders.totals_for("other").executions == 0
+    assert orders.prune() == 1
+    assert orders.get("o1") is None
+    assert "e1" not in orders.execution_ids
+    assert orders.totals_for("acc", "brtf25").bought == 10
+    # late duplicates of pruned orders are ignored
+    before = replace(totals, fees=dict(totals.fees))
+    assert orders.apply_proto(order_proto(OrderState.FILLED, "10", e1, e2)) == []
+    orders.apply_proto(order_proto(OrderState.PARTIALLY_FILLED, "4", e1))
+    assert orders.get("o1") is None
+    assert totals == before
+
+
+async def test_client_orders(
+    fake_cli: OnyxWebsocketClientV2, responsesv2: OnResponseV2
+) -> None:
+    orders = fake_cli.orders = OrderManager()
+    fake_cli.subscribe_orders()
+    response = await fake_cli.call(
+        OtcOrderRequest(
+            account_id="acc",
+            symbol=TradableSymbol.from_string("brtf25"),
+            quantity=Decimal(2),
+            side=Side.SELL,
+            price=Decimal("71.5"),
+            client_order_id="c1",
+        )
+    )
+    assert response.order()
+    while (await responsesv2.get_otc_event()).channel is not Channel.ORDERS:
+        pass
+    order = orders.get_by_client_order_id("c1")
+    assert order and order.order_state is OrderState.FILLED
+    totals = orders.totals_for("acc", "brtf25")
+    assert totals.sold == 2
+    assert totals.executions == 1
+    assert totals.fees["USD"] < 0
+
+
+async def test_client_orders_channel(fake_server, responsesv2: OnResponseV2) -> None:
+    orders = OrderManager()
+    cli = OnyxWebsocketClientV2.create(
+        on_response=responsesv2.on_response,
+        on_event=lambda cli, message: None,
+        on_event_view=lambda cli, view: None,
+        ws_url=fake_server.url,
+        api_token="test",
+        orders=orders,
+    )
+    async with connected(cli):
+        assert (await responsesv2.get_otc_response()).auth()
+        cli.subscribe_orders()
+        template = cli.order_template("acc", "brtf25", Side.BUY)
+        await cli.send_order(template, "70", "3", "c2")
+        await cli.drain()
+    assert orders.totals_for("acc").bought == 3
+    assert orders.totals_for("acc").executions == 1
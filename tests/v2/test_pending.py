@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from onyx_otc.fake_server import FakeServer
+from onyx_otc.requests import OrdersChannel, SubscribeRequest, TickersChannel
+from onyx_otc.responses import OtcResponseError
+from onyx_otc.types import Channel, Method, OtcErrorCode
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+
+def subscribe_request() -> SubscribeRequest:
+    return SubscribeRequest(data=OrdersChannel())
+
+
+async def test_send_request_not_running() -> None:
+    cli = OnyxWebsocketClientV2.create()
+    with pytest.raises(ConnectionError):
+        await cli.send_request(cli.request(subscribe_request()))
+
+
+async def test_send_request(fake_cli: OnyxWebsocketClientV2) -> None:
+    future = fake_cli.send_request(fake_cli.request(subscribe_request()))
+    response = await future
+    subscription = response.subscription()
+    assert subscription and subscription.channel is Channel.ORDERS
+    stats = fake_cli.request_stats[Method.SUBSCRIBE]
+    assert stats.count == 1
+    assert stats.max_ns > 0
+
+
+async def test_request_error(
+    fake_server: FakeServer, fake_cli: OnyxWebsocketClientV2
+) -> None:
+    fake_server.reject.add("bad")
+    with pytest.raises(OtcResponseError) as exc:
+        await fake_cli.call(SubscribeRequest(data=TickersChannel(products=["bad"])))
+    assert exc.value.code is OtcErrorCode.INVALID_REQUEST
+    assert fake_cli.request_stats[Method.SUBSCRIBE].errors == 1
+
+
+async def test_request_timeout(
+    fake_server: FakeServer, fake_cli: OnyxWebsocketClientV2
+) -> None:
+    fake_server.respond = False
+    with pytest.raises(TimeoutError):
+        await fake_cli.call(subscribe_request(), timeout=0.01)
+    assert fake_cli.request_stats[Method.SUBSCRIBE].timeouts == 1
+
+
+async def test_request_connection_lost(
+    fake_server: FakeServer, fake_cli: OnyxWebsocketClientV2
+) -> None:
+    fake_server.respond = False
+    future = fake_cli.send_request(fake_cli.request(subscribe_request()))
+    await fake_server.stop()
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(future, 1)
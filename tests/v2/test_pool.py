@@ -0,0 +1,65 @@
+from onyx_otc.pool import ShardedClient, stable_shard
+from onyx_otc.responses import OtcChannelMessage
+from onyx_otc.views import ChannelMessageView
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, ticker_proto, tickers_message
+
+
+async def test_sharded_client() -> None:
+    events: list[tuple[OnyxWebsocketClientV2, OtcChannelMessage]] = []
+
+    def on_event(cli: OnyxWebsocketClientV2, event: OtcChannelMessage) -> None:
+        events.append((cli, event))
+
+    pool = ShardedClient(shards=3, on_event=on_event)
+    products = [f"p{i}" for i in range(12)]
+    pool.subscribe_tickers(products)
+    pool.subscribe_obt(products[:2])
+    assert {pool.shard_of(p) for p in products} == {0, 1, 2}
+    for product in products:
+        assert pool.shard_of(product) == stable_shard(product, 3)
+    # events of all connections are merged
+    for cli in pool.clients:
+        await cli.handle_binary_message(
+            frame(tickers_message(ticker_proto("p0f25", "1")))
+        )
+    assert [cli for cli, _ in events] == pool.clients
+    assert pool.rates["p0"] == 3
+    # the busiest products are spread over the shards
+    pool.rates.update({"p1": 100, "p2": 90, "p3": 80})
+    pool.rebalance()
+    assert len({pool.shard_of(p) for p in ("p1", "p2", "p3")}) == 3
+    assert pool.shard_of("p1") == 0
+    assert not pool.rates
+    tickers, obt = pool.shard_products(0)
+    assert "p1" in tickers and "p1" in obt
+    pool.unsubscribe_tickers(products)
+    assert pool.shard_products(0)[0] == []
+    # subscriptions moved with the products
+    pool.subscribe_tickers(["p1"])
+    for i, cli in enumerate(pool.clients):
+        assert ("p1" in cli.subscriptions.tickers) is (i == pool.shard_of("p1"))
+
+
+def test_sharded_client_set_tickers() -> None:
+    pool = ShardedClient(shards=2)
+    pool.set_tickers(["a", "b", "c", "d"])
+    pool.set_tickers(["b", "c"])
+    tickers = set()
+    for cli in pool.clients:
+        tickers.update(cli.subscriptions.tickers)
+    assert tickers == {"b", "c"}
+
+
+async def test_sharded_client_rates_with_views() -> None:
+    views: list[ChannelMessageView] = []
+    pool = ShardedClient(
+        shards=2,
+        client_options=dict(on_event_view=lambda cli, view: views.append(view)),
+    )
+    pool.subscribe_tickers(["p0"])
+    cli = pool.clients[pool.shard_of("p0")]
+    await cli.handle_binary_message(frame(tickers_message(ticker_proto("p0f25", "1"))))
+    assert len(views) == 1
+    assert pool.rates["p0"] == 1
@@ -1,8 +1,21 @@
 from datetime import datetime, timedelta, timezone
 
+import pytest
 from pydantic import TypeAdapter
 
 from onyx_otc.responses import LiveWebsocket
+from onyx_otc.types import (
+    Channel,
+    Exchange,
+    Method,
+    OrderState,
+    OrderType,
+    OtcErrorCode,
+    ProtoEnum,
+    Side,
+    SubscriptionStatus,
+)
+from onyx_otc.v2 import types_pb2
 
 
 def test_conversions() -> None:
@@ -37,3 +50,26 @@ def test_serialize() -> None:
     assert value["started"] == now
     value = lv.model_dump(mode="json")
     assert datetime.fromisoformat(value["started"]) == now
+
+
+@pytest.mark.parametrize(
+    "enum_type, proto_type",
+    [
+        (Exchange, types_pb2.Exchange),
+        (Method, types_pb2.Method),
+        (Channel, types_pb2.Channel),
+        (OrderType, types_pb2.OrderType),
+        (OrderState, types_pb2.OrderState),
+        (Side, types_pb2.Side),
+        (SubscriptionStatus, types_pb2.SubscriptionStatus),
+        (OtcErrorCode, types_pb2.OtcErrorCode),
+    ],
+)
+def test_enums_match_protos(enum_type: type[ProtoEnum], proto_type: object) -> None:
+    values = proto_type.values()  # type: ignore[attr-defined]
+    assert len(enum_type) == len(values)
+    for value in values:
+        member = enum_type.from_proto(value)  # type: ignore[attr-defined]
+        assert member.to_proto() == value
+    unknown = max(values) + 1
+    assert enum_type.from_proto(unknown) is enum_type("unspecified")  # type: ignore[attr-defined]
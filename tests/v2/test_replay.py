@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from onyx_otc.capture import CaptureReader, CaptureWriter
+from onyx_otc.fake_server import channel_json
+from onyx_otc.replay import Replayer
+from onyx_otc.responses import OtcChannelMessage
+from onyx_otc.types import Channel
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, obt_message, obt_proto, ticker_proto, tickers_message
+
+
+def write_capture(path: Path) -> None:
+    with CaptureWriter(path) as writer:
+        for i in range(5):
+            writer.write(
+                frame(
+                    tickers_message(
+                        ticker_proto("ab25", "1"), ticker_proto("cd25", "2")
+                    )
+                ),
+                recv_ns=1_000_000 * (i + 1),
+            )
+        writer.write(
+            frame(obt_message(obt_proto("ab25", ("1", "1"), ("2", "1")))),
+            recv_ns=6_000_000,
+        )
+
+
+async def test_replay(tmp_path: Path) -> None:
+    path = tmp_path / "capture.onyx"
+    write_capture(path)
+    events: list[OtcChannelMessage] = []
+
+    def on_event(cli: OnyxWebsocketClientV2, event: OtcChannelMessage) -> None:
+        events.append(event)
+
+    cli = OnyxWebsocketClientV2.create(on_event=on_event)
+    with CaptureReader(path) as reader:
+        stats = await Replayer(cli).run(reader)
+    assert stats.replayed == 6
+    assert stats.frames_per_second > 0
+    assert len(events) == 6
+    # filtered by channel and symbol
+    events.clear()
+    replayer = Replayer(cli, channels={Channel.TICKERS}, symbols={"cd25"}, speed=100)
+    with CaptureReader(path) as reader:
+        stats = await replayer.run(reader)
+    assert stats.replayed == 5
+    assert stats.filtered == 1
+    assert {t.symbol for e in events for t in e.tickers().tickers} == {"cd25"}  # type: ignore
+
+
+@pytest.mark.parametrize("binary", [True, False])
+async def test_replay_filtered_copies_rows(tmp_path: Path, binary: bool) -> None:
+    path = tmp_path / "capture.onyx"
+    message = tickers_message(ticker_proto("ab25", "1"), ticker_proto("cd25", "2"))
+    with CaptureWriter(path) as writer:
+        writer.write(frame(message) if binary else json.dumps(channel_json(message)))
+    events: list[OtcChannelMessage] = []
+    cli = OnyxWebsocketClientV2.create(
+        on_event=lambda cli, event: events.append(event), trusted=True
+    )
+    for symbols in (set(), {"cd25"}):
+        with CaptureReader(path) as reader:
+            await Replayer(cli, symbols=symbols).run(reader)
+    unfiltered, filtered = (event.tickers() for event in events)
+    assert filtered and unfiltered
+    assert [t.symbol for t in filtered.tickers] == ["cd25"]
+    assert filtered.tickers[0] == unfiltered.tickers[1]
+    if not binary:
+        # trusted JSON timestamps are cached, filtered or not
+        assert filtered.tickers[0].timestamp is unfiltered.tickers[1].timestamp
+    # rows are filtered into new messages
+    replayer = Replayer(cli, symbols={"cd25"})
+    model = OtcChannelMessage.from_proto(message)
+    for original in (message, model):
+        assert replayer._filter(original) is not original
+    assert len(message.tickers.tickers) == 2
+    assert len(model.tickers().tickers) == 2  # type: ignore
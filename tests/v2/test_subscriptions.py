@@ -0,0 +1,96 @@
+from onyx_otc.fake_server import FakeServer
+from onyx_otc.requests import (
+    OrderBookChannel,
+    OrderBookTopChannel,
+    OrdersChannel,
+    RfqChannel,
+    SubscribeRequest,
+    TickersChannel,
+    UnsubscribeRequest,
+)
+from onyx_otc.subscriptions import SubscriptionRegistry
+from onyx_otc.types import OtcErrorCode
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import OnResponseV2, connected
+
+
+def test_registry_merges_channels() -> None:
+    registry = SubscriptionRegistry()
+    registry.add(TickersChannel(products=["b", "a"]))
+    registry.add(TickersChannel(products=["c"]))
+    registry.add(RfqChannel.from_string("brnf25@ice@2"))
+    registry.add(RfqChannel.from_string("brnf25@ice@2"))
+    registry.add(OrderBookChannel.from_string("brnf25@ice"))
+    assert len(registry) == 5
+    channels = registry.channels()
+    assert channels[0] == TickersChannel(products=["a", "b", "c"])
+    assert len(channels) == 3
+    registry.remove(TickersChannel(products=["a", "b"]))
+    registry.remove(OrderBookChannel.from_string("brnf25@ice"))
+    assert registry.tickers == {"c"}
+    assert not registry.books
+
+
+async def test_client_restores_subscriptions(
+    fake_server: FakeServer, responsesv2: OnResponseV2
+) -> None:
+    cli = OnyxWebsocketClientV2.create(
+        ws_url=fake_server.url,
+        api_token="test",
+        on_response=responsesv2.on_response,
+        on_event=responsesv2.on_event,
+    )
+    # registered but not sent until the client runs
+    cli.subscribe_tickers(["a", "b"])
+    cli.subscribe_tickers(["c"])
+    cli.subscribe_orders()
+    assert not cli.write_queue_depth
+    fake_server.reject.add("b")
+    async with connected(cli):
+        assert (await responsesv2.get_otc_response()).auth()
+        # orders and tickers restored with merged requests
+        responses = [await responsesv2.get_otc_response() for _ in range(2)]
+        (conn,) = fake_server.connections
+        assert [r.request for r in conn.received][1:] == [
+            SubscribeRequest(data=OrdersChannel()),
+            SubscribeRequest(data=TickersChannel(products=["a", "b", "c"])),
+        ]
+        error = responses[1].error()
+        assert error and error.code is OtcErrorCode.INVALID_REQUEST
+        # a rejected restore request keeps the registry unchanged
+        assert cli.subscriptions.tickers == {"a", "b", "c"}
+        assert cli.subscriptions.orders
+        # time to first data
+        await responsesv2.get_otc_event()
+        assert cli.time_to_first_data is not None
+
+
+async def test_set_tickers_coalesced(
+    fake_server: FakeServer,
+    fake_cli: OnyxWebsocketClientV2,
+    responsesv2: OnResponseV2,
+) -> None:
+    fake_cli.subscribe_tickers(["a", "b"])
+    await responsesv2.get_otc_response()
+    # only the last call within the window counts
+    fake_cli.set_tickers(["x"])
+    fake_cli.set_tickers(["b", "c", "d"])
+    fake_cli.set_obt(["a"])
+    assert not fake_cli.write_queue_depth
+    # unsubscribe a, subscribe c and d, subscribe obt a
+    for _ in range(3):
+        await responsesv2.get_otc_response()
+    (conn,) = fake_server.connections
+    assert [r.request for r in conn.received][2:] == [
+        UnsubscribeRequest(data=TickersChannel(products=["a"])),
+        SubscribeRequest(data=TickersChannel(products=["c", "d"])),
+        SubscribeRequest(data=OrderBookTopChannel(products=["a"])),
+    ]
+    assert fake_cli.subscriptions.tickers == {"b", "c", "d"}
+    assert fake_cli.subscriptions.obt == {"a"}
+    assert conn.subscriptions.tickers == {"b", "c", "d"}
+    # nothing to send when nothing changes
+    fake_cli.set_tickers(["d", "c", "b"])
+    fake_cli.flush_subscriptions()
+    assert not fake_cli.write_queue_depth
@@ -0,0 +1,54 @@
+from onyx_otc import bench
+from onyx_otc.common import Butterfly, Spread, TradableSymbol
+from onyx_otc.responses import OtcQuote
+from onyx_otc.symbols import SymbolRegistry, parse_symbol
+from onyx_otc.v2 import common_pb2
+
+
+def test_ids() -> None:
+    registry = SymbolRegistry()
+    assert registry.get_id("brtf25") == 0
+    assert registry.get_id("brtg25") == 1
+    assert registry.get_id("brtf25") == 0
+    assert registry.symbol(1) == "brtg25"
+    assert len(registry) == 2
+    assert "brtg25" in registry
+    symbol = "".join(["brt", "f25"])
+    assert registry.intern(symbol) is registry.symbol(0)
+
+
+def test_eviction() -> None:
+    registry = SymbolRegistry(maxsize=2)
+    assert registry.get_id("a") == 0
+    assert registry.get_id("b") == 1
+    registry.get_id("a")
+    # b is the least recently used and its id is reused
+    assert registry.get_id("c") == 1
+    assert "b" not in registry
+    assert registry.symbol(1) == "c"
+    assert registry.evictions == 1
+    assert len(registry) == 2
+    assert registry.tradable("b") == TradableSymbol.from_string("b")
+    assert "a" not in registry
+
+
+def test_tradable() -> None:
+    registry = SymbolRegistry()
+    spread = registry.tradable("brtf25-brtg25")
+    assert spread.symbol == Spread(front="brtf25", back="brtg25")
+    assert registry.tradable("brtf25-brtg25") is spread
+    fly = registry.from_proto(
+        TradableSymbol.from_string("brtf25-brtg25-brth25").to_proto()
+    )
+    assert fly.symbol == Butterfly(front="brtf25", middle="brtg25", back="brth25")
+    assert registry.tradable("brtf25-brtg25-brth25") is fly
+    assert registry.from_proto(common_pb2.TradableSymbol(flat="brtf25")) is (
+        registry.tradable("brtf25")
+    )
+
+
+def test_decoded_symbols_are_shared() -> None:
+    proto = bench.quote_message().otc_quote
+    first = OtcQuote.from_proto(proto)
+    second = OtcQuote.from_proto(proto, trusted=True)
+    assert first.symbol is second.symbol is parse_symbol("brtf25-brtg25")
@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+from onyx_otc.responses import OtcChannelMessage, otc_response_from_proto_bytes
+from onyx_otc.types import Channel
+from onyx_otc.views import ChannelMessageView
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+
+from .utils import frame, obt_message, obt_proto, ticker_proto, tickers_message
+
+
+def test_ticker_view() -> None:
+    proto = tickers_message(
+        ticker_proto("brtm25", "70.5"), ticker_proto("brtn25", "70")
+    )
+    view = ChannelMessageView(proto)
+    assert view.channel == Channel.TICKERS
+    assert view.message_type == "tickers"
+    assert view.order_book_tops() is None
+    tickers = view.tickers()
+    assert tickers is not None
+    assert [t.symbol for t in tickers] == ["brtm25", "brtn25"]
+    assert tickers[0].mid == Decimal("70.5")
+    assert tickers[0].product_symbol == "brt"
+    assert view.to_model() == OtcChannelMessage.from_proto(proto)
+
+
+def test_obt_view() -> None:
+    proto = obt_message(obt_proto("brtm25", ("70.1", "5"), ("70.2", "3")))
+    view = ChannelMessageView(proto)
+    obts = view.order_book_tops()
+    assert obts is not None
+    assert obts[0].buy.price == Decimal("70.1")
+    assert obts[0].sell.amount == Decimal(3)
+    model = OtcChannelMessage.from_proto(proto).order_book_tops()
+    assert model is not None
+    assert obts[0].to_model() == model.order_book_tops[0]
+
+
+def test_trusted_decode() -> None:
+    data = frame(obt_message(obt_proto("brtm25", ("70.1", "5"), ("70.2", "3"))))
+    assert otc_response_from_proto_bytes(data, trusted=True) == (
+        otc_response_from_proto_bytes(data)
+    )
+
+
+async def test_client_view_handler() -> None:
+    views: list[ChannelMessageView] = []
+    cli = OnyxWebsocketClientV2.create(
+        on_event_view=lambda cli, view: views.append(view)
+    )
+    await cli.handle_binary_message(
+        frame(tickers_message(ticker_proto("ebobm25", "1")))
+    )
+    assert len(views) == 1
+    assert views[0].channel == Channel.TICKERS
@@ -0,0 +1,49 @@
+import asyncio
+
+from onyx_otc.fake_server import FakeServer
+from onyx_otc.requests import OrdersChannel, SubscribeRequest, TickersChannel
+from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
+from onyx_otc.writer import FrameWriter
+
+from .utils import OnResponseV2, connected
+
+
+async def test_frame_writer_batches() -> None:
+    writer = FrameWriter()
+    wait = asyncio.create_task(writer.wait())
+    await asyncio.sleep(0)
+    assert not wait.done()
+    for i in range(3):
+        writer.put(f"{i}")
+    await wait
+    assert writer.drain() == ["0", "1", "2"]
+    assert writer.drain() == []
+    stats = writer.stats
+    assert stats.sent == 3
+    assert stats.batches == 1
+    assert stats.max_batch == 3
+    assert stats.max_depth == 3
+    assert stats.max_wait_ns > 0
+
+
+async def test_client_serialize_in_writer(
+    fake_server: FakeServer, responsesv2: OnResponseV2
+) -> None:
+    cli = OnyxWebsocketClientV2.create(
+        ws_url=fake_server.url,
+        api_token="test",
+        serialize_in_writer=True,
+        on_response=responsesv2.on_response,
+    )
+    async with connected(cli):
+        assert (await responsesv2.get_otc_response()).auth()
+        # a request failing to serialize does not stop the rest of the batch
+        bad = SubscribeRequest.model_construct(
+            data=TickersChannel.model_construct(products=[1])
+        )
+        cli.send(cli.request(bad))
+        response = await cli.call(SubscribeRequest(data=OrdersChannel()))
+        assert response.subscription()
+        (conn,) = fake_server.connections
+        assert [r.id for r in conn.received][1:] == [response.id]
+    assert cli.writer_stats.sent == 3
@@ -1,7 +1,11 @@
 import asyncio
+import contextlib
 from dataclasses import dataclass, field
+from typing import AsyncIterator
 
 from onyx_otc.responses import OtcChannelMessage, OtcResponse
+from onyx_otc.timestamp import Timestamp
+from onyx_otc.v2 import common_pb2, responses_pb2, types_pb2
 from onyx_otc.websocket_v2 import OnyxWebsocketClientV2
 
 
@@ -23,3 +27,104 @@ class OnResponseV2:
     async def get_otc_event(self, timeout: float = 2.0) -> OtcChannelMessage:
         async with asyncio.timeout(timeout):
             return await self.events.get()
+
+
+@contextlib.asynccontextmanager
+async def connected(cli: OnyxWebsocketClientV2) -> AsyncIterator[None]:
+    """Run the client connection while in the context"""
+    read_task = asyncio.create_task(cli.connect())
+    try:
+        yield
+    finally:
+        read_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await read_task
+
+
+def ticker_proto(
+    symbol: str, mid: str, product_symbol: str = "", timestamp: int = 0
+) -> responses_pb2.Ticker:
+    return responses_pb2.Ticker(
+        symbol=symbol,
+        product_symbol=product_symbol or symbol[:-3],
+        timestamp=Timestamp(timestamp or Timestamp.utcnow()).to_proto(),
+        mid=common_pb2.Decimal(value=mid),
+    )
+
+
+def obt_proto(
+    symbol: str,
+    buy: tuple[str, str],
+    sell: tuple[str, str],
+    product_symbol: str = "",
+    timestamp: int = 0,
+) -> responses_pb2.OrderBookTop:
+    return responses_pb2.OrderBookTop(
+        symbol=symbol,
+        product_symbol=product_symbol or symbol[:-3],
+        timestamp=Timestamp(timestamp or Timestamp.utcnow()).to_proto(),
+        buy=responses_pb2.PriceAmount(
+            price=common_pb2.Decimal(value=buy[0]),
+            amount=common_pb2.Decimal(value=buy[1]),
+        ),
+        sell=responses_pb2.PriceAmount(
+            price=common_pb2.Decimal(value=sell[0]),
+            amount=common_pb2.Decimal(value=sell[1]),
+        ),
+    )
+
+
+def tickers_message(*tickers: responses_pb2.Ticker) -> responses_pb2.ChannelMessage:
+    return responses_pb2.ChannelMessage(
+        channel=types_pb2.CHANNEL_TICKERS,
+        timestamp=Timestamp.utcnow().to_proto(),
+        tickers=responses_pb2.Tickers(tickers=tickers),
+    )
+
+
+def obt_message(*obts: responses_pb2.OrderBookTop) -> responses_pb2.ChannelMessage:
+    return responses_pb2.ChannelMessage(
+        channel=types_pb2.CHANNEL_ORDER_BOOK_TOP,
+        timestamp=Timestamp.utcnow().to_proto(),
+        order_book_tops=responses_pb2.OrderBookTops(order_book_tops=obts),
+    )
+
+
+def frame(message: responses_pb2.ChannelMessage) -> bytes:
+    return responses_pb2.OtcResponseMessage(channel_message=message).SerializeToString()
+
+
+def order_book_proto(
+    symbol: str,
+    bids: list[tuple[str, str]],
+    asks: list[tuple[str, str]],
+    exchange: types_pb2.Exchange.ValueType = types_pb2.EXCHANGE_ICE,
+) -> responses_pb2.OrderBook:
+    return responses_pb2.OrderBook(
+        symbol=symbol,
+        product_symbol=symbol[:-3],
+        exchange=exchange,
+        timestamp=Timestamp.utcnow().to_proto(),
+        bids=[
+            responses_pb2.OrderBookLevel(
+                price=common_pb2.Decimal(value=p), amount=common_pb2.Decimal(value=a)
+            )
+            for p, a in bids
+        ],
+        asks=[
+            responses_pb2.OrderBookLevel(
+                price=common_pb2.Decimal(value=p), amount=common_pb2.Decimal(value=a)
+            )
+            for p, a in asks
+        ],
+    )
+
+
+def order_books_message(
+    *books: responses_pb2.OrderBook,
+) -> responses_pb2.ChannelMessage:
+    return responses_pb2.ChannelMessage(
+        channel=types_pb2.CHANNEL_ORDER_BOOK,
+        timestamp=Timestamp.utcnow().to_proto(),
+        order_books=responses_pb2.OrderBooks(order_books=books),
+    )